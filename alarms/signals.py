@@ -46,7 +46,7 @@ def send_daily_notifications():
         is_participated=True,
         campaign__activity_start_date__range=(
             current_datetime, campaign_start_date)
-    )
+    ).select_related('campaign', 'user')
     for participant in participants:
         days_remain = (
             participant.campaign.activity_start_date - current_datetime).days
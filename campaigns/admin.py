@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.utils.safestring import mark_safe
 from campaigns.models import (
+    ArchivedCampaign,
     Campaign,
     CampaignComment,
     CampaignReview,
@@ -9,6 +10,20 @@ from campaigns.models import (
 )
 
 
+class ParticipantInline(admin.TabularInline):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 admin 페이지에서 참가자를 관리하는 인라인 클래스입니다.
+    최초 작성일 : 2023.07.08
+    업데이트 일자 :
+    """
+
+    model = Participant
+    extra = 0
+    raw_id_fields = ("user",)
+    readonly_fields = ("created_at",)
+
+
 @admin.register(Campaign)
 class CampaignDisplay(admin.ModelAdmin):
     """
@@ -28,6 +43,8 @@ class CampaignDisplay(admin.ModelAdmin):
         "is_funding",
         "campaign_start_date",
         "campaign_end_date",
+        "participant_count",
+        "like_count",
         "tag_list",
     ]
     fields = [
@@ -36,7 +53,6 @@ class CampaignDisplay(admin.ModelAdmin):
         "user",
         "status",
         "category",
-        "participant",
         "like",
         "members",
         "image",
@@ -50,6 +66,10 @@ class CampaignDisplay(admin.ModelAdmin):
     readonly_fields = (
         "created_at",
         "updated_at",
+        "like_count",
+        "participant_count",
+        "comment_count",
+        "review_count",
     )
     list_filter = [
         "user",
@@ -60,6 +80,7 @@ class CampaignDisplay(admin.ModelAdmin):
         "title",
         "content",
     ]
+    inlines = [ParticipantInline]
 
     def image_tag(self, campaign):
         if campaign.image:
@@ -191,4 +212,55 @@ class CampaignCommentDisplay(admin.ModelAdmin):
     ]
 
 
-admin.site.register(Participant)
+@admin.register(Participant)
+class ParticipantDisplay(admin.ModelAdmin):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 참가자 admin 페이지 등록 클래스입니다.
+    최초 작성일 : 2023.07.08
+    업데이트 일자 :
+    """
+
+    list_display = [
+        "campaign",
+        "user",
+        "is_participated",
+        "created_at",
+    ]
+    readonly_fields = ("created_at",)
+    raw_id_fields = ("campaign", "user")
+    list_filter = [
+        "is_participated",
+    ]
+
+
+@admin.register(ArchivedCampaign)
+class ArchivedCampaignDisplay(admin.ModelAdmin):
+    """
+    작성자 : 최준영
+    내용 : 보관된 캠페인 admin 페이지 등록 클래스입니다. 보관 테이블은 조회만 합니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    list_display = [
+        "id",
+        "title",
+        "user",
+        "status",
+        "category",
+        "campaign_end_date",
+        "archived_at",
+    ]
+    list_filter = [
+        "status",
+        "category",
+    ]
+    search_fields = [
+        "title",
+    ]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
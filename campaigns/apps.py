@@ -7,6 +7,8 @@ class CampaignsConfig(AppConfig):
     name = "campaigns"
 
     def ready(self):
+        import campaigns.signals
+
         if settings.SCHEDULER_DEFAULT:
             from . import operator
 
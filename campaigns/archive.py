@@ -0,0 +1,188 @@
+"""
+작성자 : 최준영
+내용 : 오래된 종료/실패 캠페인 보관(archive) 모듈입니다.
+마감일이 CAMPAIGN_ARCHIVE_AFTER_DAYS일 넘게 지난 종료(2), 실패(3) 캠페인을 펀딩, 후기, 댓글, 참가, 좋아요와 함께
+보관 테이블로 옮기고 원래 테이블에서 지워서, 목록 조회와 CampaignStatusChecker가 훑는 테이블을 작게 유지합니다.
+CAMPAIGN_ARCHIVE_CHUNK개씩 복사와 삭제를 한 트랜잭션으로 처리하므로 중간에 멈춰도 반쯤 옮겨진 캠페인은 남지 않습니다.
+결제 내역은 캠페인을 참조하므로(영수증) 결제가 있는 캠페인은 옮기지 않습니다.
+최초 작성일 : 2023.07.09
+"""
+import logging
+import time
+from collections import defaultdict
+from datetime import timedelta
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from taggit.models import TaggedItem
+from alarms.models import Notification
+from campaigns.cache import (
+    bump_detail_generations,
+    bump_list_generation,
+    bump_mypage_generations,
+)
+from campaigns.models import (
+    ArchivedCampaign,
+    ArchivedCampaignComment,
+    ArchivedCampaignLike,
+    ArchivedCampaignReview,
+    ArchivedFunding,
+    ArchivedParticipant,
+    Campaign,
+    CampaignComment,
+    CampaignNeighbor,
+    CampaignReview,
+    CampaignSearchIndex,
+    Funding,
+    Participant,
+)
+from campaigns.tags import refresh_tag_stats
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_STATUSES = (2, 3)
+BULK_SIZE = 1000
+
+
+def archive_candidates(now=None, days=None):
+    """
+    보관 대상 캠페인 queryset을 반환합니다. (status, campaign_end_date) 인덱스로 찾습니다.
+    """
+    now = now or timezone.now()
+    days = settings.CAMPAIGN_ARCHIVE_AFTER_DAYS if days is None else days
+    return Campaign.objects.filter(
+        status__in=ARCHIVE_STATUSES,
+        campaign_end_date__lt=now - timedelta(days=days),
+        payment__isnull=True,
+    )
+
+
+def shared_fields(source, target):
+    """
+    두 모델에 모두 있는 컬럼(attname) 목록을 반환합니다. 보관에 필요 없는 컬럼(인기 점수 등)은 보관 모델에 두지 않습니다.
+    """
+    names = {field.attname for field in target._meta.concrete_fields}
+    return [field.attname for field in source._meta.concrete_fields if field.attname in names]
+
+
+def copy_rows(queryset, model, **extra):
+    """
+    queryset의 행을 같은 필드 이름을 가진 보관 모델로 id 그대로 복사하고, 만든 객체 목록을 반환합니다.
+    """
+    fields = shared_fields(queryset.model, model)
+    rows = [model(**row, **extra) for row in queryset.values(*fields)]
+    return model.objects.bulk_create(rows, batch_size=BULK_SIZE)
+
+
+def raw_delete(queryset):
+    """
+    시그널 없이 DELETE 한 번으로 지웁니다.
+    delete()는 post_delete 핸들러(이미지 파생본 삭제, 검색 색인, 태그 통계 등)를 행마다 실행하는데,
+    보관은 이미지 파일을 그대로 쓰고 색인/통계는 묶음 단위로 정리하므로 거치지 않습니다.
+    """
+    return queryset._raw_delete(queryset.db)
+
+
+def archive_chunk(campaign_ids, now=None, days=None):
+    """
+    campaign_ids 중 아직 보관 대상인 캠페인을 한 트랜잭션으로 옮기고, 옮긴 캠페인 수를 반환합니다.
+    """
+    now = now or timezone.now()
+    content_type = ContentType.objects.get_for_model(Campaign)
+    with transaction.atomic():
+        # 목록을 읽은 뒤 상태가 바뀌었거나 결제가 생긴 캠페인은 빼고 다시 확인합니다.
+        ids = list(
+            archive_candidates(now, days).filter(id__in=campaign_ids).values_list("id", flat=True)
+        )
+        if not ids:
+            return 0
+
+        tag_names = defaultdict(list)
+        tag_ids = set()
+        tagged_items = TaggedItem.objects.filter(content_type=content_type, object_id__in=ids)
+        for campaign_id, tag_id, name in tagged_items.values_list("object_id", "tag_id", "tag__name"):
+            tag_names[campaign_id].append(name)
+            tag_ids.add(tag_id)
+
+        campaigns = Campaign.objects.filter(id__in=ids)
+        fields = shared_fields(Campaign, ArchivedCampaign)
+        archived = ArchivedCampaign.objects.bulk_create(
+            [
+                ArchivedCampaign(**row, tag_names=tag_names[row["id"]], archived_at=now)
+                for row in campaigns.values(*fields)
+            ],
+            batch_size=BULK_SIZE,
+        )
+        copy_rows(Funding.objects.filter(campaign_id__in=ids), ArchivedFunding)
+        reviews = CampaignReview.objects.filter(campaign_id__in=ids)
+        comments = CampaignComment.objects.filter(campaign_id__in=ids)
+        participants = Participant.objects.filter(campaign_id__in=ids)
+        likes = Campaign.like.through.objects.filter(campaign_id__in=ids)
+        user_ids = {campaign.user_id for campaign in archived}
+        for queryset, model in (
+            (reviews, ArchivedCampaignReview),
+            (comments, ArchivedCampaignComment),
+            (participants, ArchivedParticipant),
+            (likes, ArchivedCampaignLike),
+        ):
+            user_ids.update(row.user_id for row in copy_rows(queryset, model))
+
+        # 참가 알림은 참가 행이 지워져도 알림 목록에 남도록 연결만 끊습니다.
+        Notification.objects.filter(participant__campaign_id__in=ids).update(participant=None)
+        raw_delete(tagged_items)
+        raw_delete(CampaignSearchIndex.objects.filter(campaign_id__in=ids))
+        raw_delete(CampaignNeighbor.objects.filter(Q(campaign_id__in=ids) | Q(neighbor_id__in=ids)))
+        for queryset in (likes, participants, reviews, comments, Funding.objects.filter(campaign_id__in=ids)):
+            raw_delete(queryset)
+        raw_delete(campaigns)
+
+        refresh_tag_stats(tag_ids)
+        bump_list_generation()
+        bump_detail_generations(ids)
+        bump_mypage_generations(user_ids)
+    return len(ids)
+
+
+def archive_campaigns(now=None, days=None, chunk_size=None, limit=None):
+    """
+    보관 대상 캠페인을 id 순으로 chunk_size개씩 옮기고 결과 보고서를 반환합니다.
+    limit을 주면 그 수만큼만 옮깁니다.
+    """
+    started = time.perf_counter()
+    now = now or timezone.now()
+    chunk_size = chunk_size or settings.CAMPAIGN_ARCHIVE_CHUNK
+    archived = 0
+    last_id = 0
+    while limit is None or archived < limit:
+        size = chunk_size if limit is None else min(chunk_size, limit - archived)
+        chunk = list(
+            archive_candidates(now, days)
+            .filter(id__gt=last_id)
+            .order_by("id")
+            .values_list("id", flat=True)[:size]
+        )
+        if not chunk:
+            break
+        archived += archive_chunk(chunk, now, days)
+        last_id = chunk[-1]
+
+    report = {
+        "archived": archived,
+        "elapsed": round(time.perf_counter() - started, 3),
+    }
+    logger.info("campaign archive: %s", report)
+    return report
+
+
+def get_campaign_or_archived(campaign_id, *related):
+    """
+    캠페인을 찾고, 없으면 보관된 캠페인을 반환합니다. 둘 다 없으면 None입니다.
+    related는 두 모델에 공통인 select_related 경로입니다.
+    """
+    for model in (Campaign, ArchivedCampaign):
+        campaign = model.objects.select_related(*related).filter(id=campaign_id).first()
+        if campaign is not None:
+            return campaign
+    return None
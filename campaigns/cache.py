@@ -0,0 +1,154 @@
+"""
+작성자 : 최준영
+내용 : 캠페인 목록/상세 응답 캐시 모듈입니다.
+캐시 키에 세대(generation) 번호를 넣어, 캠페인/펀딩/좋아요/참가 변경 시
+세대 번호만 올리면 이전 키는 더 이상 조회되지 않고 TTL로 자연스럽게 사라집니다.
+만료된 인기 키는 락을 잡은 워커 한 곳만 다시 계산하고,
+나머지 워커는 이전 값(stale)을 돌려주거나 잠시 기다립니다.
+최초 작성일 : 2023.07.07
+"""
+import hashlib
+import json
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from campaigns.search import normalize
+
+LIST_GENERATION_KEY = "campaign_list:generation"
+DETAIL_GENERATION_KEY = "campaign_detail:{campaign_id}:generation"
+MYPAGE_GENERATION_KEY = "mypage:{user_id}:generation"
+LIST_PARAMS = ("end", "order", "keyword", "category", "cursor", "page")
+FACET_PARAMS = ("end", "keyword")
+
+# 계산 중인 워커가 죽어도 락이 영원히 남지 않도록 짧게 둡니다.
+LOCK_TIMEOUT = 10
+LOCK_WAIT_INTERVAL = 0.05
+LOCK_WAIT_COUNT = 20
+
+
+def get_generation(key):
+    """
+    현재 세대 번호를 반환합니다.
+    캐시에서 사라진 경우 이전 세대와 겹치지 않도록 현재 시각(ms)으로 다시 시작합니다.
+    """
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, int(time.time() * 1000), None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), None)
+
+
+def bump_list_generation():
+    """
+    캠페인 목록 캐시를 무효화합니다.
+    트랜잭션 안에서 호출되면 커밋 후에 세대를 올려, 커밋 전 데이터가 다시 캐시되지 않게 합니다.
+    """
+    transaction.on_commit(lambda: bump_generation(LIST_GENERATION_KEY))
+
+
+def bump_detail_generation(campaign_id):
+    """
+    캠페인 상세 캐시와 ETag를 무효화합니다. 목록과 마찬가지로 커밋 후에 세대를 올립니다.
+    """
+    key = DETAIL_GENERATION_KEY.format(campaign_id=campaign_id)
+    transaction.on_commit(lambda: bump_generation(key))
+
+
+def bump_detail_generations(campaign_ids):
+    """
+    여러 캠페인의 상세 캐시를 한 번에 무효화합니다.
+    세대 키를 지우면 다음 조회 때 현재 시각으로 새 세대가 시작됩니다.
+    """
+    keys = [DETAIL_GENERATION_KEY.format(campaign_id=campaign_id) for campaign_id in campaign_ids]
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def bump_mypage_generations(user_ids):
+    """
+    유저별 마이페이지 대시보드 캐시를 무효화합니다. 상세 캐시와 같은 방식으로 커밋 후에 세대 키를 지웁니다.
+    """
+    keys = [MYPAGE_GENERATION_KEY.format(user_id=user_id) for user_id in user_ids]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def campaign_detail_cache_key(campaign_id):
+    generation = get_generation(DETAIL_GENERATION_KEY.format(campaign_id=campaign_id))
+    return f"campaign_detail:{campaign_id}:{generation}", generation
+
+
+def params_digest(request, names):
+    """
+    Query String에서 names 파라미터만 정규화해서 해시합니다.
+    keyword는 검색과 같은 방식으로 정규화하고, 나머지 파라미터는 무시합니다.
+    """
+    params = {name: (request.query_params.get(name) or "").strip() for name in names}
+    params["keyword"] = normalize(params["keyword"])
+    params["host"] = request.get_host()
+    return hashlib.md5(
+        json.dumps(params, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+def campaign_list_cache_key(request):
+    """
+    캠페인 목록 Query String을 정규화해서 캐시 키를 만듭니다.
+    """
+    digest = params_digest(request, LIST_PARAMS)
+    return f"campaign_list:{get_generation(LIST_GENERATION_KEY)}:{digest}"
+
+
+def campaign_facet_cache_key(request):
+    """
+    패싯 개수는 목록에 보이는 캠페인에서 나오므로 목록과 같은 세대 키를 씁니다.
+    """
+    digest = params_digest(request, FACET_PARAMS)
+    return f"campaign_facets:{get_generation(LIST_GENERATION_KEY)}:{digest}"
+
+
+def mypage_cache_key(request):
+    generation = get_generation(MYPAGE_GENERATION_KEY.format(user_id=request.user.id))
+    return f"mypage:{request.user.id}:{generation}:{request.get_host()}"
+
+
+def get_or_build(key, builder, timeout=None):
+    """
+    key에 캐시된 값을 반환하고, 없거나 만료됐으면 builder()로 다시 만들어 저장합니다.
+    값은 (만료 시각, 데이터)로 저장하고 실제 캐시 TTL은 timeout의 두 배로 두어,
+    만료 후에도 다른 워커가 다시 계산하는 동안 이전 값을 돌려줄 수 있게 합니다.
+    """
+    if timeout is None:
+        timeout = settings.CAMPAIGN_LIST_CACHE_TIMEOUT
+    lock_key = f"{key}:lock"
+    locked = False
+
+    for _ in range(LOCK_WAIT_COUNT):
+        cached = cache.get(key)
+        if cached is not None:
+            expires_at, data = cached
+            if expires_at > time.time():
+                return data
+            locked = cache.add(lock_key, 1, LOCK_TIMEOUT)
+            if not locked:
+                return data
+            break
+        locked = cache.add(lock_key, 1, LOCK_TIMEOUT)
+        if locked:
+            break
+        time.sleep(LOCK_WAIT_INTERVAL)
+
+    try:
+        data = builder()
+        cache.set(key, (time.time() + timeout, data), timeout * 2)
+    finally:
+        if locked:
+            cache.delete(lock_key)
+    return data
@@ -0,0 +1,61 @@
+import asyncio
+import json
+import time
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncWebsocketConsumer
+from django.conf import settings
+from campaigns.progress import get_funding_progress, group_name
+
+
+class FundingProgressConsumer(AsyncWebsocketConsumer):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 펀딩 진행률 웹소켓 컨슈머입니다.
+    연결하면 현재 진행률을 보내고, 이후 결제로 진행률이 바뀔 때마다 그룹 메세지를 받아 전달합니다.
+    결제가 몰려도 클라이언트에는 초당 FUNDING_PROGRESS_MAX_RATE번까지만 보내고,
+    그 사이에 받은 메세지는 마지막 값 하나로 합쳐 간격이 지나면 보냅니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    async def connect(self):
+        self.campaign_id = int(self.scope["url_route"]["kwargs"]["campaign_id"])
+        self.group_name = group_name(self.campaign_id)
+        self.interval = 1 / settings.FUNDING_PROGRESS_MAX_RATE
+        self.sent_at = 0
+        self.latest = None
+        self.flush_task = None
+
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+
+        progress = await database_sync_to_async(get_funding_progress)(self.campaign_id)
+        if progress is not None:
+            await self.send_progress(progress)
+
+    async def disconnect(self, close_code):
+        if self.flush_task:
+            self.flush_task.cancel()
+        await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def receive(self, text_data=None, bytes_data=None):
+        pass
+
+    async def funding_progress(self, event):
+        self.latest = event["progress"]
+        if self.flush_task:
+            return
+        wait = self.sent_at + self.interval - time.monotonic()
+        if wait <= 0:
+            await self.send_progress(self.latest)
+        else:
+            self.flush_task = asyncio.ensure_future(self.flush_later(wait))
+
+    async def flush_later(self, wait):
+        await asyncio.sleep(wait)
+        self.flush_task = None
+        await self.send_progress(self.latest)
+
+    async def send_progress(self, progress):
+        self.sent_at = time.monotonic()
+        self.latest = None
+        await self.send(text_data=json.dumps({"type": "funding_progress", **progress}))
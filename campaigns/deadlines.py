@@ -0,0 +1,192 @@
+"""
+작성자 : 최준영
+내용 : 캠페인 시작/마감 시각에 맞춰 상태를 바꾸는 마감 스케줄러입니다.
+매일 정해진 시각에 전체를 검사하는 대신 campaign_start_date, campaign_end_date를
+힙(timer queue)에 넣어 두고, 가장 가까운 마감 시각까지만 기다렸다가 마감된 캠페인을 한 번에 처리합니다.
+힙은 메모리에만 있으므로 시작할 때와 resync_interval마다 DB에서 다시 만듭니다.
+최초 작성일 : 2023.07.07
+"""
+import heapq
+import logging
+import threading
+from collections import defaultdict
+from datetime import timedelta
+from django.db import close_old_connections
+from django.db.models import F, Q
+from django.utils import timezone
+from campaigns.models import Campaign
+from campaigns.cache import bump_list_generation
+
+logger = logging.getLogger(__name__)
+
+START = "start"
+END = "end"
+
+
+class DeadlineScheduler:
+    """
+    clock은 현재 시각(aware datetime)을 반환하는 함수로, 테스트에서는 가짜 시계를 넣습니다.
+    같은 캠페인의 같은 종류 마감이 다시 등록되면 이전 힙 항목은 entries와 비교해 버립니다(lazy deletion).
+    """
+
+    batch_size = 1000
+    max_wait = 60
+    resync_interval = timedelta(minutes=5)
+
+    def __init__(self, clock=timezone.now):
+        self.clock = clock
+        self.heap = []
+        self.entries = {}
+        self.condition = threading.Condition()
+        self.thread = None
+        self.stopped = False
+        self.synced_at = None
+
+    @property
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def schedule(self, campaign_id, kind, deadline):
+        timestamp = deadline.timestamp()
+        with self.condition:
+            self.entries[(kind, campaign_id)] = timestamp
+            heapq.heappush(self.heap, (timestamp, kind, campaign_id))
+            if self.heap[0][0] == timestamp:
+                self.condition.notify()
+
+    def cancel(self, campaign_id):
+        with self.condition:
+            self.entries.pop((START, campaign_id), None)
+            self.entries.pop((END, campaign_id), None)
+
+    def reschedule(self, campaign):
+        """
+        캠페인의 현재 날짜로 마감을 다시 등록합니다. 이미 지난 시각이나 종료된 캠페인은 등록하지 않습니다.
+        """
+        self.cancel(campaign.id)
+        if int(campaign.status) > 1:
+            return
+        now = self.clock()
+        if campaign.campaign_start_date and campaign.campaign_start_date > now:
+            self.schedule(campaign.id, START, campaign.campaign_start_date)
+        if campaign.campaign_end_date and campaign.campaign_end_date > now:
+            self.schedule(campaign.id, END, campaign.campaign_end_date)
+
+    def load_from_db(self):
+        """
+        아직 지나지 않은 시작/마감 시각을 가진 캠페인으로 힙을 다시 만듭니다.
+        """
+        now = self.clock()
+        rows = (
+            Campaign.objects.filter(status__lte=1)
+            .filter(Q(campaign_start_date__gt=now) | Q(campaign_end_date__gt=now))
+            .values_list("id", "campaign_start_date", "campaign_end_date")
+            .iterator(chunk_size=self.batch_size)
+        )
+        entries = {}
+        for campaign_id, start_date, end_date in rows:
+            if start_date > now:
+                entries[(START, campaign_id)] = start_date.timestamp()
+            if end_date > now:
+                entries[(END, campaign_id)] = end_date.timestamp()
+
+        heap = [(timestamp, kind, campaign_id) for (kind, campaign_id), timestamp in entries.items()]
+        heapq.heapify(heap)
+        with self.condition:
+            self.entries = entries
+            self.heap = heap
+            self.synced_at = now
+            self.condition.notify()
+        return len(entries)
+
+    def pop_due(self):
+        """
+        지금까지 마감된 항목을 꺼내 {종류: [캠페인 id]}로 반환합니다.
+        """
+        now = self.clock().timestamp()
+        due = defaultdict(list)
+        with self.condition:
+            while self.heap and self.heap[0][0] <= now:
+                timestamp, kind, campaign_id = heapq.heappop(self.heap)
+                if self.entries.get((kind, campaign_id)) != timestamp:
+                    continue
+                del self.entries[(kind, campaign_id)]
+                due[kind].append(campaign_id)
+        return due
+
+    def run_due(self):
+        """
+        마감된 캠페인을 처리하고 처리 리포트 목록을 반환합니다.
+        시작 시각이 된 캠페인은 목록(end=N) 노출이 바뀌므로 목록 캐시만 무효화하고,
+        마감 시각이 된 캠페인은 종료(2)로, 그 중 펀딩 목표 미달 캠페인은 실패(3)로 바꿉니다.
+        """
+        from campaigns.views import CampaignStatusChecker
+
+        due = self.pop_due()
+        reports = []
+        if due[START]:
+            bump_list_generation()
+
+        checker = CampaignStatusChecker()
+        now = self.clock()
+        ended_ids = due[END]
+        for start in range(0, len(ended_ids), self.batch_size):
+            chunk = ended_ids[start:start + self.batch_size]
+            reports.append(
+                checker.transition(
+                    "deadline_end",
+                    Campaign.objects.filter(id__in=chunk, campaign_end_date__lte=now),
+                    from_status=1,
+                    to_status=2,
+                )
+            )
+            reports.append(
+                checker.transition(
+                    "deadline_funding",
+                    Campaign.objects.filter(
+                        id__in=chunk, fundings__amount__lt=F("fundings__goal")
+                    ),
+                    from_status=2,
+                    to_status=3,
+                )
+            )
+        return reports
+
+    def next_timeout(self):
+        now = self.clock()
+        timeout = self.max_wait
+        if self.synced_at:
+            timeout = min(timeout, (self.synced_at + self.resync_interval - now).total_seconds())
+        if self.heap:
+            timeout = min(timeout, self.heap[0][0] - now.timestamp())
+        return max(timeout, 0)
+
+    def run_forever(self):
+        while not self.stopped:
+            close_old_connections()
+            try:
+                if self.synced_at is None or self.clock() >= self.synced_at + self.resync_interval:
+                    self.load_from_db()
+                self.run_due()
+            except Exception:
+                logger.exception("campaign deadline scheduler error")
+            with self.condition:
+                if not self.stopped:
+                    self.condition.wait(self.next_timeout())
+
+    def start(self):
+        if self.is_running:
+            return
+        self.stopped = False
+        self.thread = threading.Thread(
+            target=self.run_forever, name="campaign-deadline-scheduler", daemon=True
+        )
+        self.thread.start()
+
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+
+
+scheduler = DeadlineScheduler()
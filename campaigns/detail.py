@@ -0,0 +1,75 @@
+"""
+작성자 : 최준영
+내용 : 캠페인 상세 화면의 후기/댓글 목록 모듈입니다.
+후기, 댓글 View의 cursor 페이지와 상세 묶음 응답(CampaignDetailBundleView)의 첫 페이지를 같은 정렬, 같은 시리얼라이저로 만들어
+묶음 응답의 next 주소를 그대로 후기, 댓글 View에 보내면 다음 페이지가 이어집니다.
+보관된 캠페인은 보관 테이블에서 읽습니다.
+최초 작성일 : 2023.07.09
+"""
+from django.urls import reverse
+from rest_framework.utils.urls import replace_query_param
+from config.prefetch import plan_queryset
+from campaigns.models import (
+    ArchivedCampaignComment,
+    ArchivedCampaignReview,
+    CampaignComment,
+    CampaignReview,
+)
+from campaigns.pagination import FirstPagePagination, KeysetPagination
+from campaigns.serializers import (
+    ArchivedCampaignCommentSerializer,
+    ArchivedCampaignReviewSerializer,
+    CampaignCommentSerializer,
+    CampaignReviewSerializer,
+)
+
+PAGE_SIZE = 5
+
+# 이름: (모델, 보관 모델, 시리얼라이저, 보관 시리얼라이저, 목록 url 이름)
+THREADS = {
+    "reviews": (
+        CampaignReview,
+        ArchivedCampaignReview,
+        CampaignReviewSerializer,
+        ArchivedCampaignReviewSerializer,
+        "campaign_review_view",
+    ),
+    "comments": (
+        CampaignComment,
+        ArchivedCampaignComment,
+        CampaignCommentSerializer,
+        ArchivedCampaignCommentSerializer,
+        "campaign_comment_view",
+    ),
+}
+
+
+def get_ordering(name, order=None):
+    """
+    후기는 최신순, 댓글은 order=recent면 최신순, 아니면 작성순입니다.
+    """
+    if name == "reviews" or order == "recent":
+        return ("-created_at", "-id")
+    return ("created_at", "id")
+
+
+def get_thread_page(request, name, campaign_id, archived=False, order=None, first_page=False):
+    """
+    캠페인의 후기 또는 댓글 한 페이지를 (paginator, 직렬화 데이터)로 반환합니다.
+    다음 페이지 주소는 후기, 댓글 View 주소에 cursor(와 order)를 붙여 만듭니다.
+    """
+    model, archived_model, serializer_class, archived_serializer_class, url_name = THREADS[name]
+    if archived:
+        model, serializer_class = archived_model, archived_serializer_class
+
+    base_url = request.build_absolute_uri(reverse(url_name, kwargs={"campaign_id": campaign_id}))
+    if order:
+        base_url = replace_query_param(base_url, "order", order)
+    pagination_class = FirstPagePagination if first_page else KeysetPagination
+    paginator = pagination_class(
+        ordering=get_ordering(name, order), page_size=PAGE_SIZE, base_url=base_url
+    )
+    page = paginator.paginate_queryset(
+        plan_queryset(model.objects.filter(campaign_id=campaign_id), serializer_class), request
+    )
+    return paginator, serializer_class(page, many=True).data
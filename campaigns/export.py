@@ -0,0 +1,141 @@
+"""
+작성자 : 최준영
+내용 : 백오피스 캠페인 신청내역 내보내기 모듈입니다.
+시리얼라이저와 모델 객체 없이 values_list로 필요한 컬럼만 가져오고,
+id 기준 keyset으로 CHUNK_SIZE개씩 끊어 읽으면서 CSV/JSONL 한 줄씩 만들어 내보냅니다.
+DB 드라이버가 결과 전체를 메모리에 올리는 경우(MySQL 등)에도 한 번에 CHUNK_SIZE개만 메모리에 올라갑니다.
+참가자/좋아요/댓글/후기 수는 Campaign의 카운터 필드를 그대로 읽어 행마다 COUNT 하지 않습니다.
+최초 작성일 : 2023.07.09
+"""
+import csv
+import json
+from datetime import date, datetime, time
+from django.utils import timezone
+from campaigns.models import Campaign
+
+CHUNK_SIZE = 2000
+
+# (JSONL 키, CSV 헤더, values_list 필드)
+COLUMNS = (
+    ("id", "id", "id"),
+    ("title", "제목", "title"),
+    ("user", "작성자", "user__username"),
+    ("user_email", "작성자 이메일", "user__email"),
+    ("status", "진행 상태", "status"),
+    ("category", "카테고리", "category"),
+    ("members", "모집 인원", "members"),
+    ("participant_count", "참가자 수", "participant_count"),
+    ("like_count", "좋아요 수", "like_count"),
+    ("comment_count", "댓글 수", "comment_count"),
+    ("review_count", "후기 수", "review_count"),
+    ("is_funding", "펀딩여부", "is_funding"),
+    ("funding_goal", "펀딩 목표 금액", "fundings__goal"),
+    ("funding_amount", "펀딩 현재 금액", "fundings__amount"),
+    ("campaign_start_date", "캠페인 시작일", "campaign_start_date"),
+    ("campaign_end_date", "캠페인 마감일", "campaign_end_date"),
+    ("created_at", "신청일", "created_at"),
+)
+# 엑셀이 수식으로 실행하는 첫 글자입니다. 이 글자로 시작하는 CSV 문자열 값 앞에는 '를 붙입니다.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+STATUS_NAMES = dict(Campaign.STATUS_CHOICES)
+CATEGORY_NAMES = dict(Campaign.CATEGORY_CHOICES)
+
+
+class Echo:
+    """
+    csv.writer가 쓴 한 줄을 그대로 돌려주는 버퍼입니다.
+    """
+
+    def write(self, value):
+        return value
+
+
+def parse_filters(params):
+    """
+    Query String을 Campaign 필터로 바꿉니다. 형식이 맞지 않으면 ValueError를 발생시킵니다.
+    status, category : 숫자
+    start, end : 신청일(YYYY-MM-DD), end 날짜까지 포함합니다.
+    is_funding : true / false
+    """
+    filters = {}
+    for name in ("status", "category"):
+        if params.get(name):
+            filters[name] = int(params[name])
+    tz = timezone.get_current_timezone()
+    if params.get("start"):
+        start = datetime.combine(date.fromisoformat(params["start"]), time.min)
+        filters["created_at__gte"] = timezone.make_aware(start, tz)
+    if params.get("end"):
+        end = datetime.combine(date.fromisoformat(params["end"]), time.max)
+        filters["created_at__lte"] = timezone.make_aware(end, tz)
+    if params.get("is_funding"):
+        if params["is_funding"] not in ("true", "false"):
+            raise ValueError(params["is_funding"])
+        filters["is_funding"] = params["is_funding"] == "true"
+    return filters
+
+
+def iter_rows(filters, chunk_size=None):
+    """
+    조건에 맞는 캠페인을 id 순으로 chunk_size개씩 읽어 {JSONL 키: 값} 딕셔너리를 하나씩 돌려줍니다.
+    """
+    chunk_size = chunk_size or CHUNK_SIZE
+    queryset = (
+        Campaign.objects.filter(**filters)
+        .order_by("id")
+        .values_list(*[field for _, _, field in COLUMNS])
+    )
+    last_id = 0
+    while True:
+        chunk = list(queryset.filter(id__gt=last_id)[:chunk_size])
+        for values in chunk:
+            row = dict(zip([key for key, _, _ in COLUMNS], values))
+            row["status"] = STATUS_NAMES.get(row["status"])
+            row["category"] = CATEGORY_NAMES.get(row["category"])
+            yield row
+        if len(chunk) < chunk_size:
+            return
+        last_id = chunk[-1][0]
+
+
+def format_value(value):
+    if isinstance(value, datetime):
+        return timezone.localtime(value).isoformat()
+    return value
+
+
+def format_csv_value(value):
+    """
+    CSV 셀 값을 만듭니다. 제목, 작성자처럼 유저가 입력한 문자열이 수식으로 실행되지 않도록
+    수식 시작 글자로 시작하면 앞에 '를 붙입니다.
+    """
+    if value is None:
+        return ""
+    value = format_value(value)
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def stream_csv(rows):
+    """
+    엑셀에서 한글이 깨지지 않도록 BOM을 먼저 보내고 헤더와 행을 한 줄씩 내보냅니다.
+    """
+    writer = csv.writer(Echo())
+    yield "\ufeff" + writer.writerow([header for _, header, _ in COLUMNS])
+    for row in rows:
+        yield writer.writerow([format_csv_value(value) for value in row.values()])
+
+
+def stream_jsonl(rows):
+    for row in rows:
+        yield json.dumps(
+            {key: format_value(value) for key, value in row.items()},
+            ensure_ascii=False,
+        ) + "\n"
+
+
+FORMATS = {
+    "csv": (stream_csv, "text/csv; charset=utf-8"),
+    "jsonl": (stream_jsonl, "application/x-ndjson; charset=utf-8"),
+}
@@ -0,0 +1,62 @@
+"""
+작성자 : 최준영
+내용 : 캠페인 목록 필터 옆에 보여줄 카테고리 x 상태 x 펀딩여부 패싯 개수 모듈입니다.
+카테고리마다 목록을 다시 조회해 count를 읽지 않고, 목록과 같은 end, keyword 필터를 건
+GROUP BY 쿼리 한 번으로 모든 조합의 개수를 구한 뒤 항목별 합계를 만듭니다.
+최초 작성일 : 2023.07.09
+"""
+from collections import Counter
+from django.db.models import Count, Q
+from django.utils import timezone
+from campaigns.models import Campaign
+from campaigns.search import search_campaigns
+
+FACET_FIELDS = ("category", "status", "is_funding")
+
+
+def filter_campaigns(queryset, end=None, keyword=None):
+    """
+    캠페인 목록과 패싯이 함께 쓰는 end(N: 진행중, Y: 종료), keyword 필터입니다.
+    end가 없으면 승인된 캠페인 전체를 대상으로 합니다.
+    """
+    now = timezone.now()
+    end_filters = {
+        "N": Q(status=1) & Q(campaign_start_date__lte=now) & Q(campaign_end_date__gte=now),
+        "Y": Q(status__gte=2),
+    }
+    queryset = queryset.filter(end_filters.get(end, Q(status__gte=1)))
+    if keyword:
+        queryset = search_campaigns(queryset, keyword)
+    return queryset
+
+
+def facet_choices(field):
+    if field == "is_funding":
+        return ((True, "펀딩"), (False, "일반"))
+    return Campaign._meta.get_field(field).choices
+
+
+def get_facets(end=None, keyword=None):
+    """
+    {"total", "category", "status", "is_funding", "combinations"}를 반환합니다.
+    항목별 목록은 개수가 0인 선택지도 포함하고, combinations는 0이 아닌 조합만 담습니다.
+    """
+    rows = list(
+        filter_campaigns(Campaign.objects.all(), end, keyword)
+        .order_by()
+        .values(*FACET_FIELDS)
+        .annotate(count=Count("id"))
+    )
+    facets = {"total": sum(row["count"] for row in rows)}
+    for field in FACET_FIELDS:
+        counts = Counter()
+        for row in rows:
+            counts[row[field]] += row["count"]
+        facets[field] = [
+            {"value": value, "label": label, "count": counts[value]}
+            for value, label in facet_choices(field)
+        ]
+    facets["combinations"] = sorted(
+        rows, key=lambda row: tuple(row[field] for field in FACET_FIELDS)
+    )
+    return facets
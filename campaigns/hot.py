@@ -0,0 +1,102 @@
+"""
+작성자 : 최준영
+내용 : 캠페인 인기순(order=popular) 점수 모듈입니다.
+참가(3점), 댓글(2점), 좋아요(1점), 펀딩(HOT_FUNDING_UNIT원당 1점) 활동 점수를 더하고 반감기마다 절반으로 줄입니다.
+태그 트렌드(campaigns.tags)와 같이 시각에 따라 바뀌는 점수 대신 hot_rank = log2(점수) + 경과 반감기 수를 저장하므로
+활동이 없는 캠페인은 다시 계산하지 않아도 hot_rank 순서가 곧 현재 점수 순서이고, 정렬은 (-hot_rank, id) 인덱스만 읽습니다.
+활동은 카운터를 바꾸는 UPDATE에서 hot_pending에 쌓아 두고, refresh_hot_ranks가 hot_pending이 있는 캠페인만 반영합니다.
+최초 작성일 : 2023.07.09
+"""
+import math
+from collections import defaultdict
+from django.db import transaction
+from django.db.models import IntegerField, Q
+from django.db.models.functions import Cast
+from django.utils import timezone
+from payments.models import Payment
+from campaigns.cache import bump_list_generation
+from campaigns.models import Campaign, CampaignComment, Participant
+
+# 인기 점수는 이 기간(일)마다 절반으로 줄어듭니다.
+HOT_HALF_LIFE_DAYS = 2
+BATCH_SIZE = 500
+
+
+def hot_clock(now=None):
+    """
+    기준 시각부터 지난 반감기 수를 반환합니다. hot_rank에서 이 값을 빼면 log2(현재 점수)가 됩니다.
+    """
+    return (now or timezone.now()).timestamp() / 86400 / HOT_HALF_LIFE_DAYS
+
+
+def hot_score(rank, now=None):
+    """
+    hot_rank를 현재 시각의 점수로 바꿉니다. 활동이 없던 캠페인(hot_rank 0)은 0입니다.
+    """
+    return 2 ** (rank - hot_clock(now)) if rank else 0
+
+
+def hot_rank(score, clock):
+    return math.log2(score) + clock if score > 0 else 0
+
+
+def refresh_hot_ranks(now=None, batch_size=BATCH_SIZE):
+    """
+    hot_pending이 쌓인 캠페인만 hot_rank에 반영하고 hot_pending을 0으로 돌린 뒤, 반영한 캠페인 수를 반환합니다.
+    행을 잠그고 읽으므로 반영하는 동안 들어온 활동은 기다렸다가 다음 갱신에 반영됩니다.
+    """
+    clock = hot_clock(now)
+    pending = Campaign.objects.filter(Q(hot_pending__gt=0) | Q(hot_pending__lt=0))
+    campaign_ids = list(pending.order_by("id").values_list("id", flat=True))
+    for start in range(0, len(campaign_ids), batch_size):
+        chunk = campaign_ids[start:start + batch_size]
+        with transaction.atomic():
+            campaigns = list(
+                pending.select_for_update().filter(id__in=chunk).only("id", "hot_rank", "hot_pending")
+            )
+            for campaign in campaigns:
+                score = hot_score(campaign.hot_rank, now) + campaign.hot_pending
+                campaign.hot_rank = hot_rank(score, clock)
+                campaign.hot_pending = 0
+            Campaign.objects.bulk_update(campaigns, ["hot_rank", "hot_pending"])
+    if campaign_ids:
+        bump_list_generation()
+    return len(campaign_ids)
+
+
+def rebuild_hot_ranks(now=None, batch_size=BATCH_SIZE):
+    """
+    모든 캠페인의 hot_rank를 참가일, 댓글 작성일, 결제일로 처음부터 다시 계산합니다.
+    좋아요는 누른 시각이 남지 않으므로 캠페인 생성 시각을 누른 시각으로 봅니다.
+    """
+    clock = hot_clock(now)
+    weights = Campaign.HOT_WEIGHTS
+    scores = defaultdict(float)
+
+    def add(rows, weight):
+        for campaign_id, created_at in rows.iterator():
+            scores[campaign_id] += weight * 2 ** (hot_clock(created_at) - clock)
+
+    add(Participant.objects.values_list("campaign_id", "created_at"), weights["participant_count"])
+    add(CampaignComment.objects.values_list("campaign_id", "created_at"), weights["comment_count"])
+    add(
+        Campaign.like.through.objects.values_list("campaign_id", "campaign__created_at"),
+        weights["like_count"],
+    )
+    payments = (
+        Payment.objects.filter(campaign__isnull=False)
+        .annotate(value=Cast("amount", IntegerField()))
+        .values_list("campaign_id", "created_at", "value")
+    )
+    for campaign_id, created_at, value in payments.iterator():
+        scores[campaign_id] += (value or 0) / Campaign.HOT_FUNDING_UNIT * 2 ** (hot_clock(created_at) - clock)
+
+    with transaction.atomic():
+        Campaign.objects.update(hot_rank=0, hot_pending=0)
+        campaigns = [
+            Campaign(id=campaign_id, hot_rank=hot_rank(score, clock), hot_pending=0)
+            for campaign_id, score in scores.items()
+        ]
+        Campaign.objects.bulk_update(campaigns, ["hot_rank", "hot_pending"], batch_size=batch_size)
+        bump_list_generation()
+    return len(campaigns)
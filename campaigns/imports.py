@@ -0,0 +1,308 @@
+"""
+작성자 : 최준영
+내용 : 캠페인 일괄 등록(JSON/CSV) 모듈입니다.
+파일을 한 번에 읽지 않고 한 행씩 파싱해서, CampaignView.post와 같은 시리얼라이저 검증(validate_date 포함)을 거친 뒤
+BATCH_SIZE개씩 캠페인, 펀딩, 태그, 검색 색인을 bulk_create로 넣습니다.
+bulk_create는 시그널을 보내지 않으므로 트렌드 점수, 목록/마이페이지 캐시, 마감 스케줄러는 묶음마다, 태그 통계는 끝에 한 번 갱신하고,
+관련 캠페인은 operator의 증분 갱신 작업이 새 캠페인을 채웁니다.
+검증에 실패한 행은 건너뛰고 행 번호와 필드별 오류를 모아 돌려줍니다.
+최초 작성일 : 2023.07.09
+"""
+import csv
+import json
+import re
+from collections import Counter, defaultdict, deque
+from django.contrib.contenttypes.models import ContentType
+from django.db import DataError, IntegrityError, connection, transaction
+from django.db.models import Max
+from django.db.models.functions import Lower
+from rest_framework import serializers
+from taggit.models import Tag, TaggedItem
+from users.models import User
+from campaigns.cache import bump_list_generation, bump_mypage_generations
+from campaigns.deadlines import scheduler as deadline_scheduler
+from campaigns.export import COLUMNS
+from campaigns.models import Campaign, CampaignSearchIndex, Funding
+from campaigns.search import build_index_rows
+from campaigns.serializers import CampaignCreateSerializer, FundingCreateSerializer
+from campaigns.tags import bump_tag_trends, refresh_tag_stats
+
+BATCH_SIZE = 1000
+READ_SIZE = 1 << 16
+
+# CSV 헤더는 JSON 키 그대로 쓰거나, 내보내기 파일/모델의 한글 이름을 쓸 수 있습니다.
+HEADER_ALIASES = {
+    **{header: key for key, header, _ in COLUMNS},
+    "내용": "content",
+    "활동 시작일": "activity_start_date",
+    "활동 마감일": "activity_end_date",
+    "태그": "tags",
+}
+FUNDING_FIELDS = {"funding_goal": "goal", "funding_amount": "amount"}
+# 내보내기 파일처럼 상태, 카테고리가 이름으로 들어와도 받습니다.
+CHOICE_VALUES = {
+    "status": {name: value for value, name in Campaign.STATUS_CHOICES},
+    "category": {name: value for value, name in Campaign.CATEGORY_CHOICES},
+}
+JSON_SEPARATOR = re.compile(r"[\s,\[\]]*")
+
+
+def iter_json(stream):
+    """
+    JSON 배열([{...}, {...}])이나 JSON Lines 파일에서 최상위 값을 하나씩 돌려줍니다.
+    READ_SIZE씩 읽으면서 버퍼에서 raw_decode로 값을 잘라내므로 파일 전체를 메모리에 올리지 않습니다.
+    """
+    decoder = json.JSONDecoder()
+    buffer, position, eof = "", 0, False
+    while True:
+        position = JSON_SEPARATOR.match(buffer, position).end()
+        if position == len(buffer):
+            if eof:
+                return
+            buffer, position = stream.read(READ_SIZE), 0
+            eof = not buffer
+            continue
+        try:
+            value, position = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            chunk = stream.read(READ_SIZE)
+            eof = not chunk
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+        yield value
+
+
+def iter_csv(stream):
+    """
+    CSV 행을 {JSON 키: 값} 딕셔너리로 돌려줍니다. 빈 칸은 없는 값으로, tags는 쉼표로 나눠 목록으로 바꿉니다.
+    """
+    reader = csv.reader(stream)
+    header = [HEADER_ALIASES.get(name.strip(), name.strip()) for name in next(reader, [])]
+    for values in reader:
+        row = {key: value for key, value in zip(header, values) if value != ""}
+        if "tags" in row:
+            row["tags"] = [tag.strip() for tag in row["tags"].split(",") if tag.strip()]
+        yield row
+
+
+PARSERS = {
+    "json": iter_json,
+    "jsonl": iter_json,
+    "csv": iter_csv,
+}
+
+
+def error_detail(detail, prefix=""):
+    if isinstance(detail, dict):
+        return {f"{prefix}{key}": value for key, value in detail.items()}
+    return {"non_field_errors": detail}
+
+
+class CampaignImporter:
+    """
+    작성자 : 최준영
+    내용 : 행을 검증하고 묶음 단위로 저장하는 캠페인 일괄 등록 클래스입니다.
+    user는 user_email이 없는 행의 작성자입니다. dry_run이면 검증만 하고 저장하지 않습니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    def __init__(self, user=None, batch_size=None, dry_run=False):
+        self.user = user
+        self.batch_size = batch_size or BATCH_SIZE
+        self.dry_run = dry_run
+        # 시리얼라이저는 필드를 만드는 비용이 커서 한 번 만들어 run_validation만 반복합니다.
+        self.campaign_serializer = CampaignCreateSerializer()
+        self.funding_serializer = FundingCreateSerializer()
+        self.content_type = ContentType.objects.get_for_model(Campaign)
+        self.users = {}
+        self.tags = {}
+        self.tag_ids = set()
+        self.total = 0
+        self.created = 0
+        self.errors = []
+
+    def run(self, rows):
+        """
+        rows(딕셔너리 iterator)를 모두 등록하고 {"total", "created", "failed", "errors"}를 반환합니다.
+        파일 형식이 깨져 더 읽을 수 없으면 그 위치를 오류로 남기고 멈춥니다.
+        """
+        rows = iter(rows)
+        batch = []
+        while True:
+            try:
+                row = next(rows)
+            except StopIteration:
+                break
+            except (ValueError, csv.Error) as error:
+                self.errors.append(
+                    {"row": self.total + 1, "errors": {"non_field_errors": [f"파일 형식 오류: {error}"]}}
+                )
+                break
+            self.total += 1
+            item = self.validate(self.total, row)
+            if item is not None:
+                batch.append((self.total, *item))
+            if len(batch) >= self.batch_size:
+                self.flush(batch)
+                batch = []
+        self.flush(batch)
+        # 태그 통계는 태그에 달린 캠페인 전체를 다시 세므로 묶음마다 하지 않고 끝에 한 번만 집계합니다.
+        refresh_tag_stats(self.tag_ids)
+        return {
+            "total": self.total,
+            "created": self.created,
+            "failed": len(self.errors),
+            "errors": self.errors,
+        }
+
+    def validate(self, number, row):
+        if not isinstance(row, dict):
+            self.errors.append({"row": number, "errors": {"non_field_errors": ["객체가 아닙니다."]}})
+            return None
+        # 태그가 없는 행은 빈 태그로 등록합니다.
+        row = {"tags": [], **row}
+        for field, names in CHOICE_VALUES.items():
+            if isinstance(row.get(field), str) and row[field] in names:
+                row[field] = names[row[field]]
+        funding_data = {
+            name: row.pop(key) for key, name in FUNDING_FIELDS.items() if key in row
+        }
+        errors = {}
+
+        try:
+            data = self.campaign_serializer.run_validation(row)
+        except serializers.ValidationError as error:
+            errors.update(error_detail(error.detail))
+            data = None
+
+        funding = None
+        if data is not None and data.get("is_funding"):
+            try:
+                funding = self.funding_serializer.run_validation(funding_data)
+            except serializers.ValidationError as error:
+                errors.update(error_detail(error.detail, "funding_"))
+
+        email = row.get("user_email")
+        user = self.get_user(email) if email else self.user
+        if user is None:
+            errors["user_email"] = ["작성자를 찾을 수 없습니다."]
+
+        if errors:
+            self.errors.append({"row": number, "errors": errors})
+            return None
+        tags = data.pop("tags", [])
+        return Campaign(user=user, **data), funding, tags
+
+    def get_user(self, email):
+        if email not in self.users:
+            self.users[email] = User.objects.filter(email=email).first()
+        return self.users[email]
+
+    def get_tags(self, names):
+        """
+        태그 이름을 Tag로 바꿉니다. 대소문자를 구분하지 않는 설정(TAGGIT_CASE_INSENSITIVE)에 맞춰 소문자로 찾고,
+        없는 태그만 하나씩 만듭니다(taggit이 slug 중복을 처리).
+        """
+        missing = {name.lower(): name for name in names if name.lower() not in self.tags}
+        if missing:
+            existing = Tag.objects.annotate(lower_name=Lower("name")).filter(
+                lower_name__in=list(missing)
+            )
+            for tag in existing:
+                self.tags[tag.lower_name] = tag
+            for lower_name, name in missing.items():
+                if lower_name not in self.tags:
+                    self.tags[lower_name] = Tag.objects.create(name=name)
+        return list({name.lower(): self.tags[name.lower()] for name in names}.values())
+
+    def flush(self, batch):
+        """
+        묶음을 저장합니다. DB 제약조건에 걸리는 행이 있으면 묶음을 한 행씩 나눠 다시 저장해서 그 행만 오류로 남깁니다.
+        """
+        if not batch or self.dry_run:
+            return
+        try:
+            self.save(batch)
+        except (IntegrityError, DataError) as error:
+            for _, campaign, _, _ in batch:
+                campaign.id = None
+                campaign._state.adding = True
+            if len(batch) == 1:
+                self.errors.append(
+                    {"row": batch[0][0], "errors": {"non_field_errors": [f"저장 실패: {error}"]}}
+                )
+            else:
+                for item in batch:
+                    self.flush([item])
+
+    def save(self, batch):
+        campaigns = [campaign for _, campaign, _, _ in batch]
+        # 태그는 묶음 저장이 실패해도 캐시와 어긋나지 않도록 트랜잭션 밖에서 만듭니다.
+        tags = [self.get_tags(names) for _, _, _, names in batch]
+        with transaction.atomic():
+            last_id = None
+            if not connection.features.can_return_rows_from_bulk_insert:
+                last_id = Campaign.objects.aggregate(last_id=Max("id"))["last_id"] or 0
+            Campaign.objects.bulk_create(campaigns)
+            if last_id is not None:
+                assign_ids(campaigns, last_id)
+
+            Funding.objects.bulk_create(
+                [
+                    Funding(campaign=campaign, **funding)
+                    for _, campaign, funding, _ in batch
+                    if funding is not None
+                ]
+            )
+
+            tagged_items = []
+            index_rows = []
+            tag_counts = Counter()
+            for campaign, campaign_tags in zip(campaigns, tags):
+                tagged_items.extend(
+                    TaggedItem(content_type=self.content_type, object_id=campaign.id, tag=tag)
+                    for tag in campaign_tags
+                )
+                tag_counts.update(tag.id for tag in campaign_tags)
+                index_rows.extend(build_index_rows(campaign, [tag.name for tag in campaign_tags]))
+            TaggedItem.objects.bulk_create(tagged_items)
+            CampaignSearchIndex.objects.bulk_create(index_rows, batch_size=self.batch_size)
+
+            bump_tag_trends(dict(tag_counts))
+            bump_list_generation()
+            bump_mypage_generations({campaign.user_id for campaign in campaigns})
+
+        if deadline_scheduler.is_running:
+            for campaign in campaigns:
+                deadline_scheduler.reschedule(campaign)
+        self.tag_ids.update(tag_counts)
+        self.created += len(campaigns)
+
+
+def assign_ids(campaigns, last_id):
+    """
+    bulk_create가 pk를 돌려주지 않는 DB(MySQL)에서 방금 넣은 캠페인의 id를 채웁니다.
+    last_id 이후에 생긴 행을 id 순으로 읽어 (작성자, 제목, 생성일)이 같은 객체에 넣은 순서대로 맞춥니다.
+    """
+    pending = defaultdict(deque)
+    for campaign in campaigns:
+        pending[(campaign.user_id, campaign.title, campaign.created_at)].append(campaign)
+    rows = (
+        Campaign.objects.filter(id__gt=last_id)
+        .order_by("id")
+        .values_list("id", "user_id", "title", "created_at")
+    )
+    for campaign_id, *key in rows.iterator():
+        queue = pending.get(tuple(key))
+        if queue:
+            queue.popleft().id = campaign_id
+
+
+def import_campaigns(stream, format, user=None, batch_size=None, dry_run=False):
+    """
+    텍스트 stream을 format(json, jsonl, csv)으로 파싱해 등록하고 결과 보고서를 반환합니다.
+    """
+    importer = CampaignImporter(user=user, batch_size=batch_size, dry_run=dry_run)
+    return importer.run(PARSERS[format](stream))
@@ -0,0 +1,244 @@
+"""
+작성자 : 최준영
+내용 : 캠페인 좋아요 쓰기 버퍼 모듈입니다.
+좋아요 토글마다 M2M 행을 쓰지 않고 유저별 마지막 의도(좋아요/취소)를 캐시에 기록하고,
+토글 로그를 모아 bulk_create/delete 한 번씩으로 DB에 반영합니다.
+반영 전까지 좋아요 여부와 좋아요 수는 버퍼와 DB를 합쳐서 계산합니다.
+최초 작성일 : 2023.07.08
+"""
+import time
+from collections import defaultdict
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from users.models import User
+from campaigns.cache import (
+    bump_detail_generations,
+    bump_list_generation,
+    bump_mypage_generations,
+)
+from campaigns.models import Campaign
+
+INTENT_KEY = "campaign_like:{campaign_id}:{user_id}"
+PENDING_KEY = "campaign_like:{campaign_id}:pending"
+LOG_SEQUENCE_KEY = "campaign_like:sequence"
+LOG_FLUSHED_KEY = "campaign_like:flushed"
+LOG_ENTRY_KEY = "campaign_like:log:{seq}"
+FLUSH_LOCK_KEY = "campaign_like:flush:lock"
+TOGGLE_LOCK_KEY = "campaign_like:{campaign_id}:{user_id}:lock"
+
+# 반영이 밀려도 의도가 사라지지 않도록 반영 주기보다 충분히 길게 둡니다.
+INTENT_TIMEOUT = 60 * 60 * 24
+FLUSH_LOCK_TIMEOUT = 60
+# 같은 유저의 토글은 한 번에 하나씩 처리합니다. 잠금을 얻지 못하면 TOGGLE_LOCK_WAIT초 간격으로 다시 시도합니다.
+TOGGLE_LOCK_TIMEOUT = 5
+TOGGLE_LOCK_RETRIES = 20
+TOGGLE_LOCK_WAIT = 0.01
+# 시퀀스를 받은 직후 아직 로그를 쓰지 못한 토글을 건너뛰지 않도록 최근 구간의 빈 로그는 다음 반영으로 미룹니다.
+LOG_WRITE_GRACE = 100
+
+
+def intent_key(campaign_id, user_id):
+    return INTENT_KEY.format(campaign_id=campaign_id, user_id=user_id)
+
+
+def pending_key(campaign_id):
+    return PENDING_KEY.format(campaign_id=campaign_id)
+
+
+def is_liked(campaign_id, user_id):
+    """
+    버퍼에 남은 의도가 있으면 그 값을, 없으면 DB의 좋아요 여부를 반환합니다.
+    """
+    liked = cache.get(intent_key(campaign_id, user_id))
+    if liked is None:
+        liked = Campaign.like.through.objects.filter(
+            campaign_id=campaign_id, user_id=user_id
+        ).exists()
+    return liked
+
+
+def liked_campaign_ids(campaign_ids, user_id):
+    """
+    campaign_ids 중 유저가 좋아요한 캠페인 id 집합을 반환합니다. is_liked를 여러 캠페인에 한 번에 적용한 것으로,
+    버퍼 의도를 get_many로 읽고 의도가 없는 캠페인만 (user_id, campaign_id)로 한 번 조회합니다.
+    """
+    intents = cache.get_many([intent_key(campaign_id, user_id) for campaign_id in campaign_ids])
+    liked = set()
+    missing = []
+    for campaign_id in campaign_ids:
+        intent = intents.get(intent_key(campaign_id, user_id))
+        if intent is None:
+            missing.append(campaign_id)
+        elif intent:
+            liked.add(campaign_id)
+    if missing:
+        liked.update(
+            Campaign.like.through.objects.filter(
+                user_id=user_id, campaign_id__in=missing
+            ).values_list("campaign_id", flat=True)
+        )
+    return liked
+
+
+def get_like_count(campaign_id, like_count):
+    """
+    DB의 like_count에 아직 반영되지 않은 버퍼 증감을 더한 좋아요 수를 반환합니다.
+    """
+    return max(like_count + (cache.get(pending_key(campaign_id)) or 0), 0)
+
+
+def toggle_like_direct(campaign_id, user_id):
+    """
+    버퍼 없이 M2M과 like_count를 바로 수정합니다.
+    """
+    campaign = Campaign(id=campaign_id)
+    with transaction.atomic():
+        if campaign.like.filter(id=user_id).exists():
+            campaign.like.remove(user_id)
+            Campaign.update_counts(campaign_id, like_count=-1)
+            return False
+        campaign.like.add(user_id)
+        Campaign.update_counts(campaign_id, like_count=1)
+        return True
+
+
+def toggle_like(campaign_id, user_id):
+    """
+    좋아요 의도를 버퍼에 기록하고 토글 결과를 반환합니다.
+    같은 유저의 의도는 마지막 값으로 덮어쓰고, 쌓인 로그가 반영 단위를 넘으면 바로 반영합니다.
+    의도를 읽고 뒤집는 동안 (캠페인, 유저) 잠금을 잡아서, 동시에 들어온 토글이 같은 값을 읽고
+    버퍼 증감만 두 번 더하는 일이 없도록 합니다. 잠금을 끝내 얻지 못하면 다른 토글이 처리 중인 것이므로
+    바꾸지 않고 None을 반환합니다.
+    """
+    lock_key = TOGGLE_LOCK_KEY.format(campaign_id=campaign_id, user_id=user_id)
+    for _ in range(TOGGLE_LOCK_RETRIES):
+        if cache.add(lock_key, 1, TOGGLE_LOCK_TIMEOUT):
+            break
+        time.sleep(TOGGLE_LOCK_WAIT)
+    else:
+        return None
+
+    try:
+        liked = not is_liked(campaign_id, user_id)
+        cache.set(intent_key(campaign_id, user_id), liked, INTENT_TIMEOUT)
+        key = pending_key(campaign_id)
+        cache.add(key, 0, INTENT_TIMEOUT)
+        cache.incr(key, 1 if liked else -1)
+    finally:
+        cache.delete(lock_key)
+
+    cache.add(LOG_SEQUENCE_KEY, 0, None)
+    seq = cache.incr(LOG_SEQUENCE_KEY)
+    cache.set(LOG_ENTRY_KEY.format(seq=seq), (campaign_id, user_id), INTENT_TIMEOUT)
+
+    if seq - (cache.get(LOG_FLUSHED_KEY) or 0) >= settings.CAMPAIGN_LIKE_FLUSH_BATCH:
+        flush_likes()
+    return liked
+
+
+def read_log():
+    """
+    마지막 반영 이후의 토글 로그에서 (캠페인 id, 유저 id) 목록과 다음 반영 시작 위치를 반환합니다.
+    """
+    flushed = cache.get(LOG_FLUSHED_KEY) or 0
+    last = cache.get(LOG_SEQUENCE_KEY) or 0
+    keys = {LOG_ENTRY_KEY.format(seq=seq): seq for seq in range(flushed + 1, last + 1)}
+    entries = cache.get_many(list(keys))
+
+    position = last
+    for key, seq in keys.items():
+        if key not in entries and seq > last - LOG_WRITE_GRACE:
+            position = seq - 1
+            break
+    pairs = {tuple(entry) for key, entry in entries.items() if keys[key] <= position}
+    return pairs, position
+
+
+def flush_likes():
+    """
+    버퍼의 좋아요 의도를 M2M에 bulk_create/delete로 반영하고, 반영한 행 수를 반환합니다.
+    다른 워커가 반영 중이면 건너뜁니다.
+    """
+    if not cache.add(FLUSH_LOCK_KEY, 1, FLUSH_LOCK_TIMEOUT):
+        return 0
+    try:
+        pairs, position = read_log()
+        if not pairs:
+            cache.set(LOG_FLUSHED_KEY, position, None)
+            return 0
+
+        intents = cache.get_many([intent_key(*pair) for pair in pairs])
+        through = Campaign.like.through
+        existing = set(
+            through.objects.filter(
+                campaign_id__in={campaign_id for campaign_id, _ in pairs},
+                user_id__in={user_id for _, user_id in pairs},
+            ).values_list("campaign_id", "user_id")
+        )
+
+        # 버퍼에 남아 있는 동안 캠페인이나 유저가 지워졌으면 FK 오류로 반영 전체가 멈추므로 의도를 버립니다.
+        liked_pairs = [pair for pair in pairs if intents.get(intent_key(*pair))]
+        if liked_pairs:
+            campaign_ids = set(
+                Campaign.objects.filter(
+                    id__in={campaign_id for campaign_id, _ in liked_pairs}
+                ).values_list("id", flat=True)
+            )
+            user_ids = set(
+                User.objects.filter(
+                    id__in={user_id for _, user_id in liked_pairs}
+                ).values_list("id", flat=True)
+            )
+            dropped = [
+                pair for pair in liked_pairs if pair[0] not in campaign_ids or pair[1] not in user_ids
+            ]
+            if dropped:
+                cache.delete_many([intent_key(*pair) for pair in dropped])
+                pairs -= set(dropped)
+
+        added = []
+        removed = defaultdict(list)
+        deltas = defaultdict(int)
+        for campaign_id, user_id in pairs:
+            liked = intents.get(intent_key(campaign_id, user_id))
+            if liked is None:
+                continue
+            if liked and (campaign_id, user_id) not in existing:
+                added.append(through(campaign_id=campaign_id, user_id=user_id))
+                deltas[campaign_id] += 1
+            elif not liked and (campaign_id, user_id) in existing:
+                removed[campaign_id].append(user_id)
+                deltas[campaign_id] -= 1
+
+        with transaction.atomic():
+            through.objects.bulk_create(added, ignore_conflicts=True)
+            for campaign_id, user_ids in removed.items():
+                through.objects.filter(campaign_id=campaign_id, user_id__in=user_ids).delete()
+            for campaign_id, delta in deltas.items():
+                if delta:
+                    Campaign.update_counts(campaign_id, like_count=delta)
+            if deltas:
+                bump_list_generation()
+                bump_detail_generations(list(deltas))
+                bump_mypage_generations(
+                    {row.user_id for row in added}
+                    | {user_id for user_ids in removed.values() for user_id in user_ids}
+                )
+            transaction.on_commit(lambda: commit_flush(position, deltas))
+        return len(added) + sum(len(user_ids) for user_ids in removed.values())
+    finally:
+        cache.delete(FLUSH_LOCK_KEY)
+
+
+def commit_flush(position, deltas):
+    """
+    DB 반영이 커밋된 뒤 로그 위치를 옮기고, 반영한 만큼 버퍼 증감을 줄입니다.
+    """
+    cache.set(LOG_FLUSHED_KEY, position, None)
+    for campaign_id, delta in deltas.items():
+        if delta:
+            try:
+                cache.decr(pending_key(campaign_id), delta)
+            except ValueError:
+                pass
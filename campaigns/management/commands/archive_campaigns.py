@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from campaigns.archive import archive_campaigns, archive_candidates
+
+
+class Command(BaseCommand):
+    """
+    작성자 : 최준영
+    내용 : 마감 후 보관 기간이 지난 종료/실패 캠페인을 보관 테이블로 옮기는 커맨드입니다.
+    ex) python manage.py archive_campaigns --days 365 --chunk-size 500
+    """
+
+    help = "오래된 종료/실패 캠페인과 후기, 댓글, 참가, 좋아요를 보관 테이블로 옮깁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, help="마감 후 지난 일수입니다. 기본값은 CAMPAIGN_ARCHIVE_AFTER_DAYS입니다."
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, help="한 트랜잭션에 옮길 캠페인 수입니다."
+        )
+        parser.add_argument("--limit", type=int, help="이번에 옮길 최대 캠페인 수입니다.")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="보관 대상 캠페인 수만 출력합니다.",
+        )
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            count = archive_candidates(days=options["days"]).count()
+            self.stdout.write(f"보관 대상 캠페인 {count}개")
+            return
+        report = archive_campaigns(
+            days=options["days"], chunk_size=options["chunk_size"], limit=options["limit"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"캠페인 {report['archived']}개 보관 완료 ({report['elapsed']}초)")
+        )
@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand
+from config import images
+
+
+class Command(BaseCommand):
+    """
+    작성자 : 최준영
+    내용 : 이미 올라가 있는 이미지(캠페인, 후기, 상품, 프로필)의 파생본을 만드는 커맨드입니다.
+    파생본이 없거나 원본이 바뀐 행만 id 순서로 끊어 읽어 워커 풀에서 만듭니다.
+    ex) python manage.py backfill_image_variants --model campaigns.campaign --workers 4
+    """
+
+    help = "기존 업로드 이미지의 썸네일/WebP 파생본을 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            help="app_label.model 형식으로 대상 모델을 지정합니다. 여러 번 줄 수 있습니다.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="파생본이 있어도 다시 만듭니다.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="파생본을 만드는 워커 스레드 수입니다. 0이면 커맨드 스레드에서 바로 만듭니다.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 읽을 행 수입니다.",
+        )
+
+    def iter_pending(self, model, field_name, force, batch_size):
+        queryset = (
+            model._default_manager.exclude(**{field_name: ""})
+            .exclude(**{f"{field_name}__isnull": True})
+            .order_by("pk")
+            .values_list("pk", field_name, images.VARIANTS_FIELD)
+        )
+        last_pk = None
+        while True:
+            chunk = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            rows = list(chunk[:batch_size])
+            if not rows:
+                return
+            for pk, name, variants in rows:
+                if force or (variants or {}).get("source") != name:
+                    yield pk
+            last_pk = rows[-1][0]
+
+    def handle(self, *args, **options):
+        labels = {label.lower() for label in options["model"] or ()}
+        targets = [
+            (model, field_name)
+            for model, field_name in images.registry
+            if not labels or model._meta.label_lower in labels
+        ]
+        force = options["force"]
+        executor = ThreadPoolExecutor(options["workers"]) if options["workers"] > 0 else None
+        try:
+            for model, field_name in targets:
+                pending = self.iter_pending(model, field_name, force, options["batch_size"])
+                if executor is None:
+                    results = (
+                        images.generate_variants(model, pk, field_name, force) for pk in pending
+                    )
+                else:
+                    results = executor.map(
+                        lambda pk: images.run_in_worker(model, pk, field_name, force), pending
+                    )
+                done = failed = 0
+                for variants in results:
+                    if variants is None:
+                        failed += 1
+                    else:
+                        done += 1
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"{model._meta.label} 파생본 {done}개 생성, {failed}개 실패"
+                    )
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown()
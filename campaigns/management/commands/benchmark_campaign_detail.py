@@ -0,0 +1,84 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+from users.models import User
+from campaigns.models import Campaign
+
+
+class Command(BaseCommand):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 상세 화면을 기존 다섯 요청(상세, 댓글, 후기, 좋아요, 참가)으로 그릴 때와
+    상세 묶음 요청 한 번으로 그릴 때의 쿼리 수와 응답 시간을 비교하는 커맨드입니다.
+    요청은 프로세스 안에서 보내므로 네트워크 왕복 시간은 빠져 있고, 실제 화면에서는 요청 수만큼 왕복이 더해집니다.
+    ex) python manage.py benchmark_campaign_detail --campaign 1 --user test@test.com --repeat 50
+    """
+
+    help = "캠페인 상세 다섯 요청과 상세 묶음 요청의 쿼리 수, 평균 응답 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--campaign", type=int, help="캠페인 id입니다. 없으면 최근 승인된 캠페인입니다.")
+        parser.add_argument("--user", help="로그인해서 보낼 유저 이메일입니다. 없으면 비로그인입니다.")
+        parser.add_argument("--repeat", type=int, default=20, help="반복 횟수입니다.")
+        parser.add_argument("--host", default="localhost", help="요청 Host 헤더입니다(ALLOWED_HOSTS).")
+
+    def measure(self, client, urls, host, repeat):
+        def run():
+            for url in urls:
+                response = client.get(url, HTTP_HOST=host)
+                if response.status_code != 200:
+                    raise CommandError(f"{url} 응답 코드 {response.status_code}")
+
+        queries = []
+
+        def count_query(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        # 상세 캐시가 채워진 상태(평소 상태)에서 잽니다.
+        # 요청마다 connection.queries가 초기화되므로 execute_wrapper로 셉니다.
+        run()
+        with connection.execute_wrapper(count_query):
+            run()
+        started = time.perf_counter()
+        for _ in range(repeat):
+            run()
+        elapsed = (time.perf_counter() - started) / repeat * 1000
+        return elapsed, len(queries)
+
+    def handle(self, *args, **options):
+        campaign_id = options["campaign"]
+        if campaign_id is None:
+            campaign_id = (
+                Campaign.objects.filter(status__gte=1).order_by("-id").values_list("id", flat=True).first()
+            )
+        if campaign_id is None:
+            raise CommandError("벤치마크할 캠페인이 없습니다.")
+
+        client = APIClient()
+        if options["user"]:
+            client.force_authenticate(user=User.objects.get(email=options["user"]))
+        kwargs = {"campaign_id": campaign_id}
+        sequence = [
+            reverse(name, kwargs=kwargs)
+            for name in (
+                "campaign_detail_view",
+                "campaign_comment_view",
+                "campaign_review_view",
+                "campaign_like_view",
+                "campaign_participation_view",
+            )
+        ]
+        bundle = [reverse("campaign_detail_bundle_view", kwargs=kwargs)]
+
+        host, repeat = options["host"], options["repeat"]
+        sequence_ms, sequence_queries = self.measure(client, sequence, host, repeat)
+        bundle_ms, bundle_queries = self.measure(client, bundle, host, repeat)
+        self.stdout.write(f"캠페인 {campaign_id}, 반복 {repeat}회")
+        self.stdout.write(
+            f"다섯 요청: 쿼리 {sequence_queries}회 {sequence_ms:.2f}ms / "
+            f"묶음 요청: 쿼리 {bundle_queries}회 {bundle_ms:.2f}ms / "
+            f"{sequence_ms / bundle_ms if bundle_ms else 0:.1f}배"
+        )
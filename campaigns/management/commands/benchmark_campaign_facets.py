@@ -0,0 +1,54 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from campaigns.facets import FACET_FIELDS, facet_choices, filter_campaigns, get_facets
+from campaigns.models import Campaign
+
+
+class Command(BaseCommand):
+    """
+    작성자 : 최준영
+    내용 : 패싯 개수를 구하는 쿼리 수와 응답 시간을 기존 방식과 비교하는 커맨드입니다.
+    기존 방식은 선택지마다 목록을 조회해 페이지네이션 count를 읽는 것과 같은 COUNT 쿼리를 보냅니다.
+    ex) python manage.py benchmark_campaign_facets --end N --keyword 환경 --repeat 20
+    """
+
+    help = "패싯 GROUP BY 쿼리와 선택지별 COUNT 쿼리의 쿼리 수, 평균 응답 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--end", help="목록과 같은 end 필터(N, Y)입니다.")
+        parser.add_argument("--keyword", help="목록과 같은 keyword 필터입니다.")
+        parser.add_argument("--repeat", type=int, default=10, help="반복 횟수입니다.")
+
+    def count_each(self, end, keyword):
+        queryset = filter_campaigns(Campaign.objects.all(), end, keyword)
+        return {
+            field: {value: queryset.filter(**{field: value}).count() for value, _ in facet_choices(field)}
+            for field in FACET_FIELDS
+        }
+
+    def measure(self, run, repeat):
+        with CaptureQueriesContext(connection) as queries:
+            run()
+        started = time.perf_counter()
+        for _ in range(repeat):
+            run()
+        elapsed = (time.perf_counter() - started) / repeat * 1000
+        return elapsed, len(queries)
+
+    def handle(self, *args, **options):
+        end, keyword, repeat = options["end"], options["keyword"], options["repeat"]
+        each = self.count_each(end, keyword)
+        facets = get_facets(end, keyword)
+        for field in FACET_FIELDS:
+            assert each[field] == {item["value"]: item["count"] for item in facets[field]}
+
+        each_ms, each_queries = self.measure(lambda: self.count_each(end, keyword), repeat)
+        facet_ms, facet_queries = self.measure(lambda: get_facets(end, keyword), repeat)
+        self.stdout.write(f"캠페인 {Campaign.objects.count()}개, 반복 {repeat}회")
+        self.stdout.write(
+            f"선택지별 COUNT: 쿼리 {each_queries}회 {each_ms:.2f}ms / "
+            f"패싯: 쿼리 {facet_queries}회 {facet_ms:.2f}ms / "
+            f"{each_ms / facet_ms if facet_ms else 0:.1f}배"
+        )
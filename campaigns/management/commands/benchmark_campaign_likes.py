@@ -0,0 +1,95 @@
+import time
+from datetime import timedelta
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+from users.models import User
+from campaigns.models import Campaign
+from campaigns.likes import (
+    flush_likes,
+    intent_key,
+    pending_key,
+    toggle_like,
+    toggle_like_direct,
+)
+
+
+class Command(BaseCommand):
+    """
+    작성자 : 최준영
+    내용 : 좋아요를 바로 반영하는 방식과 캐시 버퍼에 모아 반영하는 방식의 처리량을 비교하는 커맨드입니다.
+    벤치마크용 유저와 캠페인을 만들어 한 캠페인에 좋아요 토글을 몰아 보내고, 끝나면 삭제합니다.
+    ex) python manage.py benchmark_campaign_likes --users 500 --toggles 3
+    """
+
+    help = "좋아요 직접 반영과 버퍼 반영의 초당 처리량과 쿼리 수를 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=300, help="좋아요를 누를 유저 수입니다.")
+        parser.add_argument("--toggles", type=int, default=3, help="유저별 토글 횟수입니다.")
+
+    def measure(self, toggle, campaign, users, toggles):
+        queries = []
+
+        def count_query(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_query):
+            started = time.perf_counter()
+            for _ in range(toggles):
+                for user in users:
+                    toggle(campaign.id, user.id)
+            if toggle is toggle_like:
+                flush_likes()
+            elapsed = time.perf_counter() - started
+        return len(users) * toggles / elapsed, elapsed * 1000, len(queries)
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        User.objects.bulk_create(
+            [
+                User(email=f"like-benchmark-{i}@benchmark.local", username=f"like-benchmark-{i}")
+                for i in range(options["users"])
+            ]
+        )
+        users = list(User.objects.filter(email__endswith="@benchmark.local"))
+        campaigns = [
+            Campaign.objects.create(
+                title="좋아요 벤치마크",
+                content="좋아요 벤치마크",
+                user=users[0],
+                members=1,
+                campaign_start_date=now,
+                campaign_end_date=now + timedelta(days=1),
+                status=1,
+            )
+            for _ in range(2)
+        ]
+        try:
+            flush_likes()
+            results = {
+                "직접 반영": self.measure(
+                    toggle_like_direct, campaigns[0], users, options["toggles"]
+                ),
+                "버퍼 반영": self.measure(toggle_like, campaigns[1], users, options["toggles"]),
+            }
+            for campaign in campaigns:
+                campaign.refresh_from_db()
+            self.stdout.write(
+                f"유저 {len(users)}명 x 토글 {options['toggles']}회, "
+                f"좋아요 수 {campaigns[0].like_count} / {campaigns[1].like_count}"
+            )
+            for name, (throughput, elapsed, query_count) in results.items():
+                self.stdout.write(
+                    f"{name}: {throughput:.0f}회/초 ({elapsed:.1f}ms, 쿼리 {query_count}개)"
+                )
+        finally:
+            cache.delete_many(
+                [intent_key(campaigns[1].id, user.id) for user in users]
+                + [pending_key(campaigns[1].id)]
+            )
+            for campaign in campaigns:
+                campaign.delete()
+            User.objects.filter(email__endswith="@benchmark.local").delete()
@@ -0,0 +1,72 @@
+import time
+import numpy as np
+from django.core.management.base import BaseCommand
+from campaigns.related import FeatureMatrix, iter_neighbors
+
+
+class Command(BaseCommand):
+    """
+    작성자 : 최준영
+    내용 : 관련 캠페인 계산의 소요 시간을 재는 커맨드입니다.
+    DB 대신 임의로 만든 캠페인 특성(태그, 카테고리, 참가자, 좋아요)으로
+    행렬 생성, 전체 계산, 새 캠페인만 계산하는 증분 계산 시간을 각각 잽니다.
+    ex) python manage.py benchmark_campaign_neighbors --campaigns 100000 --new 1000
+    """
+
+    help = "임의의 캠페인 특성으로 관련 캠페인 전체/증분 계산 시간을 잽니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--campaigns", type=int, default=100000, help="캠페인 수입니다.")
+        parser.add_argument("--new", type=int, default=1000, help="증분 계산할 새 캠페인 수입니다.")
+        parser.add_argument("--tags", type=int, default=2000, help="태그 종류 수입니다.")
+        parser.add_argument("--users", type=int, default=50000, help="유저 수입니다.")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def features(self, random, ids, tags, users):
+        """
+        캠페인마다 태그 1~5개, 참가자 0~30명, 좋아요 0~20명을 붙입니다.
+        태그와 유저는 일부가 인기를 독차지하도록 지수 분포로 뽑습니다.
+        """
+        def pick(counts, size):
+            owners = np.repeat(ids, counts)
+            keys = np.minimum(random.exponential(size / 10, len(owners)).astype(np.int64), size - 1)
+            pairs = np.unique(np.stack([owners, keys], axis=1), axis=0)
+            return pairs[:, 0], pairs[:, 1]
+
+        return {
+            "tag": pick(random.integers(1, 6, len(ids)), tags),
+            "category": (ids, random.integers(0, 5, len(ids))),
+            "participant": pick(random.integers(0, 31, len(ids)), users),
+            "like": pick(random.integers(0, 21, len(ids)), users),
+        }
+
+    def run(self, matrix, rows):
+        started = time.perf_counter()
+        pairs = 0
+        for _, _, cols, _ in iter_neighbors(matrix, rows):
+            pairs += int((cols >= 0).sum())
+        return time.perf_counter() - started, pairs
+
+    def handle(self, *args, **options):
+        random = np.random.default_rng(options["seed"])
+        ids = np.arange(1, options["campaigns"] + 1)
+        features = self.features(random, ids, options["tags"], options["users"])
+        nonzeros = sum(len(owners) for owners, _ in features.values())
+
+        started = time.perf_counter()
+        matrix = FeatureMatrix(ids, features)
+        build = time.perf_counter() - started
+        self.stdout.write(
+            f"캠페인 {len(ids)}개, 특성 {nonzeros}개, 행렬 생성 {build * 1000:.0f}ms"
+        )
+
+        elapsed, pairs = self.run(matrix, np.arange(len(matrix)))
+        self.stdout.write(
+            f"전체 계산: {elapsed:.1f}s ({len(matrix) / elapsed:.0f}개/초, 이웃 {pairs}개)"
+        )
+
+        new = np.arange(len(matrix) - options["new"], len(matrix))
+        elapsed, pairs = self.run(matrix, new)
+        self.stdout.write(
+            f"증분 계산({len(new)}개): {elapsed:.2f}s ({len(new) / elapsed:.0f}개/초)"
+        )
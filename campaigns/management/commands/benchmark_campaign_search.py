@@ -0,0 +1,45 @@
+import time
+from django.core.management.base import BaseCommand
+from campaigns.models import Campaign
+from campaigns.search import search_campaigns, legacy_search_campaigns
+
+
+class Command(BaseCommand):
+    """
+    작성자 : 최준영
+    내용 : 현재 DB에서 색인 검색과 기존 icontains 검색의 응답 시간을 비교하는 커맨드입니다.
+    캠페인 목록과 같은 방식으로 첫 페이지(6개)를 가져오는 시간을 잽니다.
+    ex) python manage.py benchmark_campaign_search 탄소 환경운동 --repeat 20
+    """
+
+    help = "색인 검색과 icontains 검색의 평균 응답 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("keywords", nargs="+", help="비교할 검색어 목록입니다.")
+        parser.add_argument("--repeat", type=int, default=10, help="검색어별 반복 횟수입니다.")
+        parser.add_argument("--page-size", type=int, default=6, help="가져올 캠페인 수입니다.")
+
+    def measure(self, search, keyword, repeat, page_size):
+        queryset = Campaign.objects.filter(status__gte=1).select_related("user", "fundings")
+        started = time.perf_counter()
+        for _ in range(repeat):
+            searched = search(queryset, keyword)
+            total = searched.count()
+            list(searched.order_by("-created_at")[:page_size])
+        elapsed = (time.perf_counter() - started) / repeat * 1000
+        return elapsed, total
+
+    def handle(self, *args, **options):
+        repeat = options["repeat"]
+        page_size = options["page_size"]
+        self.stdout.write(f"캠페인 {Campaign.objects.count()}개, 반복 {repeat}회")
+        for keyword in options["keywords"]:
+            legacy_ms, legacy_total = self.measure(
+                legacy_search_campaigns, keyword, repeat, page_size
+            )
+            index_ms, index_total = self.measure(search_campaigns, keyword, repeat, page_size)
+            self.stdout.write(
+                f"{keyword}: icontains {legacy_ms:.2f}ms ({legacy_total}건) / "
+                f"색인 {index_ms:.2f}ms ({index_total}건) / "
+                f"{legacy_ms / index_ms if index_ms else 0:.1f}배"
+            )
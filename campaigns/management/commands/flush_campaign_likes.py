@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from campaigns.likes import flush_likes
+
+
+class Command(BaseCommand):
+    """
+    작성자 : 최준영
+    내용 : 캐시 버퍼에 쌓인 좋아요 의도를 바로 DB에 반영하는 커맨드입니다.
+    배포나 캐시 서버 교체 전에 실행합니다.
+    ex) python manage.py flush_campaign_likes
+    """
+
+    help = "캐시 버퍼의 좋아요 토글을 DB에 반영합니다."
+
+    def handle(self, *args, **options):
+        flushed = flush_likes()
+        self.stdout.write(self.style.SUCCESS(f"좋아요 {flushed}건 반영 완료"))
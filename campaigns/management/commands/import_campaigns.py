@@ -0,0 +1,77 @@
+import json
+import os
+import time
+from django.core.management.base import BaseCommand, CommandError
+from users.models import User
+from campaigns.imports import PARSERS, import_campaigns
+
+
+class Command(BaseCommand):
+    """
+    작성자 : 최준영
+    내용 : JSON(배열/JSON Lines) 또는 CSV 파일의 캠페인을 펀딩, 태그와 함께 일괄 등록하는 커맨드입니다.
+    행별 오류는 --report 파일에 JSON Lines로 남기고, 없으면 앞의 몇 건만 출력합니다.
+    ex) python manage.py import_campaigns campaigns.csv --user admin@test.com --report errors.jsonl
+    """
+
+    help = "JSON/CSV 파일의 캠페인을 일괄 등록합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="등록할 파일 경로입니다.")
+        parser.add_argument(
+            "--format",
+            choices=sorted(PARSERS),
+            help="파일 형식입니다. 없으면 확장자로 정합니다.",
+        )
+        parser.add_argument(
+            "--user",
+            help="user_email이 없는 행의 작성자 이메일입니다.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 저장할 캠페인 수입니다.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="검증만 하고 저장하지 않습니다.",
+        )
+        parser.add_argument("--report", help="행별 오류를 JSON Lines로 저장할 경로입니다.")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        format = options["format"] or os.path.splitext(path)[1].lstrip(".").lower()
+        if format not in PARSERS:
+            raise CommandError("파일 형식은 json, jsonl, csv 중 하나여야 합니다.")
+        user = None
+        if options["user"]:
+            user = User.objects.filter(email=options["user"]).first()
+            if user is None:
+                raise CommandError(f"{options['user']} 유저가 없습니다.")
+
+        started = time.perf_counter()
+        with open(path, encoding="utf-8-sig", newline="") as stream:
+            report = import_campaigns(
+                stream,
+                format,
+                user=user,
+                batch_size=options["batch_size"],
+                dry_run=options["dry_run"],
+            )
+        elapsed = time.perf_counter() - started
+
+        if options["report"]:
+            with open(options["report"], "w", encoding="utf-8") as file:
+                for error in report["errors"]:
+                    file.write(json.dumps(error, ensure_ascii=False) + "\n")
+        else:
+            for error in report["errors"][:20]:
+                self.stderr.write(json.dumps(error, ensure_ascii=False))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{report['total']}행 중 {report['created']}개 등록, "
+                f"{report['failed']}행 오류 ({elapsed:.1f}초)"
+            )
+        )
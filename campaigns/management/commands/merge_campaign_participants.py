@@ -0,0 +1,83 @@
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count, Min
+from campaigns.models import Participant
+
+LEGACY_TABLE = "campaign_participant"
+
+
+class Command(BaseCommand):
+    """
+    작성자 : 최준영
+    내용 : 예전 Campaign.participant 자동 M2M 테이블(campaign_participant)과
+    Participant 테이블에 나뉘어 저장된 참가 기록을 Participant 한 테이블로 합치는 커맨드입니다.
+    1. 같은 캠페인/유저의 중복 Participant 행을 하나만 남기고 지웁니다.
+    2. M2M 테이블에만 있는 참가 기록을 Participant로 옮깁니다. (참가일은 실행 시각)
+    3. participant_count를 다시 계산합니다.
+    through 모델로 바꾸는 마이그레이션은 예전 테이블을 지우지 않도록
+    SeparateDatabaseAndState로 작성하고, 마이그레이션 전(중복 정리)과 후(이관)에 각각 실행합니다.
+    여러 번 실행해도 결과가 같습니다.
+    ex) python manage.py merge_campaign_participants --dry-run
+    """
+
+    help = "캠페인 참가 M2M 테이블과 Participant 테이블의 참가 기록을 Participant로 합칩니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="정리/이관할 행 수만 출력하고 수정하지 않습니다.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 옮길 참가 기록 수입니다.",
+        )
+
+    def handle(self, *args, **options):
+        self.remove_duplicates(options["dry_run"])
+        if LEGACY_TABLE in connection.introspection.table_names():
+            self.copy_legacy_rows(options["batch_size"], options["dry_run"])
+        else:
+            self.stdout.write(f"{LEGACY_TABLE} 테이블이 없어 이관을 건너뜁니다.")
+        if not options["dry_run"]:
+            Participant.objects.filter(is_participated=False).update(is_participated=True)
+            call_command("sync_campaign_counts", stdout=self.stdout)
+
+    def remove_duplicates(self, dry_run):
+        duplicates = (
+            Participant.objects.values("campaign_id", "user_id")
+            .annotate(keep_id=Min("id"), total=Count("id"))
+            .filter(total__gt=1)
+        )
+        removed = 0
+        with transaction.atomic():
+            for row in duplicates:
+                queryset = Participant.objects.filter(
+                    campaign_id=row["campaign_id"], user_id=row["user_id"]
+                ).exclude(id=row["keep_id"])
+                removed += queryset.count() if dry_run else queryset.delete()[0]
+        self.stdout.write(f"중복 참가 기록 {removed}개 정리")
+
+    def copy_legacy_rows(self, batch_size, dry_run):
+        existing = set(Participant.objects.values_list("campaign_id", "user_id"))
+        copied = 0
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT campaign_id, user_id FROM {connection.ops.quote_name(LEGACY_TABLE)}"
+            )
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                participants = [
+                    Participant(campaign_id=campaign_id, user_id=user_id, is_participated=True)
+                    for campaign_id, user_id in rows
+                    if (campaign_id, user_id) not in existing
+                ]
+                copied += len(participants)
+                if not dry_run:
+                    Participant.objects.bulk_create(participants, ignore_conflicts=True)
+        self.stdout.write(self.style.SUCCESS(f"참가 기록 {copied}개 이관 완료"))
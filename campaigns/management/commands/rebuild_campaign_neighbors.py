@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from campaigns.related import rebuild_neighbors, update_neighbors
+
+
+class Command(BaseCommand):
+    """
+    작성자 : 최준영
+    내용 : 관련 캠페인 테이블을 다시 계산하는 커맨드입니다.
+    --incremental을 주면 관련 캠페인이 아직 없는 새 캠페인만 계산해서 기존 목록에 끼워 넣습니다.
+    ex) python manage.py rebuild_campaign_neighbors --incremental
+    """
+
+    help = "캠페인 유사도 상위 목록(관련 캠페인)을 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="새 캠페인만 계산합니다.",
+        )
+
+    def handle(self, *args, **options):
+        if options["incremental"]:
+            count = update_neighbors()
+        else:
+            count = rebuild_neighbors()
+        self.stdout.write(self.style.SUCCESS(f"캠페인 {count}개 관련 캠페인 갱신 완료"))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from campaigns.search import rebuild_index
+
+
+class Command(BaseCommand):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 검색 색인을 처음부터 다시 만드는 커맨드입니다.
+    색인 도입 직후나 토크나이저/가중치를 바꾼 뒤 실행합니다.
+    ex) python manage.py rebuild_campaign_search_index --batch-size 1000
+    """
+
+    help = "캠페인 검색 색인을 전체 재생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 색인할 캠페인 수입니다.",
+        )
+
+    def handle(self, *args, **options):
+        total = rebuild_index(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"{total}개 캠페인 색인 완료"))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from campaigns.tags import rebuild_tag_stats
+
+
+class Command(BaseCommand):
+    """
+    작성자 : 최준영
+    내용 : 태그 통계와 트렌드 점수를 처음부터 다시 계산하는 커맨드입니다.
+    통계 테이블을 처음 만들었을 때나 시그널을 거치지 않고 태그를 수정한 뒤 실행합니다.
+    ex) python manage.py rebuild_campaign_tag_stats --batch-size 500
+    """
+
+    help = "캠페인 태그 통계와 트렌드 점수를 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 다시 집계할 태그 수입니다.",
+        )
+
+    def handle(self, *args, **options):
+        count = rebuild_tag_stats(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"태그 {count}개 통계 재계산 완료"))
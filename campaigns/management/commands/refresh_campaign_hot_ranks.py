@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from campaigns.hot import rebuild_hot_ranks, refresh_hot_ranks
+
+
+class Command(BaseCommand):
+    """
+    작성자 : 최준영
+    내용 : 인기순 정렬 점수(hot_rank)를 갱신하는 커맨드입니다.
+    기본은 활동이 쌓인 캠페인만 반영하고, --rebuild를 주면 참가/댓글/좋아요/결제 기록으로 모든 캠페인을 다시 계산합니다.
+    ex) python manage.py refresh_campaign_hot_ranks --rebuild
+    """
+
+    help = "캠페인 인기순 점수를 갱신합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="모든 캠페인의 점수를 처음부터 다시 계산합니다.",
+        )
+
+    def handle(self, *args, **options):
+        if options["rebuild"]:
+            count = rebuild_hot_ranks()
+        else:
+            count = refresh_hot_ranks()
+        self.stdout.write(self.style.SUCCESS(f"캠페인 {count}개 인기 점수 갱신 완료"))
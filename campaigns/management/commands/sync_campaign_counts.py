@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+from campaigns.models import Campaign, CampaignComment, CampaignReview, Participant
+from campaigns.querysets import count_subquery
+
+
+class Command(BaseCommand):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 카운터 필드(좋아요, 참가자, 댓글, 후기 수)를 실제 데이터와 맞추는 커맨드입니다.
+    캠페인마다 조회하지 않고 카운터별로 UPDATE 한 번으로 어긋난 값만 다시 계산합니다.
+    ex) python manage.py sync_campaign_counts --dry-run
+    """
+
+    help = "캠페인 카운터 필드를 실제 좋아요/참가자/댓글/후기 수로 재계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="어긋난 캠페인 수만 출력하고 수정하지 않습니다.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 트랜잭션에서 재계산할 캠페인 수입니다.",
+        )
+
+    def get_counters(self):
+        return {
+            "like_count": count_subquery(Campaign.like.through),
+            "participant_count": count_subquery(Participant),
+            "comment_count": count_subquery(CampaignComment),
+            "review_count": count_subquery(CampaignReview),
+        }
+
+    def handle(self, *args, **options):
+        for field, expression in self.get_counters().items():
+            drifted_ids = list(
+                Campaign.objects.annotate(actual=expression)
+                .exclude(**{field: F("actual")})
+                .values_list("id", flat=True)
+            )
+            if options["dry_run"]:
+                self.stdout.write(f"{field}: {len(drifted_ids)}개 캠페인 불일치")
+                continue
+
+            updated = 0
+            for start in range(0, len(drifted_ids), options["batch_size"]):
+                chunk = drifted_ids[start:start + options["batch_size"]]
+                with transaction.atomic():
+                    updated += Campaign.objects.filter(id__in=chunk).update(
+                        **{field: expression}
+                    )
+            self.stdout.write(self.style.SUCCESS(f"{field}: {updated}개 캠페인 재계산 완료"))
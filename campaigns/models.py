@@ -1,8 +1,11 @@
 from django.db import models
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
 from users.models import User
 from django.urls import reverse
 from config.models import BaseModel
 from taggit.managers import TaggableManager
+from taggit.models import Tag
 
 
 class Campaign(BaseModel):
@@ -11,12 +14,23 @@ class Campaign(BaseModel):
     내용 : 캠페인 모델 클래스입니다.
     is_funding의 BooleanField로 펀딩 여부를 체크하고
     status의 ChoiceField로 캠페인의 진행 상태를 체크합니다.
+    like_count 등 카운터 필드는 목록 조회 시 COUNT 쿼리를 피하기 위한 비정규화 필드입니다.
+    hot_rank는 인기순 정렬용 점수로, campaigns.hot이 hot_pending에 쌓인 최근 활동을 주기적으로 반영합니다.
+    neighbors_scored_at은 관련 캠페인을 계산한 시각으로, 비어 있으면 campaigns.related가 다음 갱신에서 계산합니다.
     최초 작성일 : 2023.06.06
-    업데이트 일자 : 2023.06.29
+    업데이트 일자 : 2023.07.09
     """
 
     class Meta:
         db_table = "campaign"
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="campaign_recent_idx"),
+            models.Index(fields=["campaign_end_date", "id"], name="campaign_closing_idx"),
+            models.Index(fields=["-hot_rank", "id"], name="campaign_hot_idx"),
+            models.Index(fields=["hot_pending"], name="campaign_hot_pending_idx"),
+            models.Index(fields=["-like_count", "id"], name="campaign_like_idx"),
+            models.Index(fields=["status", "campaign_end_date"], name="campaign_status_end_idx"),
+        ]
 
     STATUS_CHOICES = (
         (0, "미승인"),
@@ -36,7 +50,11 @@ class Campaign(BaseModel):
         User, verbose_name="작성자", on_delete=models.CASCADE, related_name="campaigns"
     )
     participant = models.ManyToManyField(
-        User, verbose_name="참가자", related_name="participants", blank=True
+        User,
+        verbose_name="참가자",
+        related_name="participants",
+        blank=True,
+        through="Participant",
     )
     like = models.ManyToManyField(
         User, verbose_name="좋아요", related_name="likes", blank=True
@@ -49,6 +67,7 @@ class Campaign(BaseModel):
     activity_start_date = models.DateTimeField("활동 시작일", blank=True, null=True)
     activity_end_date = models.DateTimeField("활동 마감일", blank=True, null=True)
     image = models.ImageField("이미지", blank=True, null=True, upload_to="campaign/%Y/%m/")
+    image_variants = models.JSONField("이미지 파생본", default=dict, blank=True)
     is_funding = models.BooleanField("펀딩여부", default=False)
     status = models.PositiveSmallIntegerField(
         "진행 상태", choices=STATUS_CHOICES, default=0
@@ -57,6 +76,19 @@ class Campaign(BaseModel):
         "카테고리", choices=CATEGORY_CHOICES, default=0
     )
     tags = TaggableManager(blank=True)
+    like_count = models.PositiveIntegerField("좋아요 수", default=0)
+    participant_count = models.PositiveIntegerField("참가자 수", default=0)
+    comment_count = models.PositiveIntegerField("댓글 수", default=0)
+    review_count = models.PositiveIntegerField("후기 수", default=0)
+    hot_rank = models.FloatField("인기 순위값", default=0)
+    hot_pending = models.FloatField("반영 전 활동 점수", default=0)
+    neighbors_scored_at = models.DateTimeField("관련 캠페인 계산 일시", null=True, blank=True)
+
+    COUNTER_FIELDS = ("like_count", "participant_count", "comment_count", "review_count")
+    # 카운터가 1 늘 때 인기 점수에 더할 가중치, 줄면 같은 만큼 뺍니다.
+    HOT_WEIGHTS = {"participant_count": 3, "comment_count": 2, "like_count": 1}
+    # 펀딩은 이 금액(원)마다 1점입니다.
+    HOT_FUNDING_UNIT = 10000
 
     def __str__(self):
         return str(self.title)
@@ -64,6 +96,34 @@ class Campaign(BaseModel):
     def get_absolute_url(self):
         return reverse("campaign_detail_view", kwargs={"campaign_id": self.id})
 
+    @classmethod
+    def update_counts(cls, campaign_id, **deltas):
+        """
+        카운터 필드를 F 표현식으로 증감시키는 함수입니다.
+        ex) Campaign.update_counts(campaign.id, like_count=1)
+        음수가 되지 않도록 0 미만은 0으로 맞춥니다.
+        같은 UPDATE에서 HOT_WEIGHTS만큼 hot_pending도 증감합니다.
+        """
+        values = {
+            field: Greatest(F(field) + delta, Value(0))
+            for field, delta in deltas.items()
+            if field in cls.COUNTER_FIELDS and delta
+        }
+        hot = sum(cls.HOT_WEIGHTS.get(field, 0) * delta for field, delta in deltas.items())
+        if values and hot:
+            values["hot_pending"] = F("hot_pending") + hot
+        if values:
+            cls.objects.filter(id=campaign_id).update(**values)
+
+    @classmethod
+    def add_hot_activity(cls, campaign_id, weight):
+        """
+        카운터가 없는 활동(펀딩 등)의 점수를 hot_pending에 더합니다.
+        ex) Campaign.add_hot_activity(campaign.id, amount / Campaign.HOT_FUNDING_UNIT)
+        """
+        if weight:
+            cls.objects.filter(id=campaign_id).update(hot_pending=F("hot_pending") + weight)
+
 
 class CampaignReview(BaseModel):
     """
@@ -85,6 +145,7 @@ class CampaignReview(BaseModel):
     image = models.ImageField(
         "캠페인 리뷰 이미지", blank=True, null=True, upload_to="review/%Y/%m/"
     )
+    image_variants = models.JSONField("이미지 파생본", default=dict, blank=True)
 
     def __str__(self):
         return str(self.title)
@@ -127,6 +188,9 @@ class Funding(BaseModel):
 
     class Meta:
         db_table = "funding"
+        indexes = [
+            models.Index(fields=["-amount", "campaign"], name="funding_amount_idx"),
+        ]
 
     campaign = models.OneToOneField(
         Campaign, on_delete=models.CASCADE, related_name="fundings"
@@ -146,13 +210,293 @@ class Participant(models.Model):
     작성자 : 장소은
     내용 : 캠페인 참가자에게 시작일 전 알림을 보내기 위한 모델
     작성일 : 2023.06.22
+    업데이트 일자 : 2023.07.08 (Campaign.participant의 through 모델로 통합, 참가일 추가)
     '''
 
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="campaign_participant_user")
     campaign = models.ForeignKey(
         Campaign, on_delete=models.CASCADE, related_name="campaign_key")
-    is_participated = models.BooleanField(default=False)
+    is_participated = models.BooleanField(default=True)
+    created_at = models.DateTimeField("참가일", auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["campaign", "user"], name="campaign_participant_unique"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.campaign.title}"
+
+
+class CampaignSearchIndex(models.Model):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 키워드 검색용 역색인 모델입니다.
+    campaigns.search의 토크나이저로 만든 n-gram(term)마다
+    캠페인별 가중치(필드 가중치 x 등장 횟수)를 저장합니다.
+    최초 작성일 : 2023.07.06
+    """
+
+    class Meta:
+        db_table = "campaign_search_index"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["term", "campaign"], name="unique_campaign_search_term"
+            ),
+        ]
+
+    term = models.CharField("검색어 토큰", max_length=20)
+    campaign = models.ForeignKey(
+        Campaign, on_delete=models.CASCADE, related_name="search_terms"
+    )
+    weight = models.PositiveIntegerField("가중치", default=0)
+
+    def __str__(self):
+        return f"{self.term} - {self.campaign_id}"
+
+
+class CampaignTagStat(models.Model):
+    """
+    작성자 : 최준영
+    내용 : 태그별 캠페인 수를 상태, 카테고리 단위로 미리 집계해 두는 모델입니다.
+    태그가 바뀐 캠페인의 태그만 campaigns.tags에서 다시 집계합니다.
+    최초 작성일 : 2023.07.08
+    """
+
+    class Meta:
+        db_table = "campaign_tag_stat"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tag", "status", "category"], name="unique_campaign_tag_stat"
+            ),
+        ]
+
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name="campaign_stats")
+    status = models.PositiveSmallIntegerField("진행 상태", choices=Campaign.STATUS_CHOICES)
+    category = models.PositiveSmallIntegerField("카테고리", choices=Campaign.CATEGORY_CHOICES)
+    campaign_count = models.PositiveIntegerField("캠페인 수", default=0)
+
+    def __str__(self):
+        return f"{self.tag_id} - {self.status}/{self.category}: {self.campaign_count}"
+
+
+class CampaignTagTrend(models.Model):
+    """
+    작성자 : 최준영
+    내용 : 태그의 최근 사용량(트렌드 점수)을 저장하는 모델입니다.
+    점수는 반감기마다 절반으로 줄어드는데, 시각에 따라 바뀌는 점수 대신
+    rank = log2(점수) + 경과 반감기 수를 저장해서 rank 순서가 곧 현재 점수 순서가 되게 합니다.
+    최초 작성일 : 2023.07.08
+    """
+
+    class Meta:
+        db_table = "campaign_tag_trend"
+
+    tag = models.OneToOneField(
+        Tag, on_delete=models.CASCADE, primary_key=True, related_name="campaign_trend"
+    )
+    rank = models.FloatField("트렌드 순위값", db_index=True)
+
+    def __str__(self):
+        return f"{self.tag_id} - {self.rank}"
+
+
+class CampaignNeighbor(models.Model):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 상세 페이지의 관련 캠페인을 미리 계산해 저장하는 모델입니다.
+    태그, 카테고리, 참가자, 좋아요 유저로 만든 벡터의 코사인 유사도 상위 캠페인을
+    rank 순서로 저장하고, 상세 조회 시 (campaign, rank) 인덱스로 한 번에 가져옵니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    class Meta:
+        db_table = "campaign_neighbor"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["campaign", "rank"], name="unique_campaign_neighbor_rank"
+            ),
+        ]
+
+    campaign = models.ForeignKey(
+        Campaign, on_delete=models.CASCADE, related_name="neighbors"
+    )
+    neighbor = models.ForeignKey(
+        Campaign, on_delete=models.CASCADE, related_name="neighbor_of"
+    )
+    rank = models.PositiveSmallIntegerField("순위")
+    score = models.FloatField("유사도")
+
+    def __str__(self):
+        return f"{self.campaign_id} - {self.rank}: {self.neighbor_id}"
+
+
+class ArchivedCampaign(models.Model):
+    """
+    작성자 : 최준영
+    내용 : 종료/실패 후 보관 기간이 지난 캠페인을 옮겨 두는 보관 테이블입니다.
+    campaigns.archive가 Campaign의 행을 id 그대로 복사하고 태그는 이름 목록(tag_names)으로 남깁니다.
+    상세, 후기, 댓글 조회에서만 읽으며 수정하지 않습니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    class Meta:
+        db_table = "campaign_archive"
+
+    STATUS_CHOICES = Campaign.STATUS_CHOICES
+    CATEGORY_CHOICES = Campaign.CATEGORY_CHOICES
+
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(
+        User, verbose_name="작성자", on_delete=models.CASCADE, related_name="archived_campaigns"
+    )
+    title = models.CharField("제목", max_length=50)
+    content = models.TextField("내용")
+    members = models.PositiveIntegerField("모집 인원")
+    campaign_start_date = models.DateTimeField("캠페인 시작일")
+    campaign_end_date = models.DateTimeField("캠페인 마감일")
+    activity_start_date = models.DateTimeField("활동 시작일", blank=True, null=True)
+    activity_end_date = models.DateTimeField("활동 마감일", blank=True, null=True)
+    image = models.ImageField("이미지", blank=True, null=True, upload_to="campaign/%Y/%m/")
+    image_variants = models.JSONField("이미지 파생본", default=dict, blank=True)
+    is_funding = models.BooleanField("펀딩여부", default=False)
+    status = models.PositiveSmallIntegerField("진행 상태", choices=STATUS_CHOICES)
+    category = models.PositiveSmallIntegerField("카테고리", choices=CATEGORY_CHOICES)
+    tag_names = models.JSONField("태그", default=list, blank=True)
+    like_count = models.PositiveIntegerField("좋아요 수", default=0)
+    participant_count = models.PositiveIntegerField("참가자 수", default=0)
+    comment_count = models.PositiveIntegerField("댓글 수", default=0)
+    review_count = models.PositiveIntegerField("후기 수", default=0)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField("보관일", db_index=True)
+
+    def __str__(self):
+        return str(self.title)
+
+    def get_absolute_url(self):
+        return reverse("campaign_detail_view", kwargs={"campaign_id": self.id})
+
+
+class ArchivedFunding(models.Model):
+    """
+    작성자 : 최준영
+    내용 : 보관된 캠페인의 펀딩 보관 테이블입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    class Meta:
+        db_table = "funding_archive"
+
+    id = models.BigIntegerField(primary_key=True)
+    campaign = models.OneToOneField(
+        ArchivedCampaign, on_delete=models.CASCADE, related_name="fundings"
+    )
+    goal = models.PositiveIntegerField("펀딩 목표 금액")
+    amount = models.PositiveIntegerField("펀딩 현재 금액", default=0)
+    approve_file = models.FileField(
+        "펀딩 승인 파일", upload_to="funding/%Y/%m/", null=True, blank=True
+    )
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    def __str__(self):
+        return str(self.goal)
+
+
+class ArchivedCampaignReview(models.Model):
+    """
+    작성자 : 최준영
+    내용 : 보관된 캠페인의 후기 보관 테이블입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    class Meta:
+        db_table = "campaign_review_archive"
+
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="archived_reviews")
+    campaign = models.ForeignKey(
+        ArchivedCampaign, on_delete=models.CASCADE, related_name="reviews"
+    )
+    title = models.CharField("캠페인 리뷰 제목", max_length=50)
+    content = models.TextField("캠페인 리뷰 내용")
+    image = models.ImageField(
+        "캠페인 리뷰 이미지", blank=True, null=True, upload_to="review/%Y/%m/"
+    )
+    image_variants = models.JSONField("이미지 파생본", default=dict, blank=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    def __str__(self):
+        return str(self.title)
+
+
+class ArchivedCampaignComment(models.Model):
+    """
+    작성자 : 최준영
+    내용 : 보관된 캠페인의 댓글 보관 테이블입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    class Meta:
+        db_table = "campaign_comment_archive"
+
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="archived_comments")
+    campaign = models.ForeignKey(
+        ArchivedCampaign, on_delete=models.CASCADE, related_name="comments"
+    )
+    content = models.TextField("캠페인 댓글 내용")
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    def __str__(self):
+        return str(self.content)
+
+
+class ArchivedParticipant(models.Model):
+    """
+    작성자 : 최준영
+    내용 : 보관된 캠페인의 참가자 보관 테이블입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    class Meta:
+        db_table = "campaign_participant_archive"
+
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="archived_participations"
+    )
+    campaign = models.ForeignKey(
+        ArchivedCampaign, on_delete=models.CASCADE, related_name="participants"
+    )
+    is_participated = models.BooleanField(default=True)
+    created_at = models.DateTimeField("참가일")
+
+    def __str__(self):
+        return f"{self.user_id} - {self.campaign_id}"
+
+
+class ArchivedCampaignLike(models.Model):
+    """
+    작성자 : 최준영
+    내용 : 보관된 캠페인의 좋아요 보관 테이블입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    class Meta:
+        db_table = "campaign_like_archive"
+
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="archived_likes")
+    campaign = models.ForeignKey(
+        ArchivedCampaign, on_delete=models.CASCADE, related_name="likes"
+    )
+
+    def __str__(self):
+        return f"{self.user_id} - {self.campaign_id}"
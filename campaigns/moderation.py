@@ -0,0 +1,113 @@
+"""
+작성자 : 최준영
+내용 : 백오피스 캠페인 일괄 상태 변경(승인/반려) 모듈입니다.
+요청한 캠페인의 현재 상태를 한 번에 조회해 허용된 변경만 골라내고,
+바뀌기 전 상태별로 UPDATE 한 번씩 실행한 뒤 캠페인별 결과를 돌려줍니다.
+작성자 알림은 커밋 후에 bulk_create 한 번과 웹소켓 메세지 한 번으로 보냅니다.
+최초 작성일 : 2023.07.09
+"""
+import json
+from collections import defaultdict
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+from django.utils import timezone
+from alarms.models import Notification
+from campaigns.models import Campaign
+from campaigns.signals import campaigns_transitioned
+
+# 변경할 상태: 변경 전에 허용되는 상태
+# 종료(2)는 마감 스케줄러만 바꾸므로 일괄 변경 대상이 아닙니다.
+ALLOWED_TRANSITIONS = {
+    1: {0},
+    0: {1},
+    3: {0, 1},
+}
+MODERATION_MESSAGES = {
+    1: "{title} 캠페인이 승인되었습니다.",
+    0: "{title} 캠페인의 승인이 취소되었습니다.",
+    3: "{title} 캠페인이 반려되었습니다.",
+}
+MAX_CAMPAIGNS = 500
+
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+INVALID_TRANSITION = "invalid_transition"
+NOT_FOUND = "not_found"
+
+
+def moderate_campaigns(campaign_ids, to_status):
+    """
+    campaign_ids의 상태를 to_status로 바꾸고 [{"id", "from_status", "result"}] 목록을 요청 순서대로 반환합니다.
+    result는 updated, unchanged(이미 같은 상태), invalid_transition(허용되지 않는 변경), not_found 중 하나입니다.
+    """
+    campaign_ids = list(dict.fromkeys(campaign_ids))
+    allowed = ALLOWED_TRANSITIONS[to_status]
+    now = timezone.now()
+
+    with transaction.atomic():
+        current = dict(
+            Campaign.objects.select_for_update()
+            .filter(id__in=campaign_ids)
+            .values_list("id", "status")
+        )
+        groups = defaultdict(list)
+        for campaign_id, from_status in current.items():
+            if from_status in allowed:
+                groups[from_status].append(campaign_id)
+
+        updated = set()
+        for from_status, ids in groups.items():
+            Campaign.objects.filter(id__in=ids, status=from_status).update(
+                status=to_status, updated_at=now
+            )
+            updated.update(ids)
+            campaigns_transitioned.send(
+                sender=Campaign,
+                campaign_ids=ids,
+                from_status=from_status,
+                to_status=to_status,
+            )
+
+        if updated:
+            transaction.on_commit(lambda: notify_moderated(updated, to_status))
+
+    results = []
+    for campaign_id in campaign_ids:
+        from_status = current.get(campaign_id)
+        if from_status is None:
+            result = NOT_FOUND
+        elif campaign_id in updated:
+            result = UPDATED
+        elif from_status == to_status:
+            result = UNCHANGED
+        else:
+            result = INVALID_TRANSITION
+        results.append({"id": campaign_id, "from_status": from_status, "result": result})
+    return results
+
+
+def notify_moderated(campaign_ids, to_status):
+    """
+    상태가 바뀐 캠페인 작성자들의 알림을 한 번에 저장하고, 알림 그룹에 메세지를 한 번 보냅니다.
+    """
+    campaigns = Campaign.objects.filter(id__in=list(campaign_ids)).values_list(
+        "id", "user_id", "title"
+    )
+    template = MODERATION_MESSAGES[to_status]
+    Notification.objects.bulk_create(
+        [
+            Notification(user_id=user_id, message=template.format(title=title))
+            for _, user_id, title in campaigns
+        ]
+    )
+    message = {
+        "type": "notification_message",
+        "message": f"캠페인 {len(campaign_ids)}건의 상태가 변경되었습니다.",
+        "campaign_ids": sorted(campaign_ids),
+        "status": to_status,
+    }
+    async_to_sync(get_channel_layer().group_send)(
+        "notification_group",
+        {"type": "notification_message", "message": json.dumps(message, ensure_ascii=False)},
+    )
@@ -0,0 +1,102 @@
+"""
+작성자 : 최준영
+내용 : 마이페이지 대시보드 모듈입니다.
+작성한 캠페인, 참가한 캠페인, 좋아요한 캠페인, 작성한 후기, 작성한 댓글을 섹션으로 나눠
+섹션별 개수와 첫 페이지를 한 번에 만들고, 더 보기는 섹션별 커서로 이어서 가져옵니다.
+개수는 서브쿼리로 한 번에, 섹션마다 목록 쿼리 한 번씩 가져오므로 데이터 양과 상관없이 쿼리 수가 일정합니다.
+최초 작성일 : 2023.07.09
+"""
+from django.urls import reverse
+from campaigns.models import Campaign, CampaignComment, CampaignReview, Participant
+from campaigns.pagination import FirstPagePagination, KeysetPagination
+from campaigns.querysets import count_subquery
+from campaigns.serializers import (
+    CampaignCommentSerializer,
+    CampaignReviewSerializer,
+    MyCampaingSerializer,
+)
+from config.prefetch import plan_queryset
+from users.models import User
+
+PAGE_SIZE = 6
+
+# 섹션 이름: (유저별 queryset, keyset 정렬, 시리얼라이저)
+SECTIONS = {
+    "campaigns": (
+        lambda user: Campaign.objects.filter(user=user),
+        ("-created_at", "-id"),
+        MyCampaingSerializer,
+    ),
+    "attends": (
+        lambda user: Campaign.objects.filter(participant=user),
+        ("-campaign_end_date", "-id"),
+        MyCampaingSerializer,
+    ),
+    "likes": (
+        lambda user: Campaign.objects.filter(like=user),
+        ("-id",),
+        MyCampaingSerializer,
+    ),
+    "reviews": (
+        lambda user: CampaignReview.objects.filter(user=user),
+        ("-created_at", "-id"),
+        CampaignReviewSerializer,
+    ),
+    "comments": (
+        lambda user: CampaignComment.objects.filter(user=user),
+        ("-created_at", "-id"),
+        CampaignCommentSerializer,
+    ),
+}
+
+
+def get_counts(user):
+    """
+    섹션별 개수를 쿼리 한 번으로 반환합니다.
+    """
+    counts = (
+        User.objects.filter(id=user.id)
+        .annotate(
+            campaign_count=count_subquery(Campaign, "user_id"),
+            attend_count=count_subquery(Participant, "user_id"),
+            like_count=count_subquery(Campaign.like.through, "user_id"),
+            review_count=count_subquery(CampaignReview, "user_id"),
+            comment_count=count_subquery(CampaignComment, "user_id"),
+        )
+        .values_list(
+            "campaign_count", "attend_count", "like_count", "review_count", "comment_count"
+        )
+        .get()
+    )
+    return dict(zip(SECTIONS, counts))
+
+
+def get_section(request, name, first_page=False, page_size=PAGE_SIZE):
+    """
+    섹션의 한 페이지를 {"next": 다음 페이지 주소, "results": 목록}으로 반환합니다.
+    다음 페이지 주소는 대시보드가 아니라 섹션 더 보기 주소를 가리킵니다.
+    """
+    queryset, ordering, serializer_class = SECTIONS[name]
+    pagination_class = FirstPagePagination if first_page else KeysetPagination
+    paginator = pagination_class(
+        ordering=ordering,
+        page_size=page_size,
+        base_url=request.build_absolute_uri(reverse("mypage_section", kwargs={"section": name})),
+    )
+    page = paginator.paginate_queryset(
+        plan_queryset(queryset(request.user), serializer_class), request
+    )
+    return {
+        "next": paginator.get_next_link(),
+        "results": serializer_class(page, many=True).data,
+    }
+
+
+def get_dashboard(request):
+    """
+    섹션별 개수와 첫 페이지를 모은 대시보드 응답 데이터를 반환합니다.
+    """
+    data = {"counts": get_counts(request.user)}
+    for name in SECTIONS:
+        data[name] = get_section(request, name, first_page=True)
+    return data
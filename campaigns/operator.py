@@ -1,7 +1,14 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from django_apscheduler.jobstores import DjangoJobStore
+from django.conf import settings
 from .views import CampaignStatusChecker
+from .archive import archive_campaigns
+from .hot import refresh_hot_ranks
+from .likes import flush_likes
+from .related import rebuild_neighbors, update_neighbors
+from .deadlines import scheduler as deadline_scheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 
 def start():
@@ -9,7 +16,7 @@ def start():
     작성자 : 최준영
     내용 : 캠페인 status 체크 실행 함수입니다.
     최초 작성일 : 2023.06.08
-    업데이트 일자 : 2023.07.07
+    업데이트 일자 : 2023.07.09
     """
     campaign_scheduler = BackgroundScheduler()
     campaign_scheduler.add_jobstore(DjangoJobStore(), "djangojobstore")
@@ -24,4 +31,32 @@ def start():
         checker = CampaignStatusChecker()
         checker.check_funding_success()
 
+    @campaign_scheduler.scheduled_job(CronTrigger(minute=10), name='update_campaign_neighbors')
+    def update_campaign_neighbors_job():
+        update_neighbors()
+
+    @campaign_scheduler.scheduled_job(CronTrigger(hour=4), name='rebuild_campaign_neighbors')
+    def rebuild_campaign_neighbors_job():
+        rebuild_neighbors()
+
+    @campaign_scheduler.scheduled_job(
+        IntervalTrigger(seconds=settings.CAMPAIGN_HOT_REFRESH_INTERVAL), name='refresh_campaign_hot_ranks'
+    )
+    def refresh_campaign_hot_ranks_job():
+        refresh_hot_ranks()
+
+    @campaign_scheduler.scheduled_job(CronTrigger(hour=3), name='archive_campaigns')
+    def archive_campaigns_job():
+        archive_campaigns()
+
+    if settings.CAMPAIGN_LIKE_BUFFER:
+        @campaign_scheduler.scheduled_job(
+            IntervalTrigger(seconds=settings.CAMPAIGN_LIKE_FLUSH_INTERVAL), name='flush_campaign_likes'
+        )
+        def flush_campaign_likes_job():
+            flush_likes()
+
     campaign_scheduler.start()
+
+    # 마감 시각에 맞춰 상태를 바꾸는 스케줄러, 위 cron 작업은 누락 대비용으로 유지합니다.
+    deadline_scheduler.start()
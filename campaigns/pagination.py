@@ -0,0 +1,136 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    작성자 : 최준영
+    내용 : OFFSET 없이 마지막으로 본 행의 정렬 값 다음부터 가져오는 커서(keyset) 페이지네이션입니다.
+    ordering의 마지막 필드는 반드시 id 같은 유일한 값이어야 같은 값이 있어도 순서가 고정됩니다.
+    COUNT 쿼리를 하지 않으므로 응답에 count는 없고 next, previous, results만 있습니다.
+    base_url을 주면 현재 요청 주소 대신 그 주소에 cursor를 붙여 링크를 만듭니다.
+    ex) KeysetPagination(ordering=("-created_at", "-id"))
+    최초 작성일 : 2023.07.06
+    """
+
+    page_size = 6
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "잘못된 cursor 입니다."
+
+    def __init__(self, ordering=("-id",), page_size=None, base_url=None):
+        self.ordering = tuple(ordering)
+        self.base_url = base_url
+        if page_size:
+            self.page_size = page_size
+
+    def encode_cursor(self, values, reverse):
+        data = json.dumps({"v": values, "r": reverse}, default=str)
+        return urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+    def get_cursor(self, request):
+        return request.query_params.get(self.cursor_query_param)
+
+    def decode_cursor(self, request):
+        encoded = self.get_cursor(request)
+        if not encoded:
+            return None, False
+        try:
+            data = json.loads(urlsafe_b64decode(encoded.encode("ascii")).decode("utf-8"))
+            values, reverse = data["v"], bool(data["r"])
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    def get_fields(self, reverse):
+        """
+        ordering을 (필드명, 내림차순 여부) 목록으로 바꿉니다.
+        reverse면 이전 페이지를 위해 방향을 뒤집습니다.
+        """
+        fields = []
+        for field in self.ordering:
+            descending = field.startswith("-")
+            fields.append((field.lstrip("-"), descending != reverse))
+        return fields
+
+    def get_position_filter(self, fields, values):
+        """
+        (a, b, id) > (va, vb, vid) 같은 행 비교를
+        a > va OR (a = va AND b > vb) OR ... 형태의 Q로 만듭니다.
+        """
+        position = Q()
+        equal = {}
+        for (name, descending), value in zip(fields, values):
+            lookup = "lt" if descending else "gt"
+            position |= Q(**equal, **{f"{name}__{lookup}": value})
+            equal[name] = value
+        return position
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        values, reverse = self.decode_cursor(request)
+        fields = self.get_fields(reverse)
+
+        queryset = queryset.order_by(
+            *[f"-{name}" if descending else name for name, descending in fields]
+        )
+        if values is not None:
+            queryset = queryset.filter(self.get_position_filter(fields, values))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+
+        self.has_next = has_more if not reverse else values is not None
+        self.has_previous = values is not None if not reverse else has_more
+        self.page = results
+        return results
+
+    def get_position(self, instance):
+        return [getattr(instance, field.lstrip("-")) for field in self.ordering]
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        cursor = self.encode_cursor(self.get_position(self.page[-1]), False)
+        url = self.base_url or self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        cursor = self.encode_cursor(self.get_position(self.page[0]), True)
+        url = self.base_url or self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+
+class FirstPagePagination(KeysetPagination):
+    """
+    작성자 : 최준영
+    내용 : 요청 주소의 cursor와 상관없이 항상 첫 페이지를 보여주는 페이지네이션입니다.
+    대시보드, 상세 묶음 응답처럼 여러 목록의 첫 페이지를 한 응답에 담고, 다음 페이지는 base_url로 이어갈 때 사용합니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    def get_cursor(self, request):
+        return None
@@ -0,0 +1,102 @@
+"""
+작성자 : 최준영
+내용 : 캠페인 펀딩 진행률 실시간 전송 모듈입니다.
+결제로 펀딩 금액이 바뀌면 커밋 후에 진행률(금액, 목표, 퍼센트, 후원자 수)을 한 번 계산해서
+캠페인별 채널 그룹(funding_<campaign_id>)에 보내고, 컨슈머가 초당 전송 횟수를 제한해 클라이언트에 전달합니다.
+보내는 쪽도 캠페인별로 초당 FUNDING_PROGRESS_MAX_RATE번까지만 계산, 전송합니다.
+시간을 1/FUNDING_PROGRESS_MAX_RATE초 구간으로 나눠 구간마다 캐시 키를 먼저 잡은 워커만 보내고,
+이미 보낸 구간에 들어온 결제는 다음 구간에 한 번 보내도록 예약해서 마지막 금액이 빠지지 않게 합니다.
+최초 작성일 : 2023.07.09
+"""
+import logging
+import threading
+import time
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from campaigns.models import Funding
+from payments.models import Payment
+
+logger = logging.getLogger(__name__)
+
+GROUP_NAME = "funding_{campaign_id}"
+SENT_KEY = "funding_progress:{campaign_id}:{slot}:sent"
+SCHEDULED_KEY = "funding_progress:{campaign_id}:{slot}:scheduled"
+# 구간 키는 구간이 지나면 필요 없으므로 짧게 둡니다.
+SLOT_KEY_TIMEOUT = 10
+# 예약결제 대기 중, 예약결제 완료인 결제만 후원으로 셉니다.
+DONATION_STATUSES = (0, 5)
+
+
+def group_name(campaign_id):
+    return GROUP_NAME.format(campaign_id=campaign_id)
+
+
+def get_funding_progress(campaign_id):
+    """
+    캠페인의 펀딩 진행률을 반환합니다. 펀딩이 없는 캠페인이면 None을 반환합니다.
+    """
+    funding = Funding.objects.filter(campaign_id=campaign_id).values("amount", "goal").first()
+    if funding is None:
+        return None
+    donor_count = (
+        Payment.objects.filter(campaign_id=campaign_id, status__in=DONATION_STATUSES)
+        .values("user_id")
+        .distinct()
+        .count()
+    )
+    goal = funding["goal"]
+    return {
+        "campaign_id": campaign_id,
+        "amount": funding["amount"],
+        "goal": goal,
+        "percent": round(funding["amount"] / goal * 100, 1) if goal else 0,
+        "donor_count": donor_count,
+    }
+
+
+def publish_funding_progress(campaign_id):
+    """
+    현재 진행률을 캠페인 그룹에 보냅니다. 결제 트랜잭션의 on_commit에서 호출합니다.
+    이번 구간에 이미 보냈으면 다음 구간으로 한 번만 예약합니다.
+    결제는 이미 커밋되었으므로 전송에 실패해도 기록만 남기고 예외를 올리지 않습니다.
+    """
+    rate = settings.FUNDING_PROGRESS_MAX_RATE
+    slot = int(time.time() * rate)
+    try:
+        if cache.add(SENT_KEY.format(campaign_id=campaign_id, slot=slot), 1, SLOT_KEY_TIMEOUT):
+            send_funding_progress(campaign_id)
+        elif cache.add(
+            SCHEDULED_KEY.format(campaign_id=campaign_id, slot=slot + 1), 1, SLOT_KEY_TIMEOUT
+        ):
+            timer = threading.Timer(
+                (slot + 1) / rate - time.time(), publish_scheduled, args=(campaign_id, slot + 1)
+            )
+            timer.daemon = True
+            timer.start()
+    except Exception:
+        logger.exception("funding progress publish failed: campaign_id=%s", campaign_id)
+
+
+def publish_scheduled(campaign_id, slot):
+    """
+    예약한 구간이 되면 진행률을 보냅니다. 그 구간에 다른 결제가 먼저 보냈으면 건너뜁니다.
+    """
+    try:
+        if cache.add(SENT_KEY.format(campaign_id=campaign_id, slot=slot), 1, SLOT_KEY_TIMEOUT):
+            send_funding_progress(campaign_id)
+    except Exception:
+        logger.exception("funding progress publish failed: campaign_id=%s", campaign_id)
+    finally:
+        connection.close()
+
+
+def send_funding_progress(campaign_id):
+    progress = get_funding_progress(campaign_id)
+    if progress is None:
+        return
+    async_to_sync(get_channel_layer().group_send)(
+        group_name(campaign_id), {"type": "funding.progress", "progress": progress}
+    )
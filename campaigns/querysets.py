@@ -0,0 +1,22 @@
+"""
+작성자 : 최준영
+내용 : 캠페인 앱에서 여러 곳이 같이 쓰는 queryset 표현식 모듈입니다.
+최초 작성일 : 2023.07.06
+"""
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def count_subquery(model, field_name="campaign_id"):
+    """
+    field_name(캠페인, 유저 등)별 개수를 구하는 서브쿼리를 반환합니다.
+    행이 없으면 0으로 처리합니다.
+    """
+    queryset = (
+        model.objects.filter(**{field_name: OuterRef("pk")})
+        .order_by()
+        .values(field_name)
+        .annotate(total=Count("*"))
+        .values("total")
+    )
+    return Coalesce(Subquery(queryset, output_field=IntegerField()), Value(0))
@@ -0,0 +1,365 @@
+"""
+작성자 : 최준영
+내용 : 관련 캠페인 추천 모듈입니다.
+캠페인마다 태그, 카테고리, 참가자, 좋아요 유저를 특성으로 하는 희소 벡터를 만들고
+코사인 유사도가 높은 상위 캠페인을 CampaignNeighbor 테이블에 저장합니다.
+유사도는 캠페인 묶음(batch)마다 특성별 캠페인 목록(역색인)을 펼쳐 NumPy로 한 번에 더해서 계산하므로
+캠페인끼리 모든 쌍을 비교하지 않고, 특성을 공유하는 캠페인만 점수를 받습니다.
+벡터와 IDF는 공개된 캠페인 전체로 계산하지만, 추천 후보는 목록의 진행중(end=N) 필터에 걸리는 캠페인만 둡니다.
+최초 작성일 : 2023.07.09
+"""
+from collections import defaultdict
+import numpy as np
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Count, Min
+from django.utils import timezone
+from taggit.models import TaggedItem
+from campaigns.cache import bump_detail_generations
+from campaigns.facets import filter_campaigns
+from campaigns.models import Campaign, CampaignNeighbor, Participant
+
+NEIGHBOR_COUNT = 10
+# 묶음 하나의 점수 행렬(BATCH_SIZE x 캠페인 수)이 메모리에 올라가므로 너무 크게 잡지 않습니다.
+BATCH_SIZE = 64
+
+# 특성 종류별 가중치입니다. 같은 태그를 단 캠페인을 같은 유저가 참가한 캠페인보다 가깝게 봅니다.
+FEATURE_WEIGHTS = {
+    "tag": 3.0,
+    "participant": 2.0,
+    "like": 1.0,
+    "category": 1.0,
+}
+
+
+def concat_ranges(starts, lengths):
+    """
+    [starts[i], starts[i] + lengths[i]) 구간들을 이어 붙인 인덱스 배열을 반환합니다.
+    """
+    offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return np.repeat(starts, lengths) + np.arange(lengths.sum()) - offsets
+
+
+class FeatureMatrix:
+    """
+    캠페인 x 특성 희소 행렬입니다.
+    같은 값을 행(캠페인) 기준(CSR)과 열(특성) 기준(CSC)으로 한 번씩 정렬해서 들고 있습니다.
+    각 특성의 값은 가중치 x IDF이고, 행마다 길이가 1이 되도록 정규화해서 내적이 곧 코사인 유사도가 됩니다.
+    """
+
+    def __init__(self, ids, features, recommendable=None):
+        """
+        ids: 정렬된 캠페인 id 배열
+        features: {특성 종류: (캠페인 id 배열, 특성 값 배열)}
+        recommendable: 추천 후보 캠페인 id 배열, 없으면 전체 캠페인이 후보입니다.
+        """
+        self.ids = np.asarray(ids, dtype=np.int64)
+        size = len(self.ids)
+        self.recommendable = np.ones(size, dtype=bool)
+        if recommendable is not None:
+            self.recommendable[:] = False
+            self.recommendable[self.index(recommendable)] = True
+        rows, cols, values = [], [], []
+        col_count = 0
+        for kind, (owner_ids, keys) in features.items():
+            owner_ids = np.asarray(owner_ids, dtype=np.int64)
+            keys = np.asarray(keys, dtype=np.int64)
+            if not size or not len(owner_ids):
+                continue
+            position, found = self.locate(owner_ids)
+            unique_keys, kind_cols = np.unique(keys[found], return_inverse=True)
+            kind_cols = kind_cols.ravel()
+            idf = np.log1p(size / np.bincount(kind_cols, minlength=len(unique_keys)))
+            rows.append(position[found])
+            cols.append(kind_cols + col_count)
+            values.append(FEATURE_WEIGHTS[kind] * idf[kind_cols])
+            col_count += len(unique_keys)
+
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        cols = np.concatenate(cols) if cols else np.zeros(0, dtype=np.int64)
+        values = np.concatenate(values) if values else np.zeros(0)
+        norms = np.sqrt(np.bincount(rows, weights=values ** 2, minlength=size))
+        values = values / norms[rows]
+
+        order = np.argsort(rows, kind="stable")
+        self.row_ptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=size))))
+        self.row_cols = cols[order]
+        self.row_values = values[order]
+
+        order = np.argsort(cols, kind="stable")
+        self.col_ptr = np.concatenate(([0], np.cumsum(np.bincount(cols, minlength=col_count))))
+        self.col_rows = rows[order]
+        self.col_values = values[order]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def locate(self, campaign_ids):
+        """
+        캠페인 id 배열의 (행 번호 배열, 행렬에 있는지 여부 배열)을 반환합니다.
+        """
+        campaign_ids = np.asarray(campaign_ids, dtype=np.int64)
+        if not len(self):
+            return np.zeros(len(campaign_ids), dtype=np.int64), np.zeros(len(campaign_ids), dtype=bool)
+        position = np.minimum(np.searchsorted(self.ids, campaign_ids), len(self) - 1)
+        return position, self.ids[position] == campaign_ids
+
+    def index(self, campaign_ids):
+        """
+        캠페인 id 배열을 행 번호 배열로 바꿉니다. 행렬에 없는 캠페인은 제외합니다.
+        """
+        position, found = self.locate(campaign_ids)
+        return position[found]
+
+    def scores(self, rows):
+        """
+        rows 캠페인들과 전체 캠페인 사이의 코사인 유사도 행렬(len(rows) x 캠페인 수)을 반환합니다.
+        rows의 특성마다 그 특성을 가진 캠페인 목록을 펼쳐 (행, 캠페인) 위치에 값을 더합니다.
+        자기 자신과의 유사도는 0으로 둡니다.
+        """
+        size = len(self)
+        starts = self.row_ptr[rows]
+        lengths = self.row_ptr[rows + 1] - starts
+        entries = concat_ranges(starts, lengths)
+        local = np.repeat(np.arange(len(rows)), lengths)
+        cols = self.row_cols[entries]
+
+        starts = self.col_ptr[cols]
+        lengths = self.col_ptr[cols + 1] - starts
+        postings = concat_ranges(starts, lengths)
+        weights = np.repeat(self.row_values[entries], lengths) * self.col_values[postings]
+        positions = np.repeat(local, lengths) * size + self.col_rows[postings]
+
+        scores = np.bincount(positions, weights=weights, minlength=len(rows) * size)
+        scores = scores.reshape(len(rows), size)
+        scores[np.arange(len(rows)), rows] = 0
+        return scores
+
+
+def top_neighbors(scores, count=NEIGHBOR_COUNT):
+    """
+    점수 행렬의 행마다 점수가 높은 순서로 (열 번호 배열, 점수 배열)을 반환합니다.
+    점수가 0인 열은 추천하지 않으므로 -1로 채웁니다.
+    """
+    count = min(count, scores.shape[1])
+    if not count:
+        return np.zeros((len(scores), 0), dtype=np.int64), np.zeros((len(scores), 0))
+    cols = np.argpartition(-scores, count - 1, axis=1)[:, :count]
+    top = np.take_along_axis(scores, cols, axis=1)
+    order = np.argsort(-top, axis=1, kind="stable")
+    cols = np.take_along_axis(cols, order, axis=1)
+    top = np.take_along_axis(top, order, axis=1)
+    cols[top <= 0] = -1
+    return cols, top
+
+
+def iter_neighbors(matrix, rows, count=NEIGHBOR_COUNT, batch_size=BATCH_SIZE):
+    """
+    rows 캠페인을 batch_size개씩 나눠 (행 번호 배열, 점수 행렬, 상위 열 번호, 상위 점수)를 차례로 돌려줍니다.
+    상위 목록에는 추천 후보 캠페인만 들어갑니다.
+    """
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        scores = matrix.scores(batch)
+        cols, top = top_neighbors(np.where(matrix.recommendable, scores, 0), count)
+        yield batch, scores, cols, top
+
+
+def load_matrix():
+    """
+    공개된(승인된) 캠페인의 태그, 카테고리, 참가자, 좋아요 유저로 특성 행렬을 만듭니다.
+    종료, 실패한 캠페인도 특성 행렬에는 들어가지만 추천 후보는 진행중인 캠페인뿐입니다.
+    """
+    campaigns = np.array(
+        list(Campaign.objects.filter(status__gte=1).order_by("id").values_list("id", "category")),
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    recommendable = np.fromiter(
+        filter_campaigns(Campaign.objects.all(), end="N").values_list("id", flat=True),
+        dtype=np.int64,
+    )
+    tags = np.array(
+        list(
+            TaggedItem.objects.filter(
+                content_type=ContentType.objects.get_for_model(Campaign)
+            ).values_list("object_id", "tag_id")
+        ),
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    participants = np.array(
+        list(Participant.objects.values_list("campaign_id", "user_id")), dtype=np.int64
+    ).reshape(-1, 2)
+    likes = np.array(
+        list(Campaign.like.through.objects.values_list("campaign_id", "user_id")),
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    return FeatureMatrix(
+        campaigns[:, 0],
+        {
+            "tag": (tags[:, 0], tags[:, 1]),
+            "category": (campaigns[:, 0], campaigns[:, 1]),
+            "participant": (participants[:, 0], participants[:, 1]),
+            "like": (likes[:, 0], likes[:, 1]),
+        },
+        recommendable,
+    )
+
+
+def neighbor_rows(campaign_id, neighbors):
+    """
+    [(이웃 캠페인 id, 점수)] 목록을 CampaignNeighbor 객체 목록으로 바꿉니다.
+    """
+    return [
+        CampaignNeighbor(campaign_id=campaign_id, neighbor_id=neighbor_id, rank=rank, score=score)
+        for rank, (neighbor_id, score) in enumerate(neighbors, start=1)
+    ]
+
+
+def load_neighbors(campaign_ids=None, chunk_size=500):
+    """
+    저장된 관련 캠페인을 {캠페인 id: [(이웃 캠페인 id, 점수)]}로 반환합니다.
+    campaign_ids가 없으면 전체를 가져오고, 있으면 chunk_size개씩 나눠 IN 조회합니다.
+    """
+    queryset = CampaignNeighbor.objects.order_by("campaign_id", "rank").values_list(
+        "campaign_id", "neighbor_id", "score"
+    )
+    if campaign_ids is None:
+        chunks = [queryset]
+    else:
+        campaign_ids = list(campaign_ids)
+        chunks = [
+            queryset.filter(campaign_id__in=campaign_ids[start:start + chunk_size])
+            for start in range(0, len(campaign_ids), chunk_size)
+        ]
+    neighbors = defaultdict(list)
+    for chunk in chunks:
+        for campaign_id, neighbor_id, score in chunk.iterator():
+            neighbors[campaign_id].append((neighbor_id, score))
+    return neighbors
+
+
+def save_neighbors(neighbors, replace_all=False, chunk_size=500):
+    """
+    {캠페인 id: [(이웃 캠페인 id, 점수)]}를 저장합니다.
+    목록이 바뀐 캠페인만 지우고 다시 쓰며, 상세 캐시도 그 캠페인만 무효화합니다.
+    replace_all이면 neighbors에 없는 캠페인의 기존 목록도 지웁니다.
+    """
+    current = load_neighbors(None if replace_all else neighbors)
+    changed = [
+        campaign_id
+        for campaign_id, items in neighbors.items()
+        if [neighbor_id for neighbor_id, _ in current.get(campaign_id, [])]
+        != [neighbor_id for neighbor_id, _ in items]
+    ]
+    if replace_all:
+        changed += [campaign_id for campaign_id in current if campaign_id not in neighbors]
+
+    with transaction.atomic():
+        for start in range(0, len(changed), chunk_size):
+            CampaignNeighbor.objects.filter(
+                campaign_id__in=changed[start:start + chunk_size]
+            ).delete()
+        CampaignNeighbor.objects.bulk_create(
+            [
+                row
+                for campaign_id in changed
+                for row in neighbor_rows(campaign_id, neighbors.get(campaign_id, []))
+            ],
+            batch_size=1000,
+        )
+        bump_detail_generations(changed)
+    return len(changed)
+
+
+def rebuild_neighbors(count=NEIGHBOR_COUNT, batch_size=BATCH_SIZE):
+    """
+    모든 공개 캠페인의 관련 캠페인을 다시 계산합니다. 바뀐 캠페인 수를 반환합니다.
+    """
+    matrix = load_matrix()
+    neighbors = {}
+    rows = np.arange(len(matrix))
+    for batch, _, cols, top in iter_neighbors(matrix, rows, count, batch_size):
+        for row, row_cols, row_top in zip(batch, cols, top):
+            neighbors[int(matrix.ids[row])] = [
+                (int(matrix.ids[col]), float(score))
+                for col, score in zip(row_cols, row_top)
+                if col >= 0
+            ]
+    changed = save_neighbors(neighbors, replace_all=True)
+    mark_scored(neighbors)
+    return changed
+
+
+def mark_scored(campaign_ids, chunk_size=500):
+    """
+    관련 캠페인을 계산한 캠페인에 계산 시각을 남깁니다. 이웃이 없는 캠페인도 남겨서 update_neighbors가 다시 계산하지 않습니다.
+    """
+    campaign_ids = list(campaign_ids)
+    now = timezone.now()
+    for start in range(0, len(campaign_ids), chunk_size):
+        Campaign.objects.filter(id__in=campaign_ids[start:start + chunk_size]).update(
+            neighbors_scored_at=now
+        )
+
+
+def update_neighbors(campaign_ids=None, count=NEIGHBOR_COUNT, batch_size=BATCH_SIZE):
+    """
+    새 캠페인의 관련 캠페인을 계산하고, 기존 캠페인의 목록에도 새 캠페인을 끼워 넣습니다.
+    campaign_ids가 없으면 아직 계산하지 않은(neighbors_scored_at이 빈) 공개 캠페인을 새 캠페인으로 봅니다.
+    태그가 바뀐 캠페인도 계산 시각을 비우므로 다시 계산합니다.
+    유사도는 대칭이므로 새 캠페인의 점수 행렬을 그대로 기존 캠페인 쪽 후보로 씁니다.
+    기존 캠페인끼리의 유사도 변화(참가, 좋아요 등)는 rebuild_neighbors에서 반영합니다.
+    """
+    if campaign_ids is None:
+        campaign_ids = np.fromiter(
+            Campaign.objects.filter(status__gte=1, neighbors_scored_at__isnull=True).values_list(
+                "id", flat=True
+            ),
+            dtype=np.int64,
+        )
+    if not len(campaign_ids):
+        return 0
+    matrix = load_matrix()
+    rows = matrix.index(campaign_ids)
+    if not len(rows):
+        return 0
+
+    # 기존 캠페인의 목록이 가득 찼다면 마지막 점수보다 높아야 끼어들 수 있습니다.
+    thresholds = np.zeros(len(matrix))
+    full = np.array(
+        list(
+            CampaignNeighbor.objects.values("campaign_id")
+            .annotate(size=Count("id"), lowest=Min("score"))
+            .filter(size__gte=count)
+            .values_list("campaign_id", "lowest")
+        )
+    ).reshape(-1, 2)
+    position, found = matrix.locate(full[:, 0])
+    thresholds[position[found]] = full[found, 1]
+    is_new = np.zeros(len(matrix), dtype=bool)
+    is_new[rows] = True
+
+    neighbors = {}
+    candidates = defaultdict(list)
+    for batch, scores, cols, top in iter_neighbors(matrix, rows, count, batch_size):
+        for row, row_cols, row_top in zip(batch, cols, top):
+            neighbors[int(matrix.ids[row])] = [
+                (int(matrix.ids[col]), float(score))
+                for col, score in zip(row_cols, row_top)
+                if col >= 0
+            ]
+        local, targets = np.nonzero(
+            (scores > thresholds) & ~is_new & matrix.recommendable[batch][:, None]
+        )
+        for row, target, score in zip(batch[local], targets, scores[local, targets]):
+            candidates[int(matrix.ids[target])].append((int(matrix.ids[row]), float(score)))
+
+    existing = load_neighbors(candidates)
+    for campaign_id, items in candidates.items():
+        merged = dict(existing[campaign_id])
+        merged.update(items)
+        neighbors[campaign_id] = sorted(merged.items(), key=lambda item: -item[1])[:count]
+
+    changed = save_neighbors(neighbors)
+    mark_scored(matrix.ids[rows].tolist())
+    return changed
@@ -0,0 +1,179 @@
+"""
+작성자 : 최준영
+내용 : 캠페인 키워드 검색을 위한 역색인 모듈입니다.
+띄어쓰기와 조사가 붙는 한국어 특성상 형태소 분석 없이도 부분 일치가 되도록
+단어를 2글자 단위 n-gram으로 쪼개서 색인하고, 검색어도 같은 방식으로 쪼개
+모든 n-gram을 가진 캠페인만 가중치 합계 순으로 돌려줍니다.
+ex) "탄소발자국을" -> ["탄소", "소발", "발자", "자국", "국을"]
+최초 작성일 : 2023.07.06
+"""
+import re
+import unicodedata
+from collections import Counter
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Sum, Value
+from campaigns.models import Campaign, CampaignSearchIndex
+
+
+NGRAM_SIZE = 2
+TERM_MAX_LENGTH = 20
+
+# 필드별 가중치입니다. 제목과 태그에 걸린 캠페인이 본문에만 걸린 캠페인보다 먼저 나옵니다.
+FIELD_WEIGHTS = {
+    "title": 5,
+    "tags": 4,
+    "user": 3,
+    "content": 1,
+}
+
+WORD_PATTERN = re.compile(r"[가-힣]+|[a-z0-9]+")
+
+
+def normalize(text):
+    """
+    전각/반각, 자모 조합을 NFKC로 통일하고 소문자로 바꿉니다.
+    """
+    return unicodedata.normalize("NFKC", text or "").lower()
+
+
+def tokenize(text):
+    """
+    텍스트를 n-gram 목록으로 바꿉니다.
+    한글과 영문/숫자는 서로 다른 단어로 나누고,
+    n-gram보다 짧은 단어는 단어 자체를 토큰으로 사용합니다.
+    """
+    terms = []
+    for word in WORD_PATTERN.findall(normalize(text)):
+        if len(word) <= NGRAM_SIZE:
+            terms.append(word)
+            continue
+        terms.extend(
+            word[i:i + NGRAM_SIZE] for i in range(len(word) - NGRAM_SIZE + 1)
+        )
+    return terms
+
+
+def campaign_terms(campaign, tag_names=None):
+    """
+    캠페인의 제목, 태그, 작성자, 본문을 토큰화해 {term: weight} 딕셔너리로 반환합니다.
+    """
+    if tag_names is None:
+        tag_names = campaign.tags.names()
+    fields = {
+        "title": campaign.title,
+        "tags": " ".join(tag_names),
+        "user": campaign.user.username,
+        "content": campaign.content,
+    }
+
+    weights = Counter()
+    for field, text in fields.items():
+        for term in tokenize(text):
+            weights[term[:TERM_MAX_LENGTH]] += FIELD_WEIGHTS[field]
+    return weights
+
+
+def build_index_rows(campaign, tag_names=None):
+    return [
+        CampaignSearchIndex(campaign_id=campaign.id, term=term, weight=weight)
+        for term, weight in campaign_terms(campaign, tag_names).items()
+    ]
+
+
+def index_campaign(campaign, tag_names=None):
+    """
+    캠페인 한 건의 색인을 다시 만듭니다. 캠페인/태그 저장 시 signal에서 호출합니다.
+    """
+    rows = build_index_rows(campaign, tag_names)
+    with transaction.atomic():
+        CampaignSearchIndex.objects.filter(campaign_id=campaign.id).delete()
+        CampaignSearchIndex.objects.bulk_create(rows)
+
+
+def rebuild_index(batch_size=500):
+    """
+    전체 캠페인 색인을 batch_size 단위로 다시 만들고 색인한 캠페인 수를 반환합니다.
+    """
+    CampaignSearchIndex.objects.all().delete()
+    return bulk_index_campaigns(Campaign.objects.all(), batch_size)
+
+
+def index_user_campaigns(user_id, batch_size=500):
+    """
+    유저가 작성한 캠페인의 색인을 다시 만들고 색인한 캠페인 수를 반환합니다. 유저 이름이 바뀌면 signal에서 호출합니다.
+    """
+    campaigns = Campaign.objects.filter(user_id=user_id)
+    with transaction.atomic():
+        CampaignSearchIndex.objects.filter(campaign__in=campaigns).delete()
+        return bulk_index_campaigns(campaigns, batch_size)
+
+
+def bulk_index_campaigns(campaigns, batch_size=500):
+    """
+    campaigns queryset을 id 순으로 batch_size개씩 읽어 색인 행을 bulk_create 합니다.
+    기존 색인은 호출하는 쪽에서 지웁니다.
+    """
+    queryset = campaigns.select_related("user").prefetch_related("tags").order_by("id")
+    total = 0
+    last_id = 0
+    while True:
+        batch = list(queryset.filter(id__gt=last_id)[:batch_size])
+        if not batch:
+            break
+        rows = []
+        for campaign in batch:
+            rows.extend(
+                build_index_rows(campaign, [tag.name for tag in campaign.tags.all()])
+            )
+        CampaignSearchIndex.objects.bulk_create(rows, batch_size=batch_size)
+        total += len(batch)
+        last_id = batch[-1].id
+    return total
+
+
+def search_campaigns(queryset, keyword):
+    """
+    keyword의 모든 n-gram을 가진 캠페인만 남기고
+    가중치 합계를 search_rank로 annotate 합니다.
+    n-gram이 없는 검색어(특수문자 등)는 빈 결과를 반환하고,
+    한 글자 단어가 섞인 검색어는 색인으로 부분 일치를 보장할 수 없어 icontains로 검색합니다.
+    """
+    words = WORD_PATTERN.findall(normalize(keyword))
+    if not words:
+        return queryset.none()
+    if min(len(word) for word in words) < NGRAM_SIZE:
+        return legacy_search_campaigns(queryset, keyword).annotate(
+            search_rank=Value(0, output_field=IntegerField())
+        )
+
+    terms = sorted({term[:TERM_MAX_LENGTH] for term in tokenize(keyword)})
+
+    index = CampaignSearchIndex.objects.filter(term__in=terms)
+    matched_ids = (
+        index.values("campaign_id")
+        .annotate(matched=Count("id"))
+        .filter(matched=len(terms))
+        .values("campaign_id")
+    )
+    rank = (
+        index.filter(campaign_id=OuterRef("pk"))
+        .order_by()
+        .values("campaign_id")
+        .annotate(total=Sum("weight"))
+        .values("total")
+    )
+    return queryset.filter(id__in=matched_ids).annotate(
+        search_rank=Subquery(rank, output_field=IntegerField())
+    )
+
+
+def legacy_search_campaigns(queryset, keyword):
+    """
+    색인 도입 전 icontains 검색입니다. 한 글자 검색어와 벤치마크 비교에 사용합니다.
+    """
+    return queryset.filter(
+        Q(title__icontains=keyword)
+        | Q(content__icontains=keyword)
+        | Q(tags__name__icontains=keyword)
+        | Q(user__username__icontains=keyword)
+    ).distinct()
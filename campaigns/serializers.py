@@ -1,12 +1,16 @@
 from rest_framework import serializers
 from campaigns.models import (
+    ArchivedCampaign,
+    ArchivedCampaignComment,
+    ArchivedCampaignReview,
+    ArchivedFunding,
     Campaign,
     CampaignReview,
     CampaignComment,
     Funding,
 )
-from users.models import UserProfile
-from users.serializers import UserProfileSerializer
+from users.serializers import ProfileImageField
+from config.images import ImageVariantField
 from taggit.serializers import TagListSerializerField, TaggitSerializer
 
 
@@ -44,15 +48,17 @@ class CampaignSerializer(serializers.ModelSerializer):
     """
     작성자 : 최준영
     내용 : 캠페인 디테일 시리얼라이저 입니다.
+          +) 이미지는 large 파생본
     최초 작성일 : 2023.06.06
-    업데이트 일자 : 2023.06.30
+    업데이트 일자 : 2023.07.09
     """
 
     tags = TagListSerializerField()
-    user = serializers.SerializerMethodField()
+    image = ImageVariantField("large", read_only=True)
+    user = serializers.CharField(source="user.username", read_only=True)
     fundings = FundingSerializer()
-    like_count = serializers.SerializerMethodField()
-    participant_count = serializers.SerializerMethodField()
+    like_count = serializers.IntegerField(read_only=True)
+    participant_count = serializers.IntegerField(read_only=True)
     status = serializers.SerializerMethodField()
     category = serializers.SerializerMethodField()
 
@@ -79,18 +85,6 @@ class CampaignSerializer(serializers.ModelSerializer):
             "participant_count",
         )
 
-    def get_user(self, obj):
-        return obj.user.username
-
-    def get_user_id(self, obj):
-        return obj.user.id
-
-    def get_like_count(self, obj):
-        return obj.like.count()
-
-    def get_participant_count(self, obj):
-        return obj.participant.count()
-
     def get_status(self, obj):
         return obj.get_status_display()
 
@@ -102,13 +96,16 @@ class CampaignListSerializer(serializers.ModelSerializer):
     """
     작성자 : 최준영
     내용 : 캠페인 리스트 시리얼라이저 입니다.
+          +) 이미지는 small 파생본
+          +) context에 viewer_states(campaigns.viewer)가 있으면 is_liked, is_participated 포함
     최초 작성일 : 2023.06.06
-    업데이트 일자 : 2023.06.30
+    업데이트 일자 : 2023.07.09
     """
 
     user = serializers.SerializerMethodField()
+    image = ImageVariantField("small", read_only=True)
     fundings = FundingSerializer()
-    participant_count = serializers.SerializerMethodField()
+    participant_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Campaign
@@ -128,8 +125,12 @@ class CampaignListSerializer(serializers.ModelSerializer):
     def get_user(self, obj):
         return obj.user.username
 
-    def get_participant_count(self, obj):
-        return obj.participant.count()
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        viewer_states = self.context.get("viewer_states")
+        if viewer_states is not None:
+            data.update(viewer_states[instance.id])
+        return data
 
 
 class CampaignCreateSerializer(TaggitSerializer, serializers.ModelSerializer):
@@ -209,19 +210,18 @@ class CampaignReviewSerializer(serializers.ModelSerializer):
     작성자 : 최준영
     내용 : 캠페인 후기 시리얼라이저 입니다.
           +) author필드 추가
+          +) 이미지는 small 파생본
     최초 작성일 : 2023.06.06
-    업데이트 일자 :2023.06.16
+    업데이트 일자 :2023.07.09
     """
 
     author = serializers.CharField(source="user.username", read_only=True)
-    user = serializers.SerializerMethodField()
+    user = serializers.CharField(source="user.username", read_only=True)
+    image = ImageVariantField("small", read_only=True)
 
     class Meta:
         model = CampaignReview
-        fields = "__all__"
-
-    def get_user(self, obj):
-        return obj.user.username
+        exclude = ("image_variants",)
 
 
 class CampaignReviewCreateSerializer(serializers.ModelSerializer):
@@ -242,14 +242,15 @@ class CampaignCommentSerializer(serializers.ModelSerializer):
     작성자 : 최준영
     내용 : 캠페인 댓글 시리얼라이저 입니다.
           +) author필드 추가
+          +) 작성자 프로필 이미지를 목록 단위로 한 번에 조회
     최초 작성일 : 2023.06.06
-    업데이트 일자 :2023.06.14
+    업데이트 일자 :2023.07.08
     """
 
     author = serializers.CharField(source="user.username", read_only=True)
     campaign_title = serializers.CharField(source="campaign.title", read_only=True)
-    user = serializers.SerializerMethodField()
-    user_image = serializers.SerializerMethodField()
+    user = serializers.CharField(source="user.username", read_only=True)
+    user_image = ProfileImageField()
 
     class Meta:
         model = CampaignComment
@@ -265,20 +266,6 @@ class CampaignCommentSerializer(serializers.ModelSerializer):
             "user_image",
         )
 
-    def get_user(self, obj):
-        return obj.user.username
-
-    def get_user_id(self, obj):
-        return obj.user.id
-
-    def get_user_image(self, obj):
-        user_id = obj.user.id
-        user_profile = UserProfile.objects.filter(user_id=user_id).first()
-        if user_profile and user_profile.image:
-            user_profile_serializer = UserProfileSerializer(user_profile)
-            return user_profile_serializer.data["image"]
-        else:
-            return None
 
 
 class CampaignCommentCreateSerializer(serializers.ModelSerializer):
@@ -301,6 +288,7 @@ class MyCampaingSerializer(serializers.ModelSerializer):
     최초 작성일 : 2023.07.05
     """
     status = serializers.SerializerMethodField()
+    image = ImageVariantField("small", read_only=True)
 
     class Meta:
         model = Campaign
@@ -309,3 +297,77 @@ class MyCampaingSerializer(serializers.ModelSerializer):
 
     def get_status(self, obj):
         return obj.get_status_display()
+
+
+class RelatedCampaignSerializer(serializers.ModelSerializer):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 상세 페이지의 관련 캠페인 시리얼라이저 입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    image = ImageVariantField("small", read_only=True)
+
+    class Meta:
+        model = Campaign
+        fields = (
+            "id",
+            "title",
+            "image",
+            "status",
+            "category",
+            "campaign_end_date",
+            "participant_count",
+        )
+
+
+class ArchivedFundingSerializer(serializers.ModelSerializer):
+    """
+    작성자 : 최준영
+    내용 : 보관된 펀딩 시리얼라이저 입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    class Meta:
+        model = ArchivedFunding
+        fields = "__all__"
+
+
+class ArchivedCampaignSerializer(CampaignSerializer):
+    """
+    작성자 : 최준영
+    내용 : 보관된 캠페인 상세 시리얼라이저 입니다.
+    CampaignSerializer와 같은 모양으로 내려주고 보관일(archived_at)을 더합니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    tags = serializers.ListField(source="tag_names", read_only=True)
+    fundings = ArchivedFundingSerializer(read_only=True)
+
+    class Meta:
+        model = ArchivedCampaign
+        fields = CampaignSerializer.Meta.fields + ("archived_at",)
+
+
+class ArchivedCampaignReviewSerializer(CampaignReviewSerializer):
+    """
+    작성자 : 최준영
+    내용 : 보관된 캠페인 후기 시리얼라이저 입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    class Meta:
+        model = ArchivedCampaignReview
+        exclude = ("image_variants",)
+
+
+class ArchivedCampaignCommentSerializer(CampaignCommentSerializer):
+    """
+    작성자 : 최준영
+    내용 : 보관된 캠페인 댓글 시리얼라이저 입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    class Meta:
+        model = ArchivedCampaignComment
+        fields = CampaignCommentSerializer.Meta.fields
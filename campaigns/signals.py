@@ -0,0 +1,266 @@
+from django.db.models.signals import post_save, pre_save, pre_delete, post_delete, m2m_changed
+from django.dispatch import receiver, Signal
+from users.models import User
+from campaigns.models import Campaign, CampaignComment, CampaignReview, Funding, Participant
+from campaigns.search import index_campaign, index_user_campaigns
+from campaigns.tags import bump_tag_trends, campaign_tag_ids, refresh_tag_stats
+from campaigns.deadlines import scheduler as deadline_scheduler
+from config import images
+from campaigns.cache import (
+    bump_list_generation,
+    bump_detail_generation,
+    bump_detail_generations,
+    bump_mypage_generations,
+)
+
+# CampaignStatusChecker가 여러 캠페인의 상태를 한 번에 바꾼 뒤 보내는 시그널입니다.
+# kwargs : campaign_ids, from_status, to_status
+campaigns_transitioned = Signal()
+
+SEARCH_FIELDS = {"title", "content", "user", "user_id"}
+TAG_STAT_FIELDS = {"status", "category"}
+
+
+@receiver(post_save, sender=Campaign)
+def update_campaign_search_index(sender, instance, created, update_fields=None, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 저장 시 검색 색인을 갱신합니다.
+    update_fields로 상태값 등 검색과 무관한 필드만 저장한 경우는 건너뜁니다.
+    새로 생성된 캠페인은 태그가 아직 저장되기 전이므로 태그 없이 색인합니다.
+    최초 작성일 : 2023.07.06
+    """
+    if update_fields and not SEARCH_FIELDS.intersection(update_fields):
+        return
+    index_campaign(instance, [] if created else None)
+
+
+@receiver(m2m_changed, sender=Campaign.tags.through)
+def update_campaign_tag_search_index(sender, instance, action, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 태그가 추가/삭제되면 검색 색인을 갱신합니다.
+    최초 작성일 : 2023.07.06
+    """
+    if action in ("post_add", "post_remove", "post_clear") and isinstance(instance, Campaign):
+        index_campaign(instance)
+
+
+@receiver(m2m_changed, sender=Campaign.tags.through)
+def reset_campaign_neighbors_scored_at(sender, instance, action, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 태그가 추가/삭제되면 관련 캠페인 계산 시각을 비워서 다음 update_neighbors에서 다시 계산합니다.
+    최초 작성일 : 2023.07.09
+    """
+    if action in ("post_add", "post_remove", "post_clear") and isinstance(instance, Campaign):
+        Campaign.objects.filter(id=instance.id).update(neighbors_scored_at=None)
+
+
+@receiver(pre_save, sender=User)
+def remember_username(sender, instance, update_fields=None, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 유저 저장 전에 DB의 유저 이름을 남겨 두어, 저장 뒤 이름이 바뀌었는지 비교합니다.
+    update_fields로 유저 이름이 아닌 필드만 저장하는 경우(last_login 등)는 조회하지 않습니다.
+    최초 작성일 : 2023.07.06
+    """
+    if instance.pk is None or (update_fields and "username" not in update_fields):
+        return
+    instance._previous_username = (
+        User.objects.filter(pk=instance.pk).values_list("username", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=User)
+def update_user_campaign_search_index(sender, instance, created, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 유저 이름이 바뀌면 작성자 이름으로도 검색되도록 그 유저가 작성한 캠페인의 검색 색인을 갱신합니다.
+    최초 작성일 : 2023.07.06
+    """
+    previous = getattr(instance, "_previous_username", None)
+    if created or previous is None or previous == instance.username:
+        return
+    instance._previous_username = instance.username
+    index_user_campaigns(instance.pk)
+
+
+@receiver(post_save, sender=Campaign)
+@receiver(post_delete, sender=Campaign)
+@receiver(post_save, sender=Funding)
+@receiver(post_delete, sender=Funding)
+def invalidate_campaign_cache(sender, instance, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 캠페인/펀딩이 저장, 삭제되면 캠페인 목록과 해당 캠페인 상세 캐시 세대를 올립니다.
+    최초 작성일 : 2023.07.07
+    """
+    bump_list_generation()
+    bump_detail_generation(instance.campaign_id if sender is Funding else instance.id)
+
+
+@receiver(m2m_changed, sender=Campaign.like.through)
+@receiver(m2m_changed, sender=Campaign.participant.through)
+@receiver(m2m_changed, sender=Campaign.tags.through)
+def invalidate_campaign_cache_on_m2m(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 좋아요, 참가자, 태그가 바뀌면 캠페인 목록과 해당 캠페인 상세 캐시 세대를 올립니다.
+    태그는 캠페인 저장 뒤에 따로 저장되므로, 저장 시점에 올린 세대로 그 사이 옛 태그가 캐시되었어도 여기서 다시 무효화합니다.
+    user.likes.add()처럼 유저 쪽에서 바꾼 경우(reverse)는 pk_set이 캠페인 id 목록입니다.
+    최초 작성일 : 2023.07.07
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    bump_list_generation()
+    campaign_ids = (pk_set or ()) if reverse else (instance.id,)
+    for campaign_id in campaign_ids:
+        bump_detail_generation(campaign_id)
+
+
+@receiver(campaigns_transitioned)
+def invalidate_campaign_cache_on_transition(sender, campaign_ids, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 스케줄러가 캠페인 상태를 일괄 변경하면 목록과 해당 캠페인 상세 캐시를 무효화합니다.
+    최초 작성일 : 2023.07.07
+    """
+    bump_list_generation()
+    bump_detail_generations(campaign_ids)
+
+
+@receiver(post_save, sender=Campaign)
+@receiver(post_delete, sender=Campaign)
+@receiver(post_save, sender=CampaignReview)
+@receiver(post_delete, sender=CampaignReview)
+@receiver(post_save, sender=CampaignComment)
+@receiver(post_delete, sender=CampaignComment)
+@receiver(post_save, sender=Participant)
+@receiver(post_delete, sender=Participant)
+def invalidate_mypage_cache(sender, instance, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 캠페인, 후기, 댓글, 참가 내역이 저장, 삭제되면 작성자(참가자)의 마이페이지 캐시를 무효화합니다.
+    최초 작성일 : 2023.07.09
+    """
+    bump_mypage_generations([instance.user_id])
+
+
+@receiver(m2m_changed, sender=Campaign.like.through)
+@receiver(m2m_changed, sender=Campaign.participant.through)
+def invalidate_mypage_cache_on_m2m(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 좋아요, 참가자가 바뀌면 해당 유저들의 마이페이지 캐시를 무효화합니다.
+    user.likes.add()처럼 유저 쪽에서 바꾼 경우(reverse)는 instance가 유저입니다.
+    최초 작성일 : 2023.07.09
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    bump_mypage_generations([instance.id] if reverse else (pk_set or ()))
+
+
+@receiver(campaigns_transitioned)
+def invalidate_mypage_cache_on_transition(sender, campaign_ids, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 상태가 일괄 변경되면 캠페인 작성자들의 마이페이지 캐시를 무효화합니다.
+    최초 작성일 : 2023.07.09
+    """
+    bump_mypage_generations(
+        set(Campaign.objects.filter(id__in=campaign_ids).values_list("user_id", flat=True))
+    )
+
+
+@receiver(post_save, sender=Campaign)
+def reschedule_campaign_deadlines(sender, instance, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 생성/승인이나 CampaignDetailView.put으로 날짜가 바뀌면
+    마감 스케줄러에 시작/마감 시각을 다시 등록합니다.
+    최초 작성일 : 2023.07.07
+    """
+    if deadline_scheduler.is_running:
+        deadline_scheduler.reschedule(instance)
+
+
+@receiver(post_delete, sender=Campaign)
+def cancel_campaign_deadlines(sender, instance, **kwargs):
+    if deadline_scheduler.is_running:
+        deadline_scheduler.cancel(instance.id)
+
+
+@receiver(m2m_changed, sender=Campaign.tags.through)
+def update_campaign_tag_stats(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 태그가 추가/삭제되면 바뀐 태그의 통계를 다시 집계하고, 추가된 태그의 트렌드 점수를 올립니다.
+    clear는 pk_set이 없으므로 지우기 전에 태그 id를 남겨 둡니다.
+    최초 작성일 : 2023.07.08
+    """
+    if action == "pre_clear":
+        instance._cleared_tag_ids = campaign_tag_ids([instance.pk]) if not reverse else set()
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        tag_ids = {instance.pk}
+    elif action == "post_clear":
+        tag_ids = getattr(instance, "_cleared_tag_ids", set())
+    else:
+        tag_ids = pk_set or set()
+    refresh_tag_stats(tag_ids)
+    if action == "post_add":
+        bump_tag_trends(tag_ids)
+
+
+@receiver(post_save, sender=Campaign)
+def update_campaign_tag_stats_on_save(sender, instance, created, update_fields=None, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 상태나 카테고리가 바뀔 수 있는 저장이면 캠페인에 달린 태그의 통계를 다시 집계합니다.
+    새로 생성된 캠페인은 태그가 저장될 때 집계됩니다.
+    최초 작성일 : 2023.07.08
+    """
+    if created or (update_fields and not TAG_STAT_FIELDS.intersection(update_fields)):
+        return
+    refresh_tag_stats(campaign_tag_ids([instance.pk]))
+
+
+@receiver(pre_delete, sender=Campaign)
+def remember_deleted_campaign_tags(sender, instance, **kwargs):
+    instance._deleted_tag_ids = campaign_tag_ids([instance.pk])
+
+
+@receiver(post_delete, sender=Campaign)
+def update_campaign_tag_stats_on_delete(sender, instance, **kwargs):
+    refresh_tag_stats(getattr(instance, "_deleted_tag_ids", set()))
+
+
+@receiver(campaigns_transitioned)
+def update_campaign_tag_stats_on_transition(sender, campaign_ids, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 스케줄러가 캠페인 상태를 일괄 변경하면 해당 캠페인들에 달린 태그의 통계를 다시 집계합니다.
+    최초 작성일 : 2023.07.08
+    """
+    refresh_tag_stats(campaign_tag_ids(campaign_ids))
+
+
+images.register(Campaign)
+images.register(CampaignReview)
+
+
+@receiver(images.variants_generated, sender=Campaign)
+@receiver(images.variants_generated, sender=CampaignReview)
+def invalidate_cache_on_image_variants(sender, pk, **kwargs):
+    """
+    작성자 : 최준영
+    내용 : 이미지 파생본이 기록되면 원본 URL로 캐시된 목록, 상세, 작성자 마이페이지 응답을 무효화합니다.
+    최초 작성일 : 2023.07.09
+    """
+    if sender is Campaign:
+        bump_list_generation()
+        bump_detail_generation(pk)
+    bump_mypage_generations(sender.objects.filter(pk=pk).values_list("user_id", flat=True))
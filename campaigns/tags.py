@@ -0,0 +1,125 @@
+"""
+작성자 : 최준영
+내용 : 캠페인 태그 통계 모듈입니다.
+태그 클라우드를 그릴 때마다 taggit_taggeditem을 집계하지 않도록
+태그별 캠페인 수(상태, 카테고리별)와 트렌드 점수를 테이블에 미리 저장합니다.
+캠페인의 태그, 상태, 카테고리가 바뀌면 그 캠페인에 달린 태그만 다시 집계합니다.
+최초 작성일 : 2023.07.08
+"""
+import math
+from collections import defaultdict
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+from taggit.models import TaggedItem
+from campaigns.models import Campaign, CampaignTagStat, CampaignTagTrend
+
+# 트렌드 점수는 이 기간(일)마다 절반으로 줄어듭니다.
+TREND_HALF_LIFE_DAYS = 7
+
+
+def trend_clock(now=None):
+    """
+    기준 시각부터 지난 반감기 수를 반환합니다. rank에서 이 값을 빼면 log2(현재 점수)가 됩니다.
+    """
+    return (now or timezone.now()).timestamp() / 86400 / TREND_HALF_LIFE_DAYS
+
+
+def trend_score(rank, now=None):
+    return 2 ** (rank - trend_clock(now))
+
+
+def campaign_tag_ids(campaign_ids):
+    """
+    캠페인들에 달린 태그 id 목록을 반환합니다.
+    """
+    return set(
+        TaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(Campaign),
+            object_id__in=list(campaign_ids),
+        ).values_list("tag_id", flat=True)
+    )
+
+
+def refresh_tag_stats(tag_ids):
+    """
+    태그별 캠페인 수를 상태, 카테고리 단위로 다시 집계해서 저장합니다.
+    집계에서 빠진 조합은 0으로 바꿔 두고, 조회할 때 0인 행은 제외합니다.
+    """
+    tag_ids = set(tag_ids)
+    if not tag_ids:
+        return
+    rows = (
+        Campaign.objects.annotate(tag_id=F("tags__id"))
+        .filter(tag_id__in=tag_ids)
+        .values("tag_id", "status", "category")
+        .annotate(campaign_count=Count("id"))
+        .order_by()
+    )
+    stats = [CampaignTagStat(**row) for row in rows]
+
+    options = {"update_conflicts": True, "update_fields": ["campaign_count"]}
+    if connection.features.supports_update_conflicts_with_target:
+        options["unique_fields"] = ["tag", "status", "category"]
+    with transaction.atomic():
+        CampaignTagStat.objects.filter(tag_id__in=tag_ids).update(campaign_count=0)
+        CampaignTagStat.objects.bulk_create(stats, **options)
+
+
+def bump_tag_trends(tag_ids, now=None):
+    """
+    태그가 캠페인에 새로 달릴 때마다 트렌드 점수를 1씩 올립니다.
+    기존 점수는 마지막 갱신 이후 지난 시간만큼 줄어든 값에서 더합니다.
+    일괄 등록처럼 한 태그가 여러 번 달렸으면 {tag_id: 달린 횟수}를 넘겨 한 번에 더합니다.
+    """
+    counts = tag_ids if isinstance(tag_ids, dict) else dict.fromkeys(set(tag_ids), 1)
+    if not counts:
+        return
+    clock = trend_clock(now)
+    with transaction.atomic():
+        trends = list(CampaignTagTrend.objects.select_for_update().filter(tag_id__in=counts))
+        for trend in trends:
+            trend.rank = math.log2(2 ** (trend.rank - clock) + counts[trend.tag_id]) + clock
+        CampaignTagTrend.objects.bulk_update(trends, ["rank"])
+        existing = {trend.tag_id for trend in trends}
+        CampaignTagTrend.objects.bulk_create(
+            [
+                CampaignTagTrend(tag_id=tag_id, rank=math.log2(count) + clock)
+                for tag_id, count in counts.items()
+                if tag_id not in existing
+            ],
+            ignore_conflicts=True,
+        )
+
+
+def rebuild_tag_stats(batch_size=500, now=None):
+    """
+    모든 태그의 통계와 트렌드 점수를 처음부터 다시 계산합니다.
+    트렌드 점수는 캠페인 생성 시각을 태그가 달린 시각으로 보고 계산합니다.
+    """
+    tag_ids = list(
+        TaggedItem.objects.filter(content_type=ContentType.objects.get_for_model(Campaign))
+        .values_list("tag_id", flat=True)
+        .distinct()
+    )
+    CampaignTagStat.objects.exclude(tag_id__in=tag_ids).delete()
+    for start in range(0, len(tag_ids), batch_size):
+        refresh_tag_stats(tag_ids[start:start + batch_size])
+
+    clock = trend_clock(now)
+    scores = defaultdict(float)
+    created = Campaign.objects.annotate(tag_id=F("tags__id")).filter(tag_id__isnull=False)
+    for tag_id, created_at in created.values_list("tag_id", "created_at").iterator():
+        scores[tag_id] += 2 ** (trend_clock(created_at) - clock)
+    with transaction.atomic():
+        CampaignTagTrend.objects.all().delete()
+        CampaignTagTrend.objects.bulk_create(
+            [
+                CampaignTagTrend(tag_id=tag_id, rank=math.log2(score) + clock)
+                for tag_id, score in scores.items()
+                if score > 0
+            ],
+            batch_size=batch_size,
+        )
+    return len(tag_ids)
@@ -0,0 +1,143 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from alarms.models import Notification
+from payments.models import Payment
+from users.models import User
+from campaigns.archive import archive_campaigns
+from campaigns.models import (
+    ArchivedCampaign,
+    ArchivedCampaignLike,
+    ArchivedParticipant,
+    Campaign,
+    CampaignComment,
+    CampaignNeighbor,
+    CampaignReview,
+    CampaignSearchIndex,
+    CampaignTagStat,
+    Funding,
+    Participant,
+)
+
+
+class CampaignArchiveTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 오래된 종료/실패 캠페인 보관과 보관된 캠페인 조회 테스트 클래스입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        cls.other = User.objects.create_user("other@test.com", "Jane", "Qwerasdf1234!")
+
+    def setUp(self):
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.old = self.create_campaign("오래된 캠페인", days=400, status=2)
+            self.old.tags.add("환경")
+            self.old.like.add(self.other)
+            self.participant = Participant.objects.create(user=self.other, campaign=self.old)
+            Funding.objects.create(campaign=self.old, goal=10000, amount=20000)
+            self.review = CampaignReview.objects.create(
+                user=self.other, campaign=self.old, title="후기", content="좋았어요"
+            )
+            self.comment = CampaignComment.objects.create(
+                user=self.other, campaign=self.old, content="댓글"
+            )
+            self.recent = self.create_campaign("최근 종료 캠페인", days=10, status=2)
+            self.recent.tags.add("환경")
+            self.open = self.create_campaign("모집중 캠페인", days=400, status=1)
+        Notification.objects.create(user=self.other, participant=self.participant, message="알림")
+        CampaignNeighbor.objects.create(campaign=self.recent, neighbor=self.old, rank=1, score=0.5)
+
+    def create_campaign(self, title, days, status):
+        now = timezone.now()
+        return Campaign.objects.create(
+            title=title,
+            content="내용",
+            user=self.user,
+            members=10,
+            campaign_start_date=now - timedelta(days=days + 10),
+            campaign_end_date=now - timedelta(days=days),
+            status=status,
+            is_funding=True,
+        )
+
+    def test_archive(self):
+        """
+        보관 기간이 지난 종료 캠페인만 관련 행과 함께 보관 테이블로 옮기는지 테스트하는 함수입니다.
+        """
+        report = archive_campaigns(days=180)
+        self.assertEqual(report["archived"], 1)
+        self.assertEqual(
+            sorted(Campaign.objects.values_list("id", flat=True)), sorted([self.recent.id, self.open.id])
+        )
+
+        archived = ArchivedCampaign.objects.get(id=self.old.id)
+        self.assertEqual((archived.title, archived.tag_names), ("오래된 캠페인", ["환경"]))
+        self.assertEqual(archived.fundings.amount, 20000)
+        self.assertEqual(archived.reviews.get().id, self.review.id)
+        self.assertEqual(archived.comments.get().id, self.comment.id)
+        self.assertTrue(ArchivedParticipant.objects.filter(campaign=archived, user=self.other).exists())
+        self.assertTrue(ArchivedCampaignLike.objects.filter(campaign=archived, user=self.other).exists())
+
+        self.assertFalse(Participant.objects.filter(campaign_id=self.old.id).exists())
+        self.assertFalse(CampaignSearchIndex.objects.filter(campaign_id=self.old.id).exists())
+        self.assertFalse(CampaignNeighbor.objects.exists())
+        self.assertIsNone(Notification.objects.get().participant)
+        self.assertEqual(
+            CampaignTagStat.objects.get(tag__name="환경", status=2, category=0).campaign_count, 1
+        )
+        self.assertEqual(archive_campaigns(days=180)["archived"], 0)
+
+    def test_skip_paid_campaign(self):
+        """
+        결제 내역이 있는 캠페인은 옮기지 않는지 테스트하는 함수입니다.
+        """
+        Payment.objects.create(user=self.other, amount="10000", campaign=self.old, merchant_uid="m")
+        call_command("archive_campaigns", days=180, chunk_size=1, stdout=StringIO())
+        self.assertTrue(Campaign.objects.filter(id=self.old.id).exists())
+        self.assertFalse(ArchivedCampaign.objects.exists())
+
+    def test_read_archived(self):
+        """
+        보관된 캠페인의 상세, 후기, 댓글을 기존 URL로 조회하고, 수정 요청은 받지 않는지 테스트하는 함수입니다.
+        """
+        detail_url = reverse("campaign_detail_view", kwargs={"campaign_id": self.old.id})
+        self.assertEqual(self.client.get(detail_url).data["title"], "오래된 캠페인")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            archive_campaigns(days=180)
+        response = self.client.get(detail_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["tags"], ["환경"])
+        self.assertEqual(response.data["status"], "캠페인 종료")
+        self.assertEqual(response.data["fundings"]["amount"], 20000)
+        self.assertEqual(response.data["related"], [])
+        self.assertIsNotNone(response.data["archived_at"])
+
+        response = self.client.get(
+            reverse("campaign_review_view", kwargs={"campaign_id": self.old.id})
+        )
+        self.assertEqual([row["id"] for row in response.data["results"]], [self.review.id])
+        response = self.client.get(
+            reverse("campaign_comment_view", kwargs={"campaign_id": self.old.id})
+        )
+        self.assertEqual(response.data["results"][0]["author"], "Jane")
+
+        self.client.force_authenticate(user=self.other)
+        response = self.client.post(
+            reverse("campaign_review_view", kwargs={"campaign_id": self.old.id}),
+            {"title": "후기", "content": "내용"},
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(
+            self.client.get(reverse("campaign_detail_view", kwargs={"campaign_id": 0})).status_code,
+            404,
+        )
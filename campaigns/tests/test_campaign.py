@@ -5,13 +5,21 @@ import tempfile
 from PIL import Image
 from faker import Faker
 from datetime import timedelta
+from io import StringIO
 from django.urls import reverse
 from django.utils import timezone
+from django.core.management import call_command
+from django.core.cache import cache
+from django.test import override_settings
 from django.test.client import MULTIPART_CONTENT, encode_multipart, BOUNDARY
 from rest_framework.test import APITestCase
 from users.models import User
-from campaigns.models import Campaign
+from campaigns.models import Campaign, CampaignComment, Funding
 from campaigns.serializers import CampaignListSerializer
+from campaigns.cache import get_or_build
+from campaigns.views import CampaignStatusChecker
+from campaigns.signals import campaigns_transitioned
+from campaigns.likes import TOGGLE_LOCK_KEY, flush_likes, intent_key, pending_key, toggle_like
 
 
 def get_dummy_path(file_name):
@@ -205,6 +213,9 @@ class CampaignReadTest(APITestCase):
                 )
             )
 
+    def setUp(self):
+        cache.clear()
+
     def test_get_campaign(self):
         """
         `setUpTestData` 메소드를 사용하여 테스트 사용자와 캠페인 데이터를 설정합니다.
@@ -260,6 +271,7 @@ class CampaignDetailTest(APITestCase):
         cls.user = User.objects.create_user(**cls.user_data)
 
     def setUp(self):
+        cache.clear()
         self.access_token = self.client.post(reverse("log_in"), self.user_data).data[
             "access"
         ]
@@ -411,6 +423,8 @@ class CampaignLikeTest(APITestCase):
         )
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data["message"], "좋아요 성공!")
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.like_count, 1)
 
         response = self.client.post(
             path=url,
@@ -418,6 +432,8 @@ class CampaignLikeTest(APITestCase):
         )
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data["message"], "좋아요 취소!")
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.like_count, 0)
 
 
 class CampaignParticipationTest(APITestCase):
@@ -509,6 +525,8 @@ class CampaignParticipationTest(APITestCase):
         )
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data["message"], "캠페인 참가 성공!")
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.participant_count, 1)
 
         response = self.client.post(
             path=url,
@@ -516,6 +534,8 @@ class CampaignParticipationTest(APITestCase):
         )
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data["message"], "캠페인 참가 취소!")
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.participant_count, 0)
 
     def test_max_participate_campaign(self):
         """
@@ -543,3 +563,484 @@ class CampaignParticipationTest(APITestCase):
         )
         self.assertEqual(response2.status_code, 400)
         self.assertEqual(response2.data["message"], "캠페인 참가 정원을 초과하여 신청할 수 없습니다.")
+
+
+class CampaignCountSyncTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 카운터 재계산 커맨드 테스트 클래스입니다.
+    최초 작성일 : 2023.07.06
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        file_path = get_dummy_path('dummy_data.json')
+        with open(file_path, encoding="utf-8") as test_json:
+            cls.campaign_data = json.load(test_json)
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        cls.other_user = User.objects.create_user("other@test.com", "Nue", "Qwerasdf1234!")
+        cls.campaign_data["user"] = cls.user
+        cls.campaign = Campaign.objects.create(**cls.campaign_data)
+
+    def test_sync_campaign_counts(self):
+        """
+        카운터를 거치지 않고 추가된 좋아요, 참가자, 댓글 수가
+        커맨드 실행 후 실제 값으로 맞춰지는지 테스트하는 함수입니다.
+        """
+        self.campaign.like.add(self.user, self.other_user)
+        self.campaign.participant.add(self.user)
+        CampaignComment.objects.create(user=self.user, campaign=self.campaign, content="댓글")
+        Campaign.objects.filter(id=self.campaign.id).update(review_count=3)
+
+        out = StringIO()
+        call_command("sync_campaign_counts", stdout=out)
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.like_count, 2)
+        self.assertEqual(self.campaign.participant_count, 1)
+        self.assertEqual(self.campaign.comment_count, 1)
+        self.assertEqual(self.campaign.review_count, 0)
+
+    def test_sync_campaign_counts_dry_run(self):
+        """
+        --dry-run 옵션에서는 카운터를 수정하지 않는지 테스트하는 함수입니다.
+        """
+        self.campaign.like.add(self.user)
+
+        out = StringIO()
+        call_command("sync_campaign_counts", "--dry-run", stdout=out)
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.like_count, 0)
+        self.assertIn("like_count: 1개 캠페인 불일치", out.getvalue())
+
+
+class CampaignCursorPaginationTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 목록 cursor 페이지네이션 테스트 클래스입니다.
+    최초 작성일 : 2023.07.06
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        now = timezone.now()
+        for i in range(20):
+            Campaign.objects.create(
+                title=f"캠페인{i}",
+                content="내용",
+                user=cls.user,
+                members=100,
+                campaign_start_date=now - timedelta(days=1),
+                # 같은 정렬 값이 여러 개 있어도 누락/중복이 없는지 확인하기 위해 값을 겹치게 합니다.
+                campaign_end_date=now + timedelta(days=i % 3 + 1),
+                status=1,
+                like_count=i % 4,
+                participant_count=i % 2,
+                hot_rank=i % 3 * 0.5,
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def get_all_pages(self, order):
+        url = reverse("campaign_view") + f"?order={order}"
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn("count", response.data)
+            ids.extend(campaign["id"] for campaign in response.data["results"])
+            url = response.data["next"]
+        return ids
+
+    def test_cursor_pagination_every_order(self):
+        """
+        모든 정렬에서 next를 따라가면 캠페인이 누락/중복 없이 정렬 순서대로 나오는지 테스트하는 함수입니다.
+        """
+        expected = {
+            "recent": ("-created_at", "-id"),
+            "closing": ("campaign_end_date", "id"),
+            "popular": ("-hot_rank", "id"),
+            "like": ("-like_count", "id"),
+            "amount": ("id",),
+        }
+        for order, ordering in expected.items():
+            ids = self.get_all_pages(order)
+            self.assertEqual(
+                ids, list(Campaign.objects.order_by(*ordering).values_list("id", flat=True))
+            )
+
+    def test_cursor_pagination_previous(self):
+        """
+        previous 링크로 이전 페이지가 그대로 돌아오는지 테스트하는 함수입니다.
+        """
+        first = self.client.get(reverse("campaign_view") + "?order=like")
+        second = self.client.get(first.data["next"])
+        self.assertIsNone(first.data["previous"])
+
+        previous = self.client.get(second.data["previous"])
+        self.assertEqual(previous.data["results"], first.data["results"])
+
+    def test_cursor_pagination_query_count(self):
+        """
+        뒤 페이지도 첫 페이지와 같은 수의 쿼리(COUNT 없이 1번)로 조회되는지 테스트하는 함수입니다.
+        """
+        url = reverse("campaign_view") + "?order=closing"
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        for _ in range(2):
+            url = response.data["next"]
+            with self.assertNumQueries(1):
+                response = self.client.get(url)
+
+    def test_invalid_cursor(self):
+        """
+        잘못된 cursor는 404를 반환하는지 테스트하는 함수입니다.
+        """
+        response = self.client.get(reverse("campaign_view") + "?order=recent&cursor=abc")
+        self.assertEqual(response.status_code, 404)
+
+
+class CampaignListCacheTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 목록 응답 캐시 테스트 클래스입니다.
+    최초 작성일 : 2023.07.07
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        now = timezone.now()
+        cls.campaign = Campaign.objects.create(
+            title="캠페인",
+            content="내용",
+            user=cls.user,
+            members=100,
+            campaign_start_date=now - timedelta(days=1),
+            campaign_end_date=now + timedelta(days=1),
+            status=1,
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_anonymous_list_cached(self):
+        """
+        같은 Query String의 두 번째 요청은 DB 조회 없이 응답하는지 테스트하는 함수입니다.
+        """
+        url = reverse("campaign_view") + "?order=recent&end=N"
+        first = self.client.get(url)
+        with self.assertNumQueries(0):
+            second = self.client.get(url + "&unused=1")
+        self.assertEqual(first.data, second.data)
+
+    def test_list_cache_invalidated_on_participation(self):
+        """
+        참가자가 바뀌면 캐시가 무효화되어 새 참가자 수가 보이는지 테스트하는 함수입니다.
+        """
+        url = reverse("campaign_view") + "?order=recent"
+        response = self.client.get(url)
+        self.assertEqual(response.data["results"][0]["participant_count"], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign.participant.add(self.user)
+            Campaign.update_counts(self.campaign.id, participant_count=1)
+
+        response = self.client.get(url)
+        self.assertEqual(response.data["results"][0]["participant_count"], 1)
+
+    def test_stale_value_served_while_locked(self):
+        """
+        만료된 값을 다른 워커가 다시 계산 중(락 보유)이면
+        다시 계산하지 않고 이전 값을 돌려주는지 테스트하는 함수입니다.
+        """
+        cache.set("key", (0, "stale"), 60)
+        cache.add("key:lock", 1, 10)
+
+        data = get_or_build("key", lambda: self.fail("builder가 호출되면 안 됩니다."))
+        self.assertEqual(data, "stale")
+
+        cache.delete("key:lock")
+        self.assertEqual(get_or_build("key", lambda: "fresh"), "fresh")
+        self.assertEqual(get_or_build("key", lambda: "other"), "fresh")
+
+
+class CampaignDetailCacheTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 상세 ETag/304 응답과 상세 캐시 테스트 클래스입니다.
+    최초 작성일 : 2023.07.07
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user_data = {
+            "email": "test@test.com",
+            "username": "John",
+            "password": "Qwerasdf1234!",
+        }
+        cls.user = User.objects.create_user(**cls.user_data)
+        now = timezone.now()
+        cls.campaign = Campaign.objects.create(
+            title="캠페인",
+            content="내용",
+            user=cls.user,
+            members=100,
+            campaign_start_date=now - timedelta(days=1),
+            campaign_end_date=now + timedelta(days=1),
+            status=1,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.access_token = self.client.post(reverse("log_in"), self.user_data).data[
+            "access"
+        ]
+
+    def test_not_modified(self):
+        """
+        If-None-Match가 ETag와 같으면 DB 조회 없이 304를 반환하는지 테스트하는 함수입니다.
+        """
+        url = self.campaign.get_absolute_url()
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_etag_changed_on_like(self):
+        """
+        좋아요를 누르면 ETag가 바뀌고 새 좋아요 수가 반환되는지 테스트하는 함수입니다.
+        """
+        url = self.campaign.get_absolute_url()
+        etag = self.client.get(url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("campaign_like_view", kwargs={"campaign_id": self.campaign.id}),
+                HTTP_AUTHORIZATION=f"Bearer {self.access_token}",
+            )
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["like_count"], 1)
+
+    def test_etag_changed_on_tags(self):
+        """
+        캠페인 저장과 따로 태그만 바뀌어도 상세 ETag와 태그가 바뀌는지 테스트하는 함수입니다.
+        """
+        url = self.campaign.get_absolute_url()
+        etag = self.client.get(url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign.tags.add("환경")
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["tags"], ["환경"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign.tags.clear()
+        self.assertEqual(self.client.get(url).data["tags"], [])
+
+
+class CampaignStatusCheckerTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 스케줄러 캠페인 상태 일괄 변경 테스트 클래스입니다.
+    최초 작성일 : 2023.07.07
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        now = timezone.now()
+        default = {
+            "title": "캠페인",
+            "content": "내용",
+            "user": cls.user,
+            "members": 100,
+            "campaign_start_date": now - timedelta(days=3),
+            "status": 1,
+        }
+        cls.ended = Campaign.objects.bulk_create(
+            [Campaign(campaign_end_date=now - timedelta(hours=1), **default) for _ in range(25)]
+        )
+        cls.ongoing = Campaign.objects.create(campaign_end_date=now + timedelta(days=1), **default)
+
+    def setUp(self):
+        self.events = []
+        campaigns_transitioned.connect(self.receive, dispatch_uid="test_receiver")
+
+    def tearDown(self):
+        campaigns_transitioned.disconnect(dispatch_uid="test_receiver")
+
+    def receive(self, sender, **kwargs):
+        self.events.append(kwargs)
+
+    def test_check_campaign_status(self):
+        """
+        마감일이 지난 캠페인만 batch_size 단위로 종료(2) 처리되고
+        시그널이 한 번만 발생하는지 테스트하는 함수입니다.
+        """
+        checker = CampaignStatusChecker()
+        checker.batch_size = 10
+        report = checker.check_campaign_status()
+
+        self.assertEqual(report["candidates"], 25)
+        self.assertEqual(report["updated"], 25)
+        self.assertEqual(Campaign.objects.filter(status=2).count(), 25)
+        self.ongoing.refresh_from_db()
+        self.assertEqual(self.ongoing.status, 1)
+
+        self.assertEqual(len(self.events), 1)
+        self.assertEqual(
+            sorted(self.events[0]["campaign_ids"]), sorted(c.id for c in self.ended)
+        )
+        self.assertEqual(CampaignStatusChecker().check_campaign_status()["updated"], 0)
+
+    def test_check_funding_success(self):
+        """
+        펀딩 목표를 채우지 못한 종료 캠페인만 실패(3) 처리되는지 테스트하는 함수입니다.
+        """
+        failed, succeeded = self.ended[0], self.ended[1]
+        Funding.objects.create(campaign=failed, goal=1000, amount=10)
+        Funding.objects.create(campaign=succeeded, goal=1000, amount=1000)
+        Campaign.objects.filter(id__in=[failed.id, succeeded.id]).update(status=2)
+
+        report = CampaignStatusChecker().check_funding_success()
+
+        self.assertEqual(report["updated"], 1)
+        self.assertEqual(Campaign.objects.get(id=failed.id).status, 3)
+        self.assertEqual(Campaign.objects.get(id=succeeded.id).status, 2)
+        self.assertEqual(self.events[0]["to_status"], 3)
+
+
+@override_settings(CAMPAIGN_LIKE_BUFFER=True, CAMPAIGN_LIKE_FLUSH_BATCH=1000)
+class CampaignLikeBufferTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 좋아요 쓰기 버퍼 테스트 클래스입니다.
+    최초 작성일 : 2023.07.08
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = User.objects.bulk_create(
+            [User(email=f"user{i}@test.com", username=f"user{i}") for i in range(20)]
+        )
+        now = timezone.now()
+        cls.campaign = Campaign.objects.create(
+            title="캠페인",
+            content="내용",
+            user=cls.users[0],
+            members=100,
+            campaign_start_date=now - timedelta(days=1),
+            campaign_end_date=now + timedelta(days=1),
+            status=1,
+        )
+        cls.url = reverse("campaign_like_view", kwargs={"campaign_id": cls.campaign.id})
+
+    def setUp(self):
+        cache.clear()
+
+    def toggle(self, user):
+        self.client.force_authenticate(user=user)
+        return self.client.post(self.url)
+
+    def test_like_served_from_buffer(self):
+        """
+        반영 전에는 DB를 건드리지 않고, 좋아요 여부와 수는 버퍼를 합쳐서 응답하는지 테스트하는 함수입니다.
+        """
+        response = self.toggle(self.users[1])
+        self.assertEqual(response.data["message"], "좋아요 성공!")
+        self.assertEqual(response.data["like_count"], 1)
+        self.assertFalse(self.campaign.like.exists())
+
+        response = self.client.get(self.url)
+        self.assertTrue(response.data["is_liked"])
+        self.assertEqual(response.data["like_count"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(flush_likes(), 1)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.like_count, 1)
+        self.assertEqual(list(self.campaign.like.all()), [self.users[1]])
+        self.assertEqual(self.client.get(self.url).data["like_count"], 1)
+
+        response = self.toggle(self.users[1])
+        self.assertEqual(response.data["message"], "좋아요 취소!")
+        self.assertEqual(response.data["like_count"], 0)
+
+    def test_flush_last_write_wins(self):
+        """
+        반영 전에 여러 번 토글하면 유저별 마지막 의도만 한 번의 bulk 쿼리로 반영되는지 테스트하는 함수입니다.
+        """
+        for user in self.users:
+            self.toggle(user)
+        for user in self.users[:5]:
+            self.toggle(user)
+            self.toggle(user)
+            self.toggle(user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(7):
+                self.assertEqual(flush_likes(), 15)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.like_count, 15)
+        self.assertEqual(
+            set(self.campaign.like.values_list("id", flat=True)),
+            {user.id for user in self.users[5:]},
+        )
+        self.assertEqual(self.client.get(self.url).data["like_count"], 15)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(flush_likes(), 0)
+
+    def test_toggle_waits_for_concurrent_toggle(self):
+        """
+        같은 유저의 다른 토글이 잠금을 잡고 있으면 의도와 버퍼 증감을 바꾸지 않고 409를 반환하는지 테스트하는 함수입니다.
+        """
+        user = self.users[1]
+        self.assertTrue(toggle_like(self.campaign.id, user.id))
+        cache.add(TOGGLE_LOCK_KEY.format(campaign_id=self.campaign.id, user_id=user.id), 1)
+        self.assertIsNone(toggle_like(self.campaign.id, user.id))
+        self.assertEqual(self.toggle(user).status_code, 409)
+        self.assertEqual(cache.get(pending_key(self.campaign.id)), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(flush_likes(), 1)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.like_count, 1)
+        self.assertEqual(self.client.get(self.url).data["like_count"], 1)
+
+    def test_flush_skips_deleted_campaign(self):
+        """
+        좋아요를 누른 뒤 반영 전에 캠페인이 지워져도 나머지 의도는 반영되고, 반영 위치가 넘어가는지 테스트하는 함수입니다.
+        """
+        now = timezone.now()
+        deleted = Campaign.objects.create(
+            title="지울 캠페인",
+            content="내용",
+            user=self.users[0],
+            members=100,
+            campaign_start_date=now - timedelta(days=1),
+            campaign_end_date=now + timedelta(days=1),
+            status=1,
+        )
+        toggle_like(deleted.id, self.users[1].id)
+        self.toggle(self.users[2])
+        deleted.delete()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(flush_likes(), 1)
+        self.assertEqual(list(self.campaign.like.all()), [self.users[2]])
+        self.assertIsNone(cache.get(intent_key(deleted.id, self.users[1].id)))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(flush_likes(), 0)
@@ -0,0 +1,127 @@
+import random
+from datetime import timedelta
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from users.models import User
+from campaigns.models import Campaign, Funding
+from campaigns.deadlines import DeadlineScheduler, START, END
+
+
+class FakeClock:
+    """
+    작성자 : 최준영
+    내용 : 마감 스케줄러 테스트용 가짜 시계입니다. advance()로만 시간이 흐릅니다.
+    최초 작성일 : 2023.07.07
+    """
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += timedelta(seconds=seconds)
+
+
+class DeadlineSchedulerTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 마감 스케줄러 테스트 클래스입니다.
+    최초 작성일 : 2023.07.07
+    """
+
+    CAMPAIGN_COUNT = 2000
+    SECONDS = 120
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        cls.started_at = timezone.now().replace(microsecond=0)
+        rand = random.Random(0)
+        campaigns = []
+        for _ in range(cls.CAMPAIGN_COUNT):
+            # 여러 캠페인이 같은 시각에 마감되도록 초 단위로 겹치게 만듭니다.
+            end_date = cls.started_at + timedelta(seconds=rand.randint(1, cls.SECONDS))
+            campaigns.append(
+                Campaign(
+                    title="캠페인",
+                    content="내용",
+                    user=cls.user,
+                    members=100,
+                    campaign_start_date=cls.started_at - timedelta(days=1),
+                    campaign_end_date=end_date,
+                    status=1,
+                )
+            )
+        Campaign.objects.bulk_create(campaigns)
+
+    def setUp(self):
+        self.clock = FakeClock(self.started_at)
+        self.scheduler = DeadlineScheduler(clock=self.clock)
+
+    def test_overlapping_deadlines(self):
+        """
+        수천 개의 겹치는 마감 시각을 1초씩 진행하면서
+        매 순간 마감된 캠페인만 정확히 종료되는지 테스트하는 함수입니다.
+        """
+        self.assertEqual(self.scheduler.load_from_db(), self.CAMPAIGN_COUNT)
+
+        for _ in range(self.SECONDS):
+            self.clock.advance(1)
+            self.scheduler.run_due()
+            self.assertFalse(
+                Campaign.objects.filter(status=1, campaign_end_date__lte=self.clock()).exists()
+            )
+            self.assertFalse(
+                Campaign.objects.filter(status=2, campaign_end_date__gt=self.clock()).exists()
+            )
+
+        self.assertEqual(Campaign.objects.filter(status=2).count(), self.CAMPAIGN_COUNT)
+        self.assertEqual(self.scheduler.heap, [])
+
+    def test_reschedule(self):
+        """
+        마감일을 미루면 이전 마감 시각에는 종료되지 않고 새 시각에 종료되는지 테스트하는 함수입니다.
+        """
+        self.scheduler.load_from_db()
+        campaign = Campaign.objects.order_by("campaign_end_date").first()
+        campaign.campaign_end_date = self.started_at + timedelta(seconds=self.SECONDS + 10)
+        campaign.save()
+        self.scheduler.reschedule(campaign)
+
+        self.clock.advance(self.SECONDS)
+        self.scheduler.run_due()
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.status, 1)
+
+        self.clock.advance(10)
+        self.scheduler.run_due()
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.status, 2)
+
+    def test_funding_failed_on_deadline(self):
+        """
+        마감 시각에 펀딩 목표를 채우지 못한 캠페인은 바로 실패(3) 처리되는지 테스트하는 함수입니다.
+        """
+        campaign = Campaign.objects.order_by("campaign_end_date").first()
+        Funding.objects.create(campaign=campaign, goal=1000, amount=0)
+        self.scheduler.schedule(campaign.id, END, campaign.campaign_end_date)
+
+        self.clock.now = campaign.campaign_end_date
+        self.scheduler.run_due()
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.status, 3)
+
+    def test_next_timeout(self):
+        """
+        다음 대기 시간이 가장 가까운 마감 시각까지인지 테스트하는 함수입니다.
+        """
+        self.scheduler.schedule(1, START, self.started_at + timedelta(seconds=5))
+        self.scheduler.schedule(2, END, self.started_at + timedelta(seconds=3))
+        self.assertEqual(self.scheduler.next_timeout(), 3)
+
+        self.scheduler.cancel(2)
+        self.assertEqual(self.scheduler.pop_due(), {})
+        self.clock.advance(5)
+        self.assertEqual(dict(self.scheduler.pop_due()), {START: [1]})
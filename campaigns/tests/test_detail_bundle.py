@@ -0,0 +1,127 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from users.models import User
+from campaigns.archive import archive_campaigns
+from campaigns.models import Campaign, CampaignComment, CampaignReview, Participant
+
+
+class CampaignDetailBundleTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 상세 묶음(상세, 후기/댓글 첫 페이지, 좋아요/참가 여부) 조회 테스트 클래스입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        now = timezone.now()
+        cls.campaign = Campaign.objects.create(
+            title="상세 캠페인",
+            content="내용",
+            user=cls.user,
+            members=10,
+            campaign_start_date=now - timedelta(days=400),
+            campaign_end_date=now - timedelta(days=300),
+            status=2,
+        )
+        cls.campaign.like.add(cls.user)
+        Participant.objects.create(user=cls.user, campaign=cls.campaign)
+        cls.comments = [
+            CampaignComment.objects.create(user=cls.user, campaign=cls.campaign, content=f"댓글{i}")
+            for i in range(7)
+        ]
+        cls.reviews = [
+            CampaignReview.objects.create(
+                user=cls.user, campaign=cls.campaign, title=f"후기{i}", content="내용"
+            )
+            for i in range(3)
+        ]
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("campaign_detail_bundle_view", kwargs={"campaign_id": self.campaign.id})
+
+    def test_bundle(self):
+        """
+        상세, 후기/댓글 첫 페이지, 좋아요/참가 여부를 한 번에 반환하고,
+        상세가 캐시된 뒤에는 후기, 댓글, 좋아요, 참가 조회만 하는지 테스트하는 함수입니다.
+        """
+        self.client.force_authenticate(user=self.user)
+        with self.assertNumQueries(8):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        data = response.data
+        self.assertEqual(data["campaign"]["title"], "상세 캠페인")
+        self.assertEqual(
+            [row["id"] for row in data["reviews"]["results"]],
+            [review.id for review in reversed(self.reviews)],
+        )
+        self.assertIsNone(data["reviews"]["next"])
+        self.assertEqual(
+            [row["id"] for row in data["comments"]["results"]],
+            [comment.id for comment in self.comments[:5]],
+        )
+        self.assertEqual(
+            data["viewer"], {"is_liked": True, "is_participated": True, "like_count": 0}
+        )
+
+        with self.assertNumQueries(5):
+            self.client.get(self.url)
+
+        # next 주소를 댓글 View에 그대로 보내면 다음 페이지가 이어집니다.
+        response = self.client.get(data["comments"]["next"])
+        self.assertEqual(
+            [row["id"] for row in response.data["results"]],
+            [comment.id for comment in self.comments[5:]],
+        )
+        self.assertIsNone(response.data["next"])
+
+    def test_comment_order(self):
+        """
+        order=recent면 댓글 첫 페이지와 다음 페이지 주소가 최신순인지 테스트하는 함수입니다.
+        """
+        response = self.client.get(self.url, {"order": "recent"})
+        self.assertEqual(response.data["comments"]["results"][0]["id"], self.comments[-1].id)
+        self.assertEqual(response.data["viewer"]["is_liked"], False)
+        response = self.client.get(response.data["comments"]["next"])
+        self.assertEqual(
+            [row["id"] for row in response.data["results"]],
+            [comment.id for comment in reversed(self.comments[:2])],
+        )
+
+    def test_archived_and_not_found(self):
+        """
+        보관된 캠페인은 보관된 후기/댓글을 묶어 반환하고, 없는 캠페인은 404인지 테스트하는 함수입니다.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            archive_campaigns(days=180)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("archived_at", response.data["campaign"])
+        self.assertEqual(len(response.data["comments"]["results"]), 5)
+        response = self.client.get(response.data["comments"]["next"])
+        self.assertEqual(len(response.data["results"]), 2)
+
+        url = reverse("campaign_detail_bundle_view", kwargs={"campaign_id": 0})
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_benchmark(self):
+        """
+        벤치마크 커맨드가 다섯 요청과 묶음 요청의 쿼리 수를 출력하는지 테스트하는 함수입니다.
+        """
+        out = StringIO()
+        call_command(
+            "benchmark_campaign_detail",
+            campaign=self.campaign.id,
+            user="test@test.com",
+            repeat=1,
+            host="testserver",
+            stdout=out,
+        )
+        self.assertIn("묶음 요청: 쿼리 5회", out.getvalue())
@@ -0,0 +1,122 @@
+import csv
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from users.models import User
+from campaigns.models import Campaign, Funding
+
+
+class CampaignExportTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 백오피스 캠페인 신청내역 CSV/JSONL 내보내기 테스트 클래스입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user("admin@test.com", "admin", "Qwerasdf1234!")
+        cls.admin.is_admin = True
+        cls.admin.save()
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        now = timezone.now()
+        for i in range(5):
+            campaign = Campaign.objects.create(
+                title=f"캠페인{i}",
+                content="내용",
+                user=cls.user,
+                members=10,
+                campaign_start_date=now,
+                campaign_end_date=now + timedelta(days=1),
+                status=i % 2,
+                category=i % 3,
+                is_funding=i == 0,
+                like_count=i,
+            )
+            if i == 0:
+                Funding.objects.create(campaign=campaign, goal=1000, amount=300)
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.admin)
+
+    def export(self, query=""):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("campaign_export_view") + query)
+            content = b"".join(response.streaming_content).decode("utf-8")
+        return response, content, queries
+
+    def test_csv(self):
+        """
+        CSV 헤더와 행, 카운터/펀딩 컬럼이 올바르게 나오는지 테스트하는 함수입니다.
+        """
+        response, content, _ = self.export()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn("attachment;", response["Content-Disposition"])
+        self.assertTrue(content.startswith("\ufeff"))
+        rows = list(csv.DictReader(StringIO(content.lstrip("\ufeff"))))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]["제목"], "캠페인0")
+        self.assertEqual(rows[0]["진행 상태"], "미승인")
+        self.assertEqual(rows[0]["펀딩 목표 금액"], "1000")
+        self.assertEqual(rows[1]["펀딩 목표 금액"], "")
+        self.assertEqual(rows[4]["좋아요 수"], "4")
+
+    def test_csv_formula_escaped(self):
+        """
+        수식 시작 글자로 시작하는 제목, 작성자는 CSV에서 '를 붙여 내보내고 JSONL은 그대로인지 테스트하는 함수입니다.
+        """
+        Campaign.objects.filter(title="캠페인0").update(title="=HYPERLINK(\"http://x\")")
+        self.user.username = "@John"
+        self.user.save()
+        rows = list(csv.DictReader(StringIO(self.export()[1].lstrip("\ufeff"))))
+        self.assertEqual(rows[0]["제목"], "'=HYPERLINK(\"http://x\")")
+        self.assertEqual(rows[0]["작성자"], "'@John")
+        self.assertEqual(rows[1]["제목"], "캠페인1")
+        row = json.loads(self.export("?output=jsonl")[1].splitlines()[0])
+        self.assertEqual(row["title"], "=HYPERLINK(\"http://x\")")
+
+    def test_jsonl_and_filters(self):
+        """
+        JSONL 형식과 상태, 카테고리, 펀딩 여부, 신청일 필터를 테스트하는 함수입니다.
+        """
+        _, content, _ = self.export("?output=jsonl&status=1")
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual([row["title"] for row in rows], ["캠페인1", "캠페인3"])
+        self.assertEqual(rows[0]["status"], "캠페인 모집중")
+
+        _, content, _ = self.export("?output=jsonl&category=0&is_funding=true")
+        self.assertEqual([json.loads(line)["funding_amount"] for line in content.splitlines()], [300])
+
+        today = timezone.localdate()
+        _, content, _ = self.export(f"?output=jsonl&start={today}&end={today}")
+        self.assertEqual(len(content.splitlines()), 5)
+        _, content, _ = self.export(f"?output=jsonl&start={today + timedelta(days=1)}")
+        self.assertEqual(content, "")
+
+        for query in ("?status=abc", "?start=2023-13-01", "?is_funding=yes", "?output=xml"):
+            response = self.client.get(reverse("campaign_export_view") + query)
+            self.assertEqual(response.status_code, 400)
+
+    def test_chunked_queries(self):
+        """
+        묶음 단위로 나눠 읽고, 행마다 추가 쿼리가 없는지 테스트하는 함수입니다.
+        """
+        with mock.patch("campaigns.export.CHUNK_SIZE", 2):
+            _, content, queries = self.export("?output=jsonl")
+        self.assertEqual(len(content.splitlines()), 5)
+        self.assertEqual(len([query for query in queries if "campaign" in query["sql"]]), 3)
+
+    def test_permission(self):
+        """
+        관리자가 아니면 내보낼 수 없는지 테스트하는 함수입니다.
+        """
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse("campaign_export_view"))
+        self.assertEqual(response.status_code, 403)
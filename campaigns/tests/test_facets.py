@@ -0,0 +1,102 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from users.models import User
+from campaigns.models import Campaign
+
+
+class CampaignFacetTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 목록 패싯(카테고리, 상태, 펀딩여부별 개수) 테스트 클래스입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        for title, category, status, is_funding in (
+            ("탄소발자국 줄이기", 0, 1, False),
+            ("탄소중립 교육", 1, 1, True),
+            ("해변 정화", 0, 1, True),
+            ("끝난 봉사", 0, 2, False),
+            ("미승인 캠페인", 0, 0, False),
+        ):
+            cls.create_campaign(title, category, status, is_funding)
+
+    @classmethod
+    def create_campaign(cls, title, category=0, status=1, is_funding=False):
+        now = timezone.now()
+        return Campaign.objects.create(
+            title=title,
+            content="내용",
+            user=cls.user,
+            members=10,
+            campaign_start_date=now - timedelta(days=1),
+            campaign_end_date=now + timedelta(days=1),
+            category=category,
+            status=status,
+            is_funding=is_funding,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("campaign_facet_view")
+
+    def get_counts(self, data, field):
+        return {item["value"]: item["count"] for item in data[field]}
+
+    def test_facets(self):
+        """
+        승인된 캠페인의 항목별 개수와 조합별 개수를 쿼리 한 번으로 반환하는지 테스트하는 함수입니다.
+        """
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        data = response.data
+        self.assertEqual(data["total"], 4)
+        self.assertEqual(self.get_counts(data, "category"), {0: 3, 1: 1, 2: 0, 3: 0, 4: 0})
+        self.assertEqual(self.get_counts(data, "status"), {0: 0, 1: 3, 2: 1, 3: 0})
+        self.assertEqual(self.get_counts(data, "is_funding"), {True: 2, False: 2})
+        self.assertIn(
+            {"category": 0, "status": 1, "is_funding": True, "count": 1}, data["combinations"]
+        )
+
+    def test_filters(self):
+        """
+        목록과 같은 end, keyword 필터를 적용하는지 테스트하는 함수입니다.
+        """
+        response = self.client.get(self.url, {"end": "N"})
+        self.assertEqual(response.data["total"], 3)
+        self.assertEqual(self.get_counts(response.data, "status")[2], 0)
+
+        response = self.client.get(self.url, {"keyword": "탄소"})
+        self.assertEqual(response.data["total"], 2)
+        self.assertEqual(self.get_counts(response.data, "category"), {0: 1, 1: 1, 2: 0, 3: 0, 4: 0})
+
+    def test_cache_invalidation(self):
+        """
+        캐시된 패싯이 캠페인 저장 후에는 새로 계산되는지 테스트하는 함수입니다.
+        """
+        self.assertEqual(self.client.get(self.url).data["total"], 4)
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_campaign("새 캠페인", category=4)
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["total"], 5)
+        self.assertEqual(self.get_counts(response.data, "category")[4], 1)
+
+    def test_benchmark(self):
+        """
+        벤치마크 커맨드가 선택지별 COUNT 쿼리 수와 패싯 쿼리 수를 출력하는지 테스트하는 함수입니다.
+        """
+        out = StringIO()
+        call_command("benchmark_campaign_facets", repeat=1, stdout=out)
+        self.assertIn("선택지별 COUNT: 쿼리 11회", out.getvalue())
+        self.assertIn("패싯: 쿼리 1회", out.getvalue())
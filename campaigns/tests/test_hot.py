@@ -0,0 +1,107 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from users.models import User
+from campaigns.hot import HOT_HALF_LIFE_DAYS, hot_score, refresh_hot_ranks
+from campaigns.models import Campaign, Participant
+
+
+class CampaignHotRankTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 인기순 정렬 점수(hot_rank) 테스트 클래스입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        cls.old = cls.create_campaign("오래된 인기 캠페인")
+        cls.new = cls.create_campaign("요즘 뜨는 캠페인")
+        cls.quiet = cls.create_campaign("조용한 캠페인")
+
+    @classmethod
+    def create_campaign(cls, title):
+        now = timezone.now()
+        return Campaign.objects.create(
+            title=title,
+            content="내용",
+            user=cls.user,
+            members=100,
+            campaign_start_date=now - timedelta(days=1),
+            campaign_end_date=now + timedelta(days=10),
+            status=1,
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def get_popular(self):
+        response = self.client.get(reverse("campaign_view"), {"order": "popular"})
+        return [campaign["id"] for campaign in response.data["results"]]
+
+    def test_activity(self):
+        """
+        참가, 댓글, 좋아요가 hot_pending에 가중치만큼 쌓이고, 갱신하면 인기순 맨 앞에 오는지 테스트하는 함수입니다.
+        """
+        self.client.force_authenticate(user=self.user)
+        self.client.post(reverse("campaign_participation_view", kwargs={"campaign_id": self.new.id}))
+        self.client.post(
+            reverse("campaign_comment_view", kwargs={"campaign_id": self.new.id}), {"content": "댓글"}
+        )
+        Campaign.update_counts(self.new.id, like_count=1)
+        self.new.refresh_from_db()
+        self.assertEqual(self.new.hot_pending, 6)
+
+        self.assertEqual(refresh_hot_ranks(), 1)
+        self.new.refresh_from_db()
+        self.assertEqual(self.new.hot_pending, 0)
+        self.assertAlmostEqual(hot_score(self.new.hot_rank), 6, places=3)
+        self.assertEqual(self.get_popular(), [self.new.id, self.old.id, self.quiet.id])
+
+        # 참가를 취소하면 참가 가중치만큼 빠집니다.
+        self.client.post(reverse("campaign_participation_view", kwargs={"campaign_id": self.new.id}))
+        refresh_hot_ranks()
+        self.new.refresh_from_db()
+        self.assertAlmostEqual(hot_score(self.new.hot_rank), 3, places=3)
+        self.assertEqual(refresh_hot_ranks(), 0)
+
+    def test_decay(self):
+        """
+        예전 활동은 반감기마다 절반으로 줄어 최근 활동보다 뒤로 가는지 테스트하는 함수입니다.
+        """
+        now = timezone.now()
+        Campaign.objects.filter(id=self.old.id).update(hot_pending=8)
+        refresh_hot_ranks(now=now - timedelta(days=HOT_HALF_LIFE_DAYS * 2))
+        Campaign.objects.filter(id=self.new.id).update(hot_pending=3)
+        refresh_hot_ranks(now=now)
+
+        self.old.refresh_from_db()
+        self.assertAlmostEqual(hot_score(self.old.hot_rank, now), 2, places=3)
+        self.assertEqual(self.get_popular(), [self.new.id, self.old.id, self.quiet.id])
+
+        # 쌓인 점수에 새 활동을 더할 때도 줄어든 점수에서 더합니다.
+        Campaign.objects.filter(id=self.old.id).update(hot_pending=2)
+        refresh_hot_ranks(now=now)
+        self.old.refresh_from_db()
+        self.assertAlmostEqual(hot_score(self.old.hot_rank, now), 4, places=3)
+
+    def test_rebuild(self):
+        """
+        --rebuild가 참가 기록의 시각으로 점수를 다시 계산하는지 테스트하는 함수입니다.
+        """
+        participant = Participant.objects.create(user=self.user, campaign=self.old)
+        Participant.objects.filter(id=participant.id).update(
+            created_at=timezone.now() - timedelta(days=HOT_HALF_LIFE_DAYS)
+        )
+        Campaign.objects.filter(id=self.quiet.id).update(hot_rank=100, hot_pending=5)
+
+        call_command("refresh_campaign_hot_ranks", rebuild=True, stdout=StringIO())
+        self.old.refresh_from_db()
+        self.quiet.refresh_from_db()
+        self.assertAlmostEqual(hot_score(self.old.hot_rank), 1.5, places=3)
+        self.assertEqual((self.quiet.hot_rank, self.quiet.hot_pending), (0, 0))
@@ -0,0 +1,147 @@
+import shutil
+import tempfile
+from datetime import timedelta
+from io import BytesIO, StringIO
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+from rest_framework.test import APITestCase
+from users.models import User
+from campaigns.models import Campaign
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def make_image(name="image.jpg", size=(1600, 900), mode="RGB", format="JPEG", color="green"):
+    buffer = BytesIO()
+    Image.new(mode, size, color).save(buffer, format)
+    return SimpleUploadedFile(name, buffer.getvalue())
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, IMAGE_VARIANT_WORKERS=0)
+class ImageVariantTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 업로드 이미지 파생본 생성과 목록/상세 응답의 파생본 URL 테스트 클래스입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+
+    def create_campaign(self, image):
+        now = timezone.now()
+        with self.captureOnCommitCallbacks(execute=True):
+            campaign = Campaign.objects.create(
+                title="캠페인",
+                content="내용",
+                user=self.user,
+                members=10,
+                campaign_start_date=now - timedelta(days=1),
+                campaign_end_date=now + timedelta(days=1),
+                status=1,
+                image=image,
+            )
+        campaign.refresh_from_db()
+        return campaign
+
+    def open_variant(self, campaign, variant):
+        with default_storage.open(campaign.image_variants[variant]) as file:
+            image = Image.open(file)
+            image.load()
+        return image
+
+    def test_generate_variants(self):
+        """
+        업로드 후 small, large WebP 파생본을 만들어 경로를 기록하는지 테스트하는 함수입니다.
+        """
+        campaign = self.create_campaign(make_image())
+        self.assertEqual(campaign.image_variants["source"], campaign.image.name)
+
+        small = self.open_variant(campaign, "small")
+        self.assertEqual((small.format, small.size), ("WEBP", (400, 400)))
+        large = self.open_variant(campaign, "large")
+        self.assertEqual((large.format, large.size), ("WEBP", (1280, 720)))
+
+        transparent = self.create_campaign(
+            make_image("image.png", (300, 200), "LA", "PNG", (100, 128))
+        )
+        self.assertEqual(self.open_variant(transparent, "large").mode, "RGBA")
+
+    def test_replace_and_delete(self):
+        """
+        이미지를 바꾸면 이전 파생본을 지우고, 캠페인을 지우면 파생본도 지우는지 테스트하는 함수입니다.
+        """
+        campaign = self.create_campaign(make_image())
+        old = campaign.image_variants
+
+        with self.captureOnCommitCallbacks(execute=True):
+            campaign.image = make_image("other.jpg")
+            campaign.save()
+        campaign.refresh_from_db()
+        self.assertNotEqual(campaign.image_variants["small"], old["small"])
+        self.assertFalse(default_storage.exists(old["small"]))
+        self.assertTrue(default_storage.exists(campaign.image_variants["small"]))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            campaign.title = "제목만 수정"
+            campaign.save()
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.image_variants["source"], campaign.image.name)
+
+        variants = campaign.image_variants
+        with self.captureOnCommitCallbacks(execute=True):
+            campaign.delete()
+        self.assertFalse(default_storage.exists(variants["large"]))
+
+    def test_serializer_urls(self):
+        """
+        목록은 small, 상세는 large 파생본 URL을 주고, 파생본이 없으면 원본 URL을 주는지 테스트하는 함수입니다.
+        """
+        campaign = self.create_campaign(make_image())
+        response = self.client.get(reverse("campaign_view"))
+        self.assertTrue(response.data["results"][0]["image"].endswith(".small.webp"))
+        response = self.client.get(
+            reverse("campaign_detail_view", kwargs={"campaign_id": campaign.id})
+        )
+        self.assertTrue(response.data["image"].endswith(".large.webp"))
+
+        Campaign.objects.filter(id=campaign.id).update(image_variants={})
+        cache.clear()
+        response = self.client.get(reverse("campaign_view"))
+        self.assertTrue(response.data["results"][0]["image"].endswith(campaign.image.name))
+
+    def test_backfill(self):
+        """
+        파생본이 없는 기존 이미지만 골라 파생본을 만드는지 테스트하는 함수입니다.
+        """
+        done = self.create_campaign(make_image())
+        pending = self.create_campaign(make_image())
+        for variant in ("small", "large"):
+            default_storage.delete(pending.image_variants[variant])
+        Campaign.objects.filter(id=pending.id).update(image_variants={})
+
+        out = StringIO()
+        call_command(
+            "backfill_image_variants", model=["campaigns.campaign"], workers=0, stdout=out
+        )
+        self.assertIn("파생본 1개 생성", out.getvalue())
+        pending.refresh_from_db()
+        self.assertEqual(pending.image_variants["source"], pending.image.name)
+        self.assertTrue(default_storage.exists(pending.image_variants["small"]))
+        done.refresh_from_db()
+        self.assertTrue(default_storage.exists(done.image_variants["small"]))
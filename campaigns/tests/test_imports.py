@@ -0,0 +1,174 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from users.models import User
+from campaigns import imports
+from campaigns.models import Campaign, CampaignTagStat, Funding
+
+
+class CampaignImportTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 일괄 등록(커맨드, 백오피스 API) 테스트 클래스입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user("admin@test.com", "admin", "Qwerasdf1234!")
+        cls.admin.is_admin = True
+        cls.admin.save()
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("campaign_import_view")
+
+    def make_row(self, title, **kwargs):
+        return {
+            "title": title,
+            "content": "내용",
+            "members": 10,
+            "campaign_start_date": "2023-07-10T09:00:00+09:00",
+            "campaign_end_date": "2023-07-20T09:00:00+09:00",
+            "status": 1,
+            "category": 4,
+            **kwargs,
+        }
+
+    def run_command(self, content, suffix, *args):
+        with tempfile.NamedTemporaryFile("w", suffix=suffix, delete=False, encoding="utf-8") as file:
+            file.write(content)
+        self.addCleanup(os.remove, file.name)
+        out = StringIO()
+        call_command("import_campaigns", file.name, *args, stdout=out, stderr=StringIO())
+        return out.getvalue()
+
+    def test_import_json(self):
+        """
+        JSON 배열의 캠페인을 펀딩, 태그, 검색 색인과 함께 등록하고 잘못된 행만 오류로 남기는지 테스트하는 함수입니다.
+        """
+        rows = [
+            self.make_row("탄소 줄이기", tags=["환경", "탄소"]),
+            self.make_row(
+                "숲 가꾸기 펀딩",
+                tags=["환경"],
+                is_funding=True,
+                funding_goal=10000,
+                user_email="test@test.com",
+            ),
+            self.make_row("날짜 오류", campaign_end_date="2023-07-01T09:00:00+09:00"),
+            self.make_row("목표 없는 펀딩", is_funding=True),
+            self.make_row("없는 작성자", user_email="nobody@test.com"),
+        ]
+        report_path = os.path.join(tempfile.mkdtemp(), "errors.jsonl")
+        output = self.run_command(
+            json.dumps(rows, ensure_ascii=False), ".json",
+            "--user", "admin@test.com", "--report", report_path,
+        )
+        self.assertIn("5행 중 2개 등록, 3행 오류", output)
+
+        with open(report_path, encoding="utf-8") as file:
+            errors = [json.loads(line) for line in file]
+        self.assertEqual([error["row"] for error in errors], [3, 4, 5])
+        self.assertIn("campaign_start_date", errors[0]["errors"])
+        self.assertIn("funding_goal", errors[1]["errors"])
+        self.assertIn("user_email", errors[2]["errors"])
+
+        funding = Campaign.objects.get(title="숲 가꾸기 펀딩")
+        self.assertEqual(funding.user, self.user)
+        self.assertEqual(Funding.objects.get(campaign=funding).goal, 10000)
+        self.assertEqual(sorted(Campaign.objects.get(title="탄소 줄이기").tags.names()), ["탄소", "환경"])
+        self.assertEqual(
+            CampaignTagStat.objects.get(tag__name="환경", status=1, category=4).campaign_count, 2
+        )
+
+        response = self.client.get(reverse("campaign_view"), {"keyword": "숲 가꾸기"})
+        self.assertEqual([row["id"] for row in response.data["results"]], [funding.id])
+
+    def test_import_csv_api(self):
+        """
+        내보내기 형식(한글 헤더, 상태 이름)의 CSV를 API로 등록하고, dry_run과 권한을 확인하는 테스트 함수입니다.
+        """
+        content = (
+            "﻿제목,내용,모집 인원,진행 상태,카테고리,캠페인 시작일,캠페인 마감일,태그\n"
+            "플로깅,같이 걸어요,5,캠페인 모집중,환경운동,2023-07-10T09:00:00+09:00,2023-07-20T09:00:00+09:00,\"환경, 걷기\"\n"
+            "잘못된 카테고리,내용,5,캠페인 모집중,없는 카테고리,2023-07-10T09:00:00+09:00,2023-07-20T09:00:00+09:00,\n"
+        ).encode("utf-8")
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.post(
+            self.url,
+            {"file": SimpleUploadedFile("campaigns.csv", content), "dry_run": "true"},
+            format="multipart",
+        )
+        self.assertEqual((response.data["created"], response.data["failed"]), (0, 1))
+        self.assertFalse(Campaign.objects.exists())
+
+        response = self.client.post(
+            self.url, {"file": SimpleUploadedFile("campaigns.csv", content)}, format="multipart"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["total"], 2)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(response.data["errors"][0]["row"], 2)
+        campaign = Campaign.objects.get()
+        self.assertEqual((campaign.status, campaign.category, campaign.user), (1, 4, self.admin))
+        self.assertEqual(sorted(campaign.tags.names()), ["걷기", "환경"])
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            self.url, {"file": SimpleUploadedFile("campaigns.csv", content)}, format="multipart"
+        )
+        self.assertEqual(response.status_code, 403)
+
+    def test_iter_json(self):
+        """
+        JSON Lines와 읽기 단위에 걸쳐 잘린 객체를 나눠 읽고, 깨진 JSON은 그 행에서 멈추는지 테스트하는 함수입니다.
+        """
+        rows = [{"title": f"캠페인 {i}", "tags": ["a", "b"]} for i in range(5)]
+        content = "\n".join(json.dumps(row, ensure_ascii=False) for row in rows)
+        with mock.patch.object(imports, "READ_SIZE", 7):
+            self.assertEqual(list(imports.iter_json(StringIO(content))), rows)
+            self.assertEqual(list(imports.iter_json(StringIO(json.dumps(rows)))), rows)
+
+        broken = json.dumps([self.make_row("정상")]) + ',{"title": '
+        report = imports.import_campaigns(StringIO(broken), "json", user=self.admin)
+        self.assertEqual((report["created"], report["failed"]), (1, 1))
+        self.assertEqual(report["errors"][0]["row"], 2)
+
+    def test_database_error(self):
+        """
+        DB 제약조건에 걸린 행이 있으면 그 행만 빼고 나머지 행은 등록하는지 테스트하는 함수입니다.
+        """
+        rows = [self.make_row("정상 1"), self.make_row("음수 인원", members=-1), self.make_row("정상 2")]
+        report = imports.import_campaigns(StringIO(json.dumps(rows)), "json", user=self.admin)
+        self.assertEqual(report["created"], 2)
+        self.assertEqual(report["failed"], 1)
+        self.assertEqual(report["errors"][0]["row"], 2)
+        self.assertEqual(
+            sorted(Campaign.objects.values_list("title", flat=True)), ["정상 1", "정상 2"]
+        )
+
+    def test_assign_ids(self):
+        """
+        bulk_create가 pk를 돌려주지 않는 DB에서 방금 넣은 캠페인의 id를 순서대로 채우는지 테스트하는 함수입니다.
+        """
+        imports.import_campaigns(StringIO(json.dumps([self.make_row("기존")])), "json", user=self.admin)
+        last_id = Campaign.objects.get().id
+        importer = imports.CampaignImporter(user=self.admin)
+        campaigns = [importer.validate(1, self.make_row("같은 제목"))[0] for _ in range(3)]
+        Campaign.objects.bulk_create(campaigns)
+        expected = [campaign.id for campaign in campaigns]
+        for campaign in campaigns:
+            campaign.id = None
+
+        imports.assign_ids(campaigns, last_id)
+        self.assertEqual([campaign.id for campaign in campaigns], expected)
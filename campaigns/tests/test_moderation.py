@@ -0,0 +1,117 @@
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from alarms.models import Notification
+from users.models import User
+from campaigns.models import Campaign, CampaignTagStat
+
+
+class CampaignBulkStatusTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 백오피스 캠페인 일괄 상태 변경 테스트 클래스입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user("admin@test.com", "admin", "Qwerasdf1234!")
+        cls.admin.is_admin = True
+        cls.admin.save()
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.admin)
+        self.url = reverse("bulk_status_view")
+
+    def create_campaigns(self, count, status=0):
+        now = timezone.now()
+        campaigns = []
+        for i in range(count):
+            campaign = Campaign.objects.create(
+                title=f"캠페인{i}",
+                content="내용",
+                user=self.user,
+                members=10,
+                campaign_start_date=now,
+                campaign_end_date=now + timedelta(days=1),
+                status=status,
+            )
+            campaign.tags.add("환경")
+            campaigns.append(campaign)
+        return campaigns
+
+    def moderate(self, campaign_ids, to_status):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.put(
+                self.url, {"campaign_ids": campaign_ids, "status": to_status}, format="json"
+            )
+
+    def test_bulk_approve(self):
+        """
+        허용된 변경만 적용하고 캠페인별 결과와 알림, 태그 통계가 맞는지 테스트하는 함수입니다.
+        """
+        pending = self.create_campaigns(3)
+        ended = self.create_campaigns(1, status=2)[0]
+        approved = self.create_campaigns(1, status=1)[0]
+
+        response = self.moderate(
+            [campaign.id for campaign in pending] + [ended.id, approved.id, 9999], 1
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["updated"], 3)
+        results = {result["id"]: result["result"] for result in response.data["results"]}
+        self.assertEqual(
+            results,
+            {
+                **{campaign.id: "updated" for campaign in pending},
+                ended.id: "invalid_transition",
+                approved.id: "unchanged",
+                9999: "not_found",
+            },
+        )
+        self.assertEqual(Campaign.objects.filter(status=1).count(), 4)
+        self.assertEqual(Campaign.objects.get(id=ended.id).status, 2)
+
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 3)
+        self.assertEqual(
+            CampaignTagStat.objects.get(tag__name="환경", status=1, category=0).campaign_count, 4
+        )
+
+    def test_constant_queries(self):
+        """
+        변경할 캠페인 수와 상관없이 쿼리 수가 일정한지 테스트하는 함수입니다.
+        """
+        small = [campaign.id for campaign in self.create_campaigns(2)]
+        large = [campaign.id for campaign in self.create_campaigns(20)]
+        with CaptureQueriesContext(connection) as small_queries:
+            self.moderate(small, 3)
+        with CaptureQueriesContext(connection) as large_queries:
+            self.moderate(large, 3)
+        self.assertEqual(len(small_queries), len(large_queries))
+        self.assertEqual(Campaign.objects.filter(status=3).count(), 22)
+
+    def test_invalid_request(self):
+        """
+        잘못된 요청과 관리자가 아닌 유저의 요청을 거절하는지 테스트하는 함수입니다.
+        """
+        campaign = self.create_campaigns(1)[0]
+        for data in (
+            {"campaign_ids": [], "status": 1},
+            {"campaign_ids": "1", "status": 1},
+            {"campaign_ids": [campaign.id], "status": 2},
+            {"campaign_ids": list(range(501)), "status": 1},
+            {"campaign_ids": [True], "status": 1},
+            {"campaign_ids": [campaign.id], "status": True},
+        ):
+            response = self.client.put(self.url, data, format="json")
+            self.assertEqual(response.status_code, 400)
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.put(
+            self.url, {"campaign_ids": [campaign.id], "status": 1}, format="json"
+        )
+        self.assertEqual(response.status_code, 403)
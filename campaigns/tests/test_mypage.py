@@ -0,0 +1,128 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from users.models import User
+from campaigns.models import Campaign, CampaignComment, CampaignReview, Participant
+
+
+class MyPageDashboardTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 마이페이지 대시보드와 섹션별 더 보기 테스트 클래스입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        cls.other = User.objects.create_user("other@test.com", "Jane", "Qwerasdf1234!")
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(user=self.user)
+
+    def create_activity(self, count):
+        now = timezone.now()
+        for i in range(count):
+            own = Campaign.objects.create(
+                title=f"내 캠페인{i}",
+                content="내용",
+                user=self.user,
+                members=10,
+                campaign_start_date=now,
+                campaign_end_date=now + timedelta(days=i + 1),
+                status=1,
+            )
+            other = Campaign.objects.create(
+                title=f"다른 캠페인{i}",
+                content="내용",
+                user=self.other,
+                members=10,
+                campaign_start_date=now,
+                campaign_end_date=now + timedelta(days=i + 1),
+                status=1,
+            )
+            other.like.add(self.user)
+            Participant.objects.create(campaign=other, user=self.user)
+            CampaignReview.objects.create(
+                user=self.user, campaign=other, title="후기", content="내용"
+            )
+            CampaignComment.objects.create(user=self.user, campaign=own, content="댓글")
+        CampaignComment.objects.create(user=self.other, campaign=own, content="남의 댓글")
+
+    def get_dashboard(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("mypage_dashboard"))
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_dashboard(self):
+        """
+        섹션별 개수와 첫 페이지를 반환하고, 쿼리 수가 데이터 양과 상관없이 일정한지 테스트하는 함수입니다.
+        """
+        self.create_activity(2)
+        response, small = self.get_dashboard()
+        self.assertEqual(
+            response.data["counts"],
+            {"campaigns": 2, "attends": 2, "likes": 2, "reviews": 2, "comments": 2},
+        )
+        self.assertEqual(len(response.data["campaigns"]["results"]), 2)
+        self.assertIsNone(response.data["campaigns"]["next"])
+
+        cache.clear()
+        self.create_activity(8)
+        response, large = self.get_dashboard()
+        self.assertEqual(small, large)
+        self.assertEqual(response.data["counts"]["comments"], 10)
+        self.assertEqual(
+            response.data["campaigns"]["results"][0]["title"], "내 캠페인7"
+        )
+        self.assertEqual(response.data["comments"]["results"][0]["user"], "John")
+
+    def test_load_more(self):
+        """
+        섹션별 next 주소로 이어서 가져오면 빠짐없이, 중복 없이 모두 가져오는지 테스트하는 함수입니다.
+        """
+        self.create_activity(10)
+        response, _ = self.get_dashboard()
+        for section in ("campaigns", "attends", "likes", "reviews", "comments"):
+            ids = [item["id"] for item in response.data[section]["results"]]
+            url = response.data[section]["next"]
+            while url:
+                page = self.client.get(url)
+                self.assertEqual(page.status_code, 200)
+                ids += [item["id"] for item in page.data["results"]]
+                url = page.data["next"]
+            self.assertEqual(len(ids), 10)
+            self.assertEqual(len(set(ids)), 10)
+
+        response = self.client.get(reverse("mypage_section", kwargs={"section": "unknown"}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_cache_invalidation(self):
+        """
+        대시보드는 캐시되고, 본인의 댓글 작성과 좋아요 취소 시 바로 갱신되는지 테스트하는 함수입니다.
+        """
+        self.create_activity(1)
+        self.get_dashboard()
+        response, queries = self.get_dashboard()
+        self.assertEqual(queries, 0)
+
+        campaign = Campaign.objects.filter(user=self.user).first()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("campaign_comment_view", kwargs={"campaign_id": campaign.id}),
+                {"content": "새 댓글"},
+            )
+        response, _ = self.get_dashboard()
+        self.assertEqual(response.data["counts"]["comments"], 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.likes.clear()
+        response, _ = self.get_dashboard()
+        self.assertEqual(response.data["counts"]["likes"], 0)
+        self.assertEqual(response.data["likes"]["results"], [])
@@ -0,0 +1,132 @@
+import threading
+from datetime import timedelta
+from django.db import connection
+from django.core.cache import cache
+from django.test import skipUnlessDBFeature
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient, APITestCase, APITransactionTestCase
+from users.models import User
+from campaigns.models import Campaign, Participant
+
+
+@skipUnlessDBFeature("test_db_allows_multiple_connections")
+class CampaignParticipationConcurrencyTest(APITransactionTestCase):
+    """
+    작성자 : 최준영
+    내용 : 동시에 많은 참가 요청이 들어와도 모집 인원을 넘지 않는지 확인하는 테스트 클래스입니다.
+    스레드마다 별도 DB 연결이 필요하므로 테스트 DB에 여러 연결을 열 수 없는 sqlite에서는 건너뜁니다.
+    최초 작성일 : 2023.07.08
+    """
+
+    USER_COUNT = 200
+    MEMBERS = 50
+
+    def setUp(self):
+        self.users = User.objects.bulk_create(
+            [
+                User(email=f"user{i}@test.com", username=f"user{i}")
+                for i in range(self.USER_COUNT)
+            ]
+        )
+        now = timezone.now()
+        self.campaign = Campaign.objects.create(
+            title="캠페인",
+            content="내용",
+            user=self.users[0],
+            members=self.MEMBERS,
+            campaign_start_date=now - timedelta(days=1),
+            campaign_end_date=now + timedelta(days=1),
+            status=1,
+        )
+
+    def join(self, user, barrier, messages):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        url = reverse("campaign_participation_view", kwargs={"campaign_id": self.campaign.id})
+        barrier.wait()
+        try:
+            messages.append(client.post(url).data["message"])
+        finally:
+            connection.close()
+
+    def test_concurrent_participation_capacity(self):
+        """
+        200명이 동시에 참가 신청했을 때 정원(50명)만큼만 참가되고
+        M2M, Participant, participant_count가 모두 일치하는지 테스트하는 함수입니다.
+        """
+        barrier = threading.Barrier(self.USER_COUNT)
+        messages = []
+        threads = [
+            threading.Thread(target=self.join, args=(user, barrier, messages))
+            for user in self.users
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(messages.count("캠페인 참가 성공!"), self.MEMBERS)
+        self.assertEqual(
+            messages.count("캠페인 참가 정원을 초과하여 신청할 수 없습니다."),
+            self.USER_COUNT - self.MEMBERS,
+        )
+        self.assertEqual(self.campaign.participant_count, self.MEMBERS)
+        self.assertEqual(self.campaign.participant.count(), self.MEMBERS)
+        self.assertEqual(Participant.objects.filter(campaign=self.campaign).count(), self.MEMBERS)
+
+
+class CampaignParticipantTableTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 참가 기록이 Participant 한 테이블에만 저장되는지 확인하는 테스트 클래스입니다.
+    최초 작성일 : 2023.07.08
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("user@test.com", "user", "Qwerasdf1234!")
+        now = timezone.now()
+        self.campaign = Campaign.objects.create(
+            title="캠페인",
+            content="내용",
+            user=self.user,
+            members=10,
+            campaign_start_date=now - timedelta(days=1),
+            campaign_end_date=now + timedelta(days=1),
+            activity_start_date=now + timedelta(days=2),
+            status=1,
+        )
+        self.url = reverse("campaign_participation_view", kwargs={"campaign_id": self.campaign.id})
+
+    def test_participation_writes_one_row(self):
+        """
+        참가 신청 시 Participant 한 행만 생기고 M2M 조회와 알림 조회가 같은 행을 보는지 테스트하는 함수입니다.
+        """
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 200)
+
+        participant = Participant.objects.get(campaign=self.campaign, user=self.user)
+        self.assertTrue(participant.is_participated)
+        self.assertIsNotNone(participant.created_at)
+        self.assertEqual(list(self.campaign.participant.all()), [self.user])
+        self.assertEqual(list(self.user.participants.all()), [self.campaign])
+        self.assertTrue(self.client.get(self.url).data["is_participated"])
+
+        response = self.client.post(self.url)
+        self.assertFalse(response.data["is_participated"])
+        self.assertFalse(Participant.objects.exists())
+        self.assertEqual(self.campaign.participant.count(), 0)
+
+    def test_m2m_add_creates_participant(self):
+        """
+        campaign.participant.add()로 추가해도 참가 상태의 Participant가 생기는지 테스트하는 함수입니다.
+        """
+        self.campaign.participant.add(self.user)
+        self.assertTrue(
+            Participant.objects.filter(
+                campaign=self.campaign, user=self.user, is_participated=True
+            ).exists()
+        )
@@ -0,0 +1,145 @@
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from users.models import User
+from campaigns.models import Campaign, CampaignComment, CampaignReview, Funding
+from users.models import UserProfile
+from campaigns.serializers import CampaignReviewSerializer, CampaignSerializer
+from config.prefetch import plan_queryset
+
+
+class CampaignPrefetchPlanTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 시리얼라이저 기반 prefetch 계획으로 목록 조회 쿼리 수가 캠페인 수와 상관없이 일정한지 확인하는 테스트 클래스입니다.
+    최초 작성일 : 2023.07.08
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        cls.user.is_admin = True
+        cls.user.save()
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+
+    def create_campaigns(self, count):
+        now = timezone.now()
+        start = Campaign.objects.count()
+        for i in range(start, start + count):
+            writer = User.objects.create_user(f"writer{i}@test.com", f"writer{i}")
+            campaign = Campaign.objects.create(
+                title=f"캠페인{i}",
+                content="내용",
+                user=writer,
+                members=10,
+                campaign_start_date=now,
+                campaign_end_date=now + timedelta(days=1),
+                status=1,
+            )
+            campaign.tags.add("환경", f"태그{i}")
+            campaign.like.add(self.user)
+            Funding.objects.create(campaign=campaign, goal=1000, amount=10)
+            CampaignReview.objects.create(
+                user=writer, campaign=campaign, title="후기", content="내용"
+            )
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def assert_constant_queries(self, url):
+        self.create_campaigns(2)
+        small = self.count_queries(url)
+        self.create_campaigns(8)
+        self.assertEqual(self.count_queries(url), small)
+
+    def test_tag_filter_view(self):
+        self.assert_constant_queries(reverse("tag_filter_view") + "?name=환경")
+
+    def test_user_like_view(self):
+        self.assert_constant_queries(reverse("campaign_user_like"))
+
+    def test_apply_list_view(self):
+        self.assert_constant_queries(reverse("status_view"))
+
+    def test_plan_queryset(self):
+        """
+        source를 따라 select_related/prefetch_related 대상이 계획되는지 테스트하는 함수입니다.
+        """
+        queryset = plan_queryset(Campaign.objects.all(), CampaignSerializer)
+        self.assertEqual(queryset.query.select_related, {"user": {}, "fundings": {}})
+        self.assertEqual(queryset._prefetch_related_lookups, ("tags",))
+
+        self.create_campaigns(5)
+        with self.assertNumQueries(1):
+            reviews = plan_queryset(CampaignReview.objects.all(), CampaignReviewSerializer)
+            data = CampaignReviewSerializer(reviews, many=True).data
+        self.assertEqual(data[0]["author"], "writer0")
+
+
+class CommentProfileImageTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 댓글 목록의 작성자 프로필 이미지를 목록 단위로 한 번에 조회하는지 확인하는 테스트 클래스입니다.
+    최초 작성일 : 2023.07.08
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        now = timezone.now()
+        cls.campaign = Campaign.objects.create(
+            title="캠페인",
+            content="내용",
+            user=cls.user,
+            members=10,
+            campaign_start_date=now,
+            campaign_end_date=now + timedelta(days=1),
+            status=1,
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+
+    def create_comments(self, count):
+        start = CampaignComment.objects.count() // 2
+        for i in range(start, start + count):
+            writer = User.objects.create_user(f"writer{i}@test.com", f"writer{i}")
+            if i % 2:
+                UserProfile.objects.filter(user=writer).update(image="profile_images/a.png")
+            CampaignComment.objects.create(user=writer, campaign=self.campaign, content="댓글")
+            CampaignComment.objects.create(user=self.user, campaign=self.campaign, content="댓글")
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response
+
+    def test_comment_view(self):
+        url = reverse("campaign_comment_view", kwargs={"campaign_id": self.campaign.id})
+        self.create_comments(1)
+        small, _ = self.count_queries(url)
+        self.create_comments(5)
+        count, response = self.count_queries(url + "?page_size=10")
+        self.assertEqual(count, small)
+        images = {row["author"]: row["user_image"] for row in response.data["results"]}
+        self.assertEqual(images["writer1"], "/media/profile_images/a.png")
+        self.assertIsNone(images["writer2"])
+
+    def test_user_comment_view(self):
+        UserProfile.objects.filter(user=self.user).update(image="profile_images/b.png")
+        self.create_comments(1)
+        small, _ = self.count_queries("/campaigns/mypage/comment/")
+        self.create_comments(5)
+        count, response = self.count_queries("/campaigns/mypage/comment/")
+        self.assertEqual(count, small)
+        self.assertEqual(len(response.data), 6)
+        self.assertEqual(response.data[0]["user_image"], "/media/profile_images/b.png")
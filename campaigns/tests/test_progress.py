@@ -0,0 +1,151 @@
+import asyncio
+import time
+from datetime import timedelta
+from unittest import mock
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.core.cache import cache
+from django.test import TransactionTestCase, override_settings
+from django.utils import timezone
+from users.models import User
+from payments.models import Payment
+from campaigns.models import Campaign, Funding
+from campaigns.progress import get_funding_progress, group_name, publish_funding_progress
+import campaigns.routing
+
+
+@override_settings(FUNDING_PROGRESS_MAX_RATE=10)
+class FundingProgressTest(TransactionTestCase):
+    """
+    작성자 : 최준영
+    내용 : 펀딩 진행률 계산과 웹소켓 전송 테스트 클래스입니다.
+    컨슈머의 database_sync_to_async가 DB 연결을 정리하므로 트랜잭션으로 감싸지 않는 TransactionTestCase를 사용합니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        now = timezone.now()
+        self.campaign = Campaign.objects.create(
+            title="펀딩 캠페인",
+            content="내용",
+            user=self.user,
+            members=10,
+            campaign_start_date=now,
+            campaign_end_date=now + timedelta(days=1),
+            status=1,
+            is_funding=True,
+        )
+        Funding.objects.create(campaign=self.campaign, goal=1000, amount=250)
+        for status in (0, 0, 1):
+            Payment.objects.create(
+                user=self.user, amount="100", campaign=self.campaign, status=status
+            )
+
+    def test_progress(self):
+        """
+        금액, 목표, 퍼센트, 후원자 수(취소 제외, 중복 제거)를 계산하는지 테스트하는 함수입니다.
+        """
+        self.assertEqual(
+            get_funding_progress(self.campaign.id),
+            {
+                "campaign_id": self.campaign.id,
+                "amount": 250,
+                "goal": 1000,
+                "percent": 25.0,
+                "donor_count": 1,
+            },
+        )
+        self.assertIsNone(get_funding_progress(self.campaign.id + 1))
+
+    def test_publish(self):
+        """
+        진행률이 캠페인 그룹으로 전송되는지 테스트하는 함수입니다.
+        """
+        layer = get_channel_layer()
+
+        async def run():
+            channel = await layer.new_channel()
+            await layer.group_add(group_name(self.campaign.id), channel)
+            return channel
+
+        channel = async_to_sync(run)()
+        publish_funding_progress(self.campaign.id)
+        message = async_to_sync(layer.receive)(channel)
+        self.assertEqual(message["type"], "funding.progress")
+        self.assertEqual(message["progress"]["amount"], 250)
+
+    @override_settings(FUNDING_PROGRESS_MAX_RATE=4)
+    def test_publish_coalesces(self):
+        """
+        한 구간에 몰린 전송은 바로 한 번, 다음 구간에 마지막 금액으로 한 번만 보내는지 테스트하는 함수입니다.
+        """
+        layer = get_channel_layer()
+
+        async def subscribe():
+            channel = await layer.new_channel()
+            await layer.group_add(group_name(self.campaign.id), channel)
+            return channel
+
+        async def receive_all(channel):
+            messages = []
+            while True:
+                try:
+                    messages.append(await asyncio.wait_for(layer.receive(channel), timeout=0.6))
+                except asyncio.TimeoutError:
+                    return messages
+
+        channel = async_to_sync(subscribe)()
+        with mock.patch("campaigns.progress.get_funding_progress", wraps=get_funding_progress) as get:
+            # 구간(0.25초)이 막 시작했을 때 보내서 여섯 번 모두 같은 구간에 들어가게 합니다.
+            time.sleep(0.25 - time.time() % 0.25)
+            publish_funding_progress(self.campaign.id)
+            Funding.objects.filter(campaign=self.campaign).update(amount=400)
+            for _ in range(5):
+                publish_funding_progress(self.campaign.id)
+            messages = async_to_sync(receive_all)(channel)
+        self.assertEqual([message["progress"]["amount"] for message in messages], [250, 400])
+        self.assertEqual(get.call_count, 2)
+
+    def test_publish_failure_logged(self):
+        """
+        채널 레이어 전송이 실패해도 예외를 올리지 않고 로그만 남기는지 테스트하는 함수입니다.
+        """
+        with mock.patch("campaigns.progress.get_channel_layer", side_effect=OSError("redis down")):
+            with self.assertLogs("campaigns.progress", level="ERROR"):
+                publish_funding_progress(self.campaign.id)
+
+    def test_consumer_coalesces(self):
+        """
+        연결 시 현재 진행률을 받고, 간격 안에 몰린 메세지는 마지막 값 하나로 합쳐 받는지 테스트하는 함수입니다.
+        """
+        campaign_id = self.campaign.id
+
+        async def run():
+            communicator = WebsocketCommunicator(
+                URLRouter(campaigns.routing.websocket_urlpatterns),
+                f"/ws/campaigns/{campaign_id}/funding/",
+            )
+            connected, _ = await communicator.connect()
+            self.assertTrue(connected)
+            first = await communicator.receive_json_from()
+
+            layer = get_channel_layer()
+            for amount in range(300, 800, 100):
+                await layer.group_send(
+                    group_name(campaign_id),
+                    {"type": "funding.progress", "progress": {**first, "amount": amount}},
+                )
+            second = await communicator.receive_json_from(timeout=1)
+            nothing = await communicator.receive_nothing(timeout=0.3)
+            await communicator.disconnect()
+            return first, second, nothing
+
+        first, second, nothing = async_to_sync(run)()
+        self.assertEqual(first["type"], "funding_progress")
+        self.assertEqual(first["amount"], 250)
+        self.assertEqual(second["amount"], 700)
+        self.assertTrue(nothing)
@@ -0,0 +1,150 @@
+from datetime import timedelta
+from io import StringIO
+import numpy as np
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from users.models import User
+from campaigns.models import Campaign, CampaignNeighbor
+from campaigns.related import FeatureMatrix, rebuild_neighbors, top_neighbors, update_neighbors
+
+
+class CampaignNeighborTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 관련 캠페인 계산과 캠페인 상세 조회의 관련 캠페인 응답 테스트 클래스입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        cls.users = [
+            User.objects.create_user(f"user{i}@test.com", f"user{i}") for i in range(3)
+        ]
+
+    def setUp(self):
+        cache.clear()
+
+    def create_campaign(self, tags, category=0, status=1):
+        now = timezone.now()
+        campaign = Campaign.objects.create(
+            title="캠페인",
+            content="내용",
+            user=self.user,
+            members=10,
+            campaign_start_date=now,
+            campaign_end_date=now + timedelta(days=1),
+            status=status,
+            category=category,
+        )
+        campaign.tags.add(*tags)
+        return campaign
+
+    def neighbor_ids(self, campaign):
+        return list(
+            CampaignNeighbor.objects.filter(campaign=campaign)
+            .order_by("rank")
+            .values_list("neighbor_id", flat=True)
+        )
+
+    def test_matrix_scores(self):
+        """
+        역색인으로 계산한 유사도가 밀집 행렬로 직접 계산한 코사인 유사도와 같은지 테스트하는 함수입니다.
+        """
+        random = np.random.default_rng(0)
+        ids = np.arange(1, 201) * 3
+        owners = random.choice(ids, 1000)
+        keys = random.integers(0, 50, 1000)
+        pairs = np.unique(np.stack([owners, keys], axis=1), axis=0)
+        matrix = FeatureMatrix(ids, {"tag": (pairs[:, 0], pairs[:, 1])})
+
+        dense = np.zeros((len(ids), 50))
+        idf = np.log1p(len(ids) / np.bincount(pairs[:, 1], minlength=50).clip(1))
+        dense[np.searchsorted(ids, pairs[:, 0]), pairs[:, 1]] = 3.0 * idf[pairs[:, 1]]
+        norms = np.linalg.norm(dense, axis=1, keepdims=True)
+        dense = dense / np.where(norms, norms, 1)
+        expected = dense @ dense.T
+        np.fill_diagonal(expected, 0)
+
+        rows = np.arange(len(ids))
+        np.testing.assert_allclose(matrix.scores(rows), expected, atol=1e-9)
+        cols, top = top_neighbors(matrix.scores(rows[:5]), 3)
+        np.testing.assert_allclose(top, -np.sort(-expected[:5], axis=1)[:, :3], atol=1e-9)
+
+    def test_rebuild_and_detail(self):
+        """
+        태그와 참가자가 겹치는 캠페인이 먼저 추천되고, 승인 전 캠페인은 추천되지 않으며,
+        상세 조회에서 관련 캠페인을 쿼리 한 번으로 가져오는지 테스트하는 함수입니다.
+        """
+        first = self.create_campaign(["환경", "봉사"])
+        twin = self.create_campaign(["환경", "봉사"])
+        near = self.create_campaign(["환경"])
+        other = self.create_campaign(["교육"], category=1)
+        hidden = self.create_campaign(["환경", "봉사"], status=0)
+        for user in self.users:
+            first.participant.add(user)
+            twin.participant.add(user)
+
+        call_command("rebuild_campaign_neighbors", stdout=StringIO())
+        self.assertEqual(self.neighbor_ids(first), [twin.id, near.id])
+        self.assertEqual(self.neighbor_ids(other), [])
+        self.assertFalse(CampaignNeighbor.objects.filter(neighbor=hidden).exists())
+
+        url = reverse("campaign_detail_view", kwargs={"campaign_id": first.id})
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["id"] for item in response.data["related"]], [twin.id, near.id])
+        self.assertEqual(
+            len([query for query in queries if "campaign_neighbor" in query["sql"]]), 1
+        )
+
+    def test_incremental(self):
+        """
+        새 캠페인만 계산해도 새 캠페인의 목록이 만들어지고, 기존 캠페인의 목록과 상세 캐시에 반영되는지 테스트하는 함수입니다.
+        """
+        first = self.create_campaign(["환경", "봉사"])
+        near = self.create_campaign(["환경"])
+        self.create_campaign(["교육"], category=1)
+        rebuild_neighbors()
+        self.assertEqual(self.neighbor_ids(first), [near.id])
+
+        url = reverse("campaign_detail_view", kwargs={"campaign_id": first.id})
+        self.client.get(url)
+        new = self.create_campaign(["환경", "봉사"])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(update_neighbors(), 3)
+        self.assertEqual(self.neighbor_ids(new), [first.id, near.id])
+        self.assertEqual(self.neighbor_ids(first), [new.id, near.id])
+        response = self.client.get(url)
+        self.assertEqual([item["id"] for item in response.data["related"]], [new.id, near.id])
+
+        self.assertEqual(update_neighbors(), 0)
+
+    def test_skip_ended_and_scored(self):
+        """
+        종료된 캠페인은 추천 후보에서 빠지고, 이웃이 없는 캠페인도 계산 시각이 남아 다시 계산하지 않으며,
+        태그가 바뀌면 다시 계산하는지 테스트하는 함수입니다.
+        """
+        first = self.create_campaign(["환경", "봉사"])
+        ended = self.create_campaign(["환경", "봉사"], status=2)
+        lonely = self.create_campaign(["교육"], category=1)
+        self.assertEqual(update_neighbors(), 1)
+        self.assertEqual(self.neighbor_ids(first), [])
+        self.assertEqual(self.neighbor_ids(ended), [first.id])
+        lonely.refresh_from_db()
+        self.assertIsNotNone(lonely.neighbors_scored_at)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(update_neighbors(), 0)
+
+        lonely.tags.add("봉사")
+        self.assertEqual(update_neighbors(), 3)
+        self.assertEqual(self.neighbor_ids(lonely), [first.id])
+        self.assertEqual(self.neighbor_ids(first), [lonely.id])
+        self.assertEqual(self.neighbor_ids(ended), [first.id, lonely.id])
@@ -0,0 +1,106 @@
+from io import StringIO
+from django.urls import reverse
+from django.utils import timezone
+from datetime import timedelta
+from django.core.management import call_command
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+from users.models import User
+from campaigns.models import Campaign, CampaignSearchIndex
+from campaigns.search import tokenize
+
+
+class CampaignSearchTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 키워드 검색 색인 테스트 클래스입니다.
+    최초 작성일 : 2023.07.06
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        now = timezone.now()
+        default = {
+            "user": cls.user,
+            "members": 100,
+            "campaign_start_date": now - timedelta(days=1),
+            "campaign_end_date": now + timedelta(days=7),
+            "status": 1,
+            "category": 1,
+        }
+        cls.title_match = Campaign.objects.create(
+            title="탄소발자국 줄이기", content="함께 해요", **default
+        )
+        cls.content_match = Campaign.objects.create(
+            title="플로깅 모임", content="걸으면서 탄소발자국을 줄입니다", **default
+        )
+        cls.not_match = Campaign.objects.create(
+            title="해변 정화", content="바다 쓰레기를 줍습니다", **default
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_tokenize(self):
+        """
+        한글은 2글자 n-gram으로, 영문/숫자는 별도 단어로 나뉘는지 테스트하는 함수입니다.
+        """
+        self.assertEqual(tokenize("탄소발자국을"), ["탄소", "소발", "발자", "자국", "국을"])
+        self.assertEqual(tokenize("ECO 캠페인"), ["ec", "co", "캠페", "페인"])
+        self.assertEqual(tokenize("봉사 a"), ["봉사", "a"])
+
+    def test_search_ranked_by_relevance(self):
+        """
+        제목에 걸린 캠페인이 본문에만 걸린 캠페인보다 먼저 나오는지 테스트하는 함수입니다.
+        """
+        url = reverse("campaign_view") + "?keyword=탄소발자국"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        ids = [campaign["id"] for campaign in response.data["results"]]
+        self.assertEqual(ids, [self.title_match.id, self.content_match.id])
+
+    def test_search_with_order(self):
+        """
+        검색 결과가 기존 order 필터와 같이 동작하는지 테스트하는 함수입니다.
+        """
+        url = reverse("campaign_view") + "?keyword=탄소&order=recent&end=N"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        ids = [campaign["id"] for campaign in response.data["results"]]
+        self.assertEqual(ids, [self.content_match.id, self.title_match.id])
+
+    def test_search_by_tag_after_update(self):
+        """
+        태그 추가 시 색인이 갱신되어 태그로 검색되는지 테스트하는 함수입니다.
+        """
+        self.not_match.tags.add("업사이클링")
+        url = reverse("campaign_view") + "?keyword=업사이클"
+        response = self.client.get(url)
+        ids = [campaign["id"] for campaign in response.data["results"]]
+        self.assertEqual(ids, [self.not_match.id])
+
+    def test_search_by_author_after_rename(self):
+        """
+        유저 이름을 바꾸면 그 유저가 작성한 캠페인이 새 이름으로 검색되고 예전 이름으로는 검색되지 않는지 테스트하는 함수입니다.
+        """
+        self.user.username = "Greenwalker"
+        self.user.save()
+        url = reverse("campaign_view")
+        response = self.client.get(url, {"keyword": "greenwalker", "end": "N"})
+        self.assertEqual(len(response.data["results"]), 3)
+        response = self.client.get(url, {"keyword": "john", "end": "N"})
+        self.assertEqual(response.data["results"], [])
+
+    def test_rebuild_search_index(self):
+        """
+        색인을 지운 뒤 재생성 커맨드로 복구되는지 테스트하는 함수입니다.
+        """
+        CampaignSearchIndex.objects.all().delete()
+        out = StringIO()
+        call_command("rebuild_campaign_search_index", stdout=out)
+
+        self.assertIn("3개 캠페인 색인 완료", out.getvalue())
+        self.assertTrue(
+            CampaignSearchIndex.objects.filter(campaign=self.title_match, term="탄소").exists()
+        )
@@ -0,0 +1,141 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from taggit.models import Tag
+from users.models import User
+from campaigns.models import Campaign, CampaignTagStat, CampaignTagTrend
+from campaigns.signals import campaigns_transitioned
+from campaigns.tags import TREND_HALF_LIFE_DAYS, bump_tag_trends, trend_score
+
+
+class CampaignTagStatsTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 태그 통계 테이블과 /campaigns/tag/stats/ 테스트 클래스입니다.
+    최초 작성일 : 2023.07.08
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+
+    def create_campaign(self, tags, status=1, category=0):
+        now = timezone.now()
+        campaign = Campaign.objects.create(
+            title="캠페인",
+            content="내용",
+            user=self.user,
+            members=10,
+            campaign_start_date=now,
+            campaign_end_date=now + timedelta(days=1),
+            status=status,
+            category=category,
+        )
+        campaign.tags.add(*tags)
+        return campaign
+
+    def counts(self, **filters):
+        stats = CampaignTagStat.objects.filter(campaign_count__gt=0, **filters)
+        result = {}
+        for stat in stats.select_related("tag"):
+            result[stat.tag.name] = result.get(stat.tag.name, 0) + stat.campaign_count
+        return result
+
+    def test_incremental_stats(self):
+        """
+        태그 추가/삭제, 상태 변경, 일괄 상태 변경, 캠페인 삭제 시 통계가 맞춰지는지 테스트하는 함수입니다.
+        """
+        first = self.create_campaign(["환경", "봉사"])
+        second = self.create_campaign(["환경"], category=1)
+        self.assertEqual(self.counts(), {"환경": 2, "봉사": 1})
+        self.assertEqual(self.counts(category=1), {"환경": 1})
+
+        first.tags.remove("봉사")
+        self.assertEqual(self.counts(), {"환경": 2})
+
+        first.status = 2
+        first.save()
+        self.assertEqual(self.counts(status=2), {"환경": 1})
+
+        Campaign.objects.filter(id=second.id).update(status=3)
+        campaigns_transitioned.send(
+            sender=Campaign, campaign_ids=[second.id], from_status=1, to_status=3
+        )
+        self.assertEqual(self.counts(status=3), {"환경": 1})
+        self.assertEqual(self.counts(status=1), {})
+
+        second.tags.clear()
+        self.assertEqual(self.counts(), {"환경": 1})
+        first.delete()
+        self.assertEqual(self.counts(), {})
+
+    def test_stats_view(self):
+        """
+        통계 테이블만 읽어서 태그별 캠페인 수를 많은 순으로 반환하는지 테스트하는 함수입니다.
+        """
+        self.create_campaign(["환경", "봉사"])
+        self.create_campaign(["환경"], category=1)
+        self.create_campaign(["교육"], status=0)
+
+        url = reverse("tag_stats_view")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(row["name"], row["campaign_count"]) for row in response.data],
+            [("환경", 2), ("봉사", 1)],
+        )
+        self.assertFalse(any("taggit_taggeditem" in query["sql"] for query in queries))
+
+        response = self.client.get(url + "?category=1")
+        self.assertEqual([row["name"] for row in response.data], ["환경"])
+        response = self.client.get(url + "?status=0")
+        self.assertEqual([row["name"] for row in response.data], ["교육"])
+        response = self.client.get(url + "?limit=1")
+        self.assertEqual(len(response.data), 1)
+        response = self.client.get(url + "?status=abc")
+        self.assertEqual(response.status_code, 400)
+
+    def test_trending(self):
+        """
+        트렌드 점수가 반감기마다 절반으로 줄고, 최근에 많이 쓰인 태그가 먼저 나오는지 테스트하는 함수입니다.
+        """
+        now = timezone.now()
+        old = Tag.objects.create(name="예전")
+        new = Tag.objects.create(name="요즘")
+        half_life_ago = now - timedelta(days=TREND_HALF_LIFE_DAYS)
+        for _ in range(3):
+            bump_tag_trends([old.id], now=half_life_ago)
+        bump_tag_trends([new.id], now=now)
+        bump_tag_trends([new.id], now=now)
+
+        old_trend = CampaignTagTrend.objects.get(tag=old)
+        self.assertAlmostEqual(trend_score(old_trend.rank, half_life_ago), 3)
+        self.assertAlmostEqual(trend_score(old_trend.rank, now), 1.5)
+
+        # 예전: 3 -> 1.5로 줄어든 뒤 +1, 요즘: 2 + 1
+        self.create_campaign(["예전"])
+        self.create_campaign(["요즘"])
+        response = self.client.get(reverse("tag_stats_view") + "?order=trending")
+        self.assertEqual([row["name"] for row in response.data], ["요즘", "예전"])
+        self.assertAlmostEqual(response.data[0]["trend_score"], 3, places=2)
+        self.assertAlmostEqual(response.data[1]["trend_score"], 2.5, places=2)
+
+    def test_rebuild_command(self):
+        """
+        전체 재계산 커맨드가 시그널로 쌓은 통계와 같은 결과를 내는지 테스트하는 함수입니다.
+        """
+        self.create_campaign(["환경", "봉사"])
+        self.create_campaign(["환경"], status=2)
+        expected = self.counts()
+        CampaignTagStat.objects.all().delete()
+        CampaignTagTrend.objects.all().delete()
+
+        call_command("rebuild_campaign_tag_stats", stdout=StringIO())
+        self.assertEqual(self.counts(), expected)
+        self.assertEqual(CampaignTagTrend.objects.count(), 2)
@@ -0,0 +1,98 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from users.models import User
+from campaigns.likes import intent_key
+from campaigns.models import Campaign, Participant
+
+
+class CampaignViewerStateTest(APITestCase):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 목록 카드의 좋아요/참가 여부 일괄 조회 테스트 클래스입니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        now = timezone.now()
+        cls.campaigns = [
+            Campaign.objects.create(
+                title=f"캠페인{i}",
+                content="내용",
+                user=cls.user,
+                members=10,
+                campaign_start_date=now - timedelta(days=1),
+                campaign_end_date=now + timedelta(days=1),
+                status=1,
+            )
+            for i in range(3)
+        ]
+        first, second, _ = cls.campaigns
+        first.like.add(cls.user)
+        Participant.objects.create(user=cls.user, campaign=second)
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("campaign_viewer_state_view")
+        self.ids = [campaign.id for campaign in self.campaigns]
+
+    def test_viewer_state(self):
+        """
+        캠페인 id 목록의 좋아요/참가 여부를 쿼리 두 번으로 요청 순서대로 반환하는지 테스트하는 함수입니다.
+        """
+        self.client.force_authenticate(user=self.user)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {"ids": ",".join(map(str, reversed(self.ids)))})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data,
+            [
+                {"campaign_id": self.ids[2], "is_liked": False, "is_participated": False},
+                {"campaign_id": self.ids[1], "is_liked": False, "is_participated": True},
+                {"campaign_id": self.ids[0], "is_liked": True, "is_participated": False},
+            ],
+        )
+
+    def test_buffered_like(self):
+        """
+        아직 DB에 반영되지 않은 좋아요 버퍼 의도를 DB 값보다 먼저 읽는지 테스트하는 함수입니다.
+        """
+        cache.set(intent_key(self.ids[0], self.user.id), False)
+        cache.set(intent_key(self.ids[2], self.user.id), True)
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(self.url, {"ids": ",".join(map(str, self.ids))})
+        self.assertEqual([row["is_liked"] for row in response.data], [False, False, True])
+
+    def test_anonymous_and_invalid(self):
+        """
+        비로그인 유저는 조회 없이 모두 False이고, 잘못된 ids는 400인지 테스트하는 함수입니다.
+        """
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {"ids": str(self.ids[0])})
+        self.assertEqual(response.data[0]["is_liked"], False)
+
+        for ids in ("", "1,a", ",".join(["1"] * 101)):
+            self.assertEqual(self.client.get(self.url, {"ids": ids}).status_code, 400)
+
+    def test_embed_in_list(self):
+        """
+        로그인 유저가 viewer=Y로 목록을 조회하면 카드마다 좋아요/참가 여부가 포함되는지 테스트하는 함수입니다.
+        """
+        list_url = reverse("campaign_view")
+        response = self.client.get(list_url, {"viewer": "Y"})
+        self.assertNotIn("is_liked", response.data["results"][0])
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(list_url, {"viewer": "Y"})
+        states = {
+            row["id"]: (row["is_liked"], row["is_participated"]) for row in response.data["results"]
+        }
+        self.assertEqual(
+            states,
+            {self.ids[0]: (True, False), self.ids[1]: (False, True), self.ids[2]: (False, False)},
+        )
+        self.assertNotIn("is_liked", self.client.get(list_url).data["results"][0])
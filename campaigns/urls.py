@@ -4,9 +4,14 @@ from campaigns import views
 urlpatterns = [
     path('', views.CampaignView.as_view(), name='campaign_view'),
     path('tag/',views.TagFilterView.as_view(), name='tag_filter_view'),
+    path('tag/stats/', views.TagStatsView.as_view(), name='tag_stats_view'),
+    path('facets/', views.CampaignFacetView.as_view(), name='campaign_facet_view'),
+    path('state/', views.CampaignViewerStateView.as_view(), name='campaign_viewer_state_view'),
     path('create/', views.CampaignView.as_view(), name='campaign_view'),
     path('<int:campaign_id>/', views.CampaignDetailView.as_view(),
          name='campaign_detail_view'),
+    path('<int:campaign_id>/full/', views.CampaignDetailBundleView.as_view(),
+         name='campaign_detail_bundle_view'),
     path('<int:campaign_id>/like/', views.CampaignLikeView.as_view(),
          name='campaign_like_view'),
     path('<int:campaign_id>/participation/',
@@ -29,8 +34,18 @@ urlpatterns = [
          name='campaign_comment'),
     path('mypage/attend/', views.MyAttendCampaignView.as_view(),
          name='campaign_comment'),
+    path('mypage/dashboard/', views.MyPageDashboardView.as_view(),
+         name='mypage_dashboard'),
+    path('mypage/dashboard/<str:section>/', views.MyPageSectionView.as_view(),
+         name='mypage_section'),
+    path('status/bulk/',
+         views.CampaignBulkStatusUpdateAPIView.as_view(), name='bulk_status_view'),
     path('status/<int:campaign_id>/',
          views.CampaignStatusUpdateAPIView.as_view(), name='status_view'),
     path('admin/campaign_list/',
-         views.CampaiginApplyListView.as_view(), name='status_view')
+         views.CampaiginApplyListView.as_view(), name='status_view'),
+    path('admin/campaign_export/',
+         views.CampaignExportView.as_view(), name='campaign_export_view'),
+    path('admin/campaign_import/',
+         views.CampaignImportView.as_view(), name='campaign_import_view'),
 ]
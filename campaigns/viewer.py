@@ -0,0 +1,34 @@
+"""
+작성자 : 최준영
+내용 : 캠페인 목록 카드에 표시할 로그인 유저의 좋아요/참가 여부(viewer state) 모듈입니다.
+카드마다 CampaignLikeView.get, CampaignParticipationView.get을 부르는 대신
+캠페인 id 목록에 대해 좋아요 한 번, 참가 한 번의 인덱스 조회로 모두 구합니다.
+최초 작성일 : 2023.07.09
+"""
+from campaigns.likes import liked_campaign_ids
+from campaigns.models import Participant
+
+# 한 번에 조회할 수 있는 캠페인 수
+MAX_IDS = 100
+
+
+def get_viewer_states(campaign_ids, user):
+    """
+    {캠페인 id: {"is_liked", "is_participated"}}를 반환합니다. 비로그인 유저는 조회 없이 모두 False입니다.
+    """
+    campaign_ids = list(dict.fromkeys(campaign_ids))
+    liked, participated = set(), set()
+    if campaign_ids and user.is_authenticated:
+        liked = liked_campaign_ids(campaign_ids, user.id)
+        participated = set(
+            Participant.objects.filter(
+                user_id=user.id, campaign_id__in=campaign_ids
+            ).values_list("campaign_id", flat=True)
+        )
+    return {
+        campaign_id: {
+            "is_liked": campaign_id in liked,
+            "is_participated": campaign_id in participated,
+        }
+        for campaign_id in campaign_ids
+    }
@@ -1,13 +1,34 @@
+import io
+import time
+import logging
+import hashlib
 from rest_framework.views import APIView
 from rest_framework.generics import ListAPIView
 from rest_framework import status, permissions
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, Count, F
+from django.http import Http404, StreamingHttpResponse
+from django.conf import settings
+from django.utils.http import parse_etags, quote_etag
+from django.db import transaction, IntegrityError
+from django.db.models import F, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
-from campaigns.models import Campaign, CampaignComment, CampaignReview, Participant
+from campaigns.models import (
+    ArchivedCampaign,
+    Campaign,
+    CampaignComment,
+    CampaignNeighbor,
+    CampaignReview,
+    CampaignTagStat,
+    CampaignTagTrend,
+    Participant,
+)
 from campaigns.serializers import (
+    ArchivedCampaignCommentSerializer,
+    ArchivedCampaignReviewSerializer,
+    ArchivedCampaignSerializer,
     CampaignSerializer,
     CampaignListSerializer,
     CampaignCreateSerializer,
@@ -17,7 +38,32 @@ from campaigns.serializers import (
     CampaignCommentCreateSerializer,
     FundingCreateSerializer,
     MyCampaingSerializer,
+    RelatedCampaignSerializer,
+)
+from config.prefetch import plan_queryset
+from campaigns.facets import filter_campaigns, get_facets
+from campaigns.tags import trend_score
+from campaigns.likes import get_like_count, is_liked, toggle_like, toggle_like_direct
+from campaigns.pagination import KeysetPagination
+from campaigns.signals import campaigns_transitioned
+from campaigns.cache import (
+    get_or_build,
+    bump_list_generation,
+    bump_detail_generation,
+    campaign_list_cache_key,
+    campaign_facet_cache_key,
+    campaign_detail_cache_key,
+    mypage_cache_key,
 )
+from campaigns.archive import get_campaign_or_archived
+from campaigns.detail import PAGE_SIZE as THREAD_PAGE_SIZE, get_thread_page
+from campaigns.export import FORMATS, iter_rows, parse_filters
+from campaigns.imports import PARSERS, import_campaigns
+from campaigns.moderation import ALLOWED_TRANSITIONS, MAX_CAMPAIGNS, moderate_campaigns
+from campaigns.mypage import SECTIONS, get_dashboard, get_section
+from campaigns.viewer import MAX_IDS, get_viewer_states
+
+logger = logging.getLogger(__name__)
 
 
 class CampaignView(APIView):
@@ -25,63 +71,75 @@ class CampaignView(APIView):
     작성자 : 최준영
     내용 : 캠페인 View 클래스 입니다.
     최초 작성일 : 2023.06.06
-    업데이트 일자 : 2023.07.03
+    업데이트 일자 : 2023.07.09
     """
 
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
-    pagination_class = PageNumberPagination
+    pagination_class = KeysetPagination
 
     def get(self, request):
         """
         Query String에 대해 페이지네이션이 적용된 캠페인 목록을 Response하는 GET함수입니다.
+        keyword는 검색 색인(campaigns.search)으로 찾고, order가 없으면 관련도 순으로 정렬합니다.
+        cursor 기반 페이지네이션을 사용하며, 기존 클라이언트가 page를 보내면 PageNumberPagination을 사용합니다.
+        비로그인 요청은 Query String별로 캐시된 응답을 돌려줍니다.
+        로그인 요청에 viewer=Y를 주면 캠페인마다 is_liked, is_participated를 함께 내려줍니다.
         """
-        queryset = (
-            Campaign.objects.select_related("user")
-            .select_related("fundings")
-            .prefetch_related("participant")
+        if request.user.is_authenticated:
+            return Response(self.get_campaign_list(request), status=status.HTTP_200_OK)
+
+        data = get_or_build(
+            campaign_list_cache_key(request), lambda: self.get_campaign_list(request)
         )
+        return Response(data, status=status.HTTP_200_OK)
+
+    def get_campaign_list(self, request):
+        """
+        필터, 정렬, 페이지네이션을 적용한 캠페인 목록 데이터를 반환합니다.
+        """
+        queryset = Campaign.objects.select_related("user").select_related("fundings")
 
         end = self.request.query_params.get("end", None)
         order = self.request.query_params.get("order", None)
         keyword = self.request.query_params.get("keyword", None)
         category = self.request.query_params.get("category", None)
 
-        end_dict = {
-            "N": queryset.filter(
-                Q(status=1)
-                & Q(campaign_start_date__lte=timezone.now())
-                & Q(campaign_end_date__gte=timezone.now())
-            ),
-            "Y": queryset.filter(status__gte=2),
-        }
-        queryset = end_dict.get(end, queryset.filter(status__gte=1))
-
-        if keyword:
-            queryset = queryset.filter(
-                Q(title__icontains=keyword)
-                | Q(content__icontains=keyword)
-                | Q(tags__name__icontains=keyword)
-                | Q(user__username__icontains=keyword)
-            ).distinct()
+        queryset = filter_campaigns(queryset, end, keyword)
 
         if category:
             queryset = queryset.filter(category=category)
 
         order_dict = {
-            "recent": queryset.order_by("-created_at"),
-            "closing": queryset.order_by("campaign_end_date"),
-            "popular": queryset.annotate(
-                participant_count=Count("participant")
-            ).order_by("-participant_count"),
-            "like": queryset.annotate(like_count=Count("like")).order_by("-like_count"),
-            "amount": queryset.order_by("-fundings__amount"),
+            "recent": ("-created_at", "-id"),
+            "closing": ("campaign_end_date", "id"),
+            "popular": ("-hot_rank", "id"),
+            "like": ("-like_count", "id"),
+            "amount": ("-funding_amount", "id"),
         }
-        queryset = order_dict[order]
+        if keyword:
+            order_dict["relevance"] = ("-search_rank", "-created_at", "-id")
+            order = order or "relevance"
+        ordering = order_dict.get(order, order_dict["recent"])
+        if order == "amount":
+            queryset = queryset.annotate(
+                funding_amount=Coalesce("fundings__amount", Value(0))
+            )
 
-        pagination_instance = self.pagination_class()
-        paginated_data = pagination_instance.paginate_queryset(queryset, request)
-        serializer = CampaignListSerializer(paginated_data, many=True)
-        return pagination_instance.get_paginated_response(serializer.data)
+        if "page" in request.query_params:
+            pagination_instance = PageNumberPagination()
+            paginated_data = pagination_instance.paginate_queryset(
+                queryset.order_by(*ordering), request
+            )
+        else:
+            pagination_instance = self.pagination_class(ordering=ordering)
+            paginated_data = pagination_instance.paginate_queryset(queryset, request)
+        context = {}
+        if request.user.is_authenticated and request.query_params.get("viewer") == "Y":
+            context["viewer_states"] = get_viewer_states(
+                [campaign.id for campaign in paginated_data], request.user
+            )
+        serializer = CampaignListSerializer(paginated_data, many=True, context=context)
+        return pagination_instance.get_paginated_response(serializer.data).data
 
     def post(self, request):
         """
@@ -137,7 +195,90 @@ class TagFilterView(ListAPIView):
     def get_queryset(self):
         tag = self.request.query_params.get("name", None)
         queryset = Campaign.objects.filter(tags__name__in=[tag])
-        return queryset
+        return plan_queryset(queryset, self.serializer_class)
+
+
+class CampaignFacetView(APIView):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 목록 필터 옆에 보여줄 카테고리, 상태, 펀딩여부별 캠페인 수를 반환하는 View 입니다.
+    목록과 같은 end, keyword 필터를 적용하고, 목록 캐시와 같은 세대 키로 캐시합니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    def get(self, request):
+        end = request.query_params.get("end", None)
+        keyword = request.query_params.get("keyword", None)
+        data = get_or_build(
+            campaign_facet_cache_key(request), lambda: get_facets(end, keyword)
+        )
+        return Response(data, status=status.HTTP_200_OK)
+
+
+class TagStatsView(APIView):
+    """
+    작성자 : 최준영
+    내용 : 태그 클라우드용 태그별 캠페인 수와 트렌드 점수를 반환하는 View 입니다.
+    taggit_taggeditem을 집계하지 않고 미리 집계된 CampaignTagStat, CampaignTagTrend에서 읽습니다.
+    status, category로 거를 수 있고 order=trending이면 트렌드 점수 순으로 정렬합니다.
+    최초 작성일 : 2023.07.08
+    """
+
+    default_limit = 30
+    max_limit = 100
+
+    def get(self, request):
+        try:
+            status_param = request.query_params.get("status")
+            category = request.query_params.get("category")
+            limit = min(int(request.query_params.get("limit", self.default_limit)), self.max_limit)
+            filters = {"status": int(status_param)} if status_param else {"status__gte": 1}
+            if category:
+                filters["category"] = int(category)
+        except ValueError:
+            return Response(
+                {"message": "status, category, limit는 숫자만 입력할 수 있습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        stats = (
+            CampaignTagStat.objects.filter(**filters)
+            .values("tag_id", "tag__name")
+            .annotate(count=Sum("campaign_count"))
+            .filter(count__gt=0)
+        )
+        if request.query_params.get("order") == "trending":
+            trends = list(
+                CampaignTagTrend.objects.filter(tag_id__in=stats.values("tag_id"))
+                .order_by("-rank")
+                .values_list("tag_id", "rank")[:limit]
+            )
+            counts = {
+                row["tag_id"]: row
+                for row in stats.filter(tag_id__in=[tag_id for tag_id, _ in trends])
+            }
+            rows = [(counts[tag_id], rank) for tag_id, rank in trends if tag_id in counts]
+        else:
+            top = list(stats.order_by("-count", "tag__name")[:limit])
+            ranks = dict(
+                CampaignTagTrend.objects.filter(
+                    tag_id__in=[row["tag_id"] for row in top]
+                ).values_list("tag_id", "rank")
+            )
+            rows = [(row, ranks.get(row["tag_id"])) for row in top]
+
+        now = timezone.now()
+        return Response(
+            [
+                {
+                    "name": row["tag__name"],
+                    "campaign_count": row["count"],
+                    "trend_score": round(trend_score(rank, now), 3) if rank is not None else 0,
+                }
+                for row, rank in rows
+            ],
+            status=status.HTTP_200_OK,
+        )
 
 
 class CampaignDetailView(APIView):
@@ -146,7 +287,7 @@ class CampaignDetailView(APIView):
     내용 : 캠페인 디테일 View 입니다.
     개별 캠페인 GET과 그 캠페인에 대한 PUT, DELETE 요청을 처리합니다.
     최초 작성일 : 2023.06.06
-    업데이트 일자 : 2023.07.03
+    업데이트 일자 : 2023.07.09
     """
 
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
@@ -154,10 +295,58 @@ class CampaignDetailView(APIView):
     def get(self, request, campaign_id: int):
         """
         campaing_id를 Parameter로 받아 해당하는 캠페인에 GET 요청을 보내는 함수입니다.
+        직렬화한 응답과 ETag를 캐시해 두고, If-None-Match가 ETag와 같으면
+        직렬화 없이 304를 반환합니다.
         """
-        queryset = get_object_or_404(Campaign, id=campaign_id)
-        serializer = CampaignSerializer(queryset)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        cached = self.get_cached_detail(campaign_id)
+
+        if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+        if cached["etag"] in if_none_match or "*" in if_none_match:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(cached["data"], status=status.HTTP_200_OK)
+        response["ETag"] = cached["etag"]
+        return response
+
+    def get_cached_detail(self, campaign_id):
+        """
+        캐시된 {"etag", "data"}를 반환하고, 없으면 만들어 캐시합니다.
+        """
+        key, generation = campaign_detail_cache_key(campaign_id)
+        return get_or_build(
+            key,
+            lambda: self.get_campaign_detail(campaign_id, generation),
+            settings.CAMPAIGN_DETAIL_CACHE_TIMEOUT,
+        )
+
+    def get_campaign_detail(self, campaign_id, generation):
+        """
+        캠페인 상세 데이터와 updated_at, 캐시 세대로 만든 ETag를 반환합니다.
+        좋아요/참가 수는 updated_at을 바꾸지 않으므로 세대 번호로 구분합니다.
+        관련 캠페인은 미리 계산해 둔 CampaignNeighbor에서 인덱스 조회 한 번으로 가져옵니다.
+        보관된 캠페인은 보관 테이블에서 읽고 관련 캠페인은 비워 둡니다.
+        """
+        campaign = get_campaign_or_archived(campaign_id, "user", "fundings")
+        if campaign is None:
+            raise Http404
+        if isinstance(campaign, ArchivedCampaign):
+            data = ArchivedCampaignSerializer(campaign).data
+            data["related"] = []
+        else:
+            neighbors = (
+                CampaignNeighbor.objects.filter(campaign_id=campaign.id)
+                .select_related("neighbor")
+                .order_by("rank")
+            )
+            data = CampaignSerializer(campaign).data
+            data["related"] = RelatedCampaignSerializer(
+                [neighbor.neighbor for neighbor in neighbors], many=True
+            ).data
+        version = f"{campaign.id}:{campaign.updated_at.isoformat()}:{generation}"
+        return {
+            "etag": quote_etag(hashlib.md5(version.encode("utf-8")).hexdigest()),
+            "data": data,
+        }
 
     def put(self, request, campaign_id: int):
         """
@@ -242,24 +431,70 @@ class CampaignDetailView(APIView):
             )
 
 
+class CampaignDetailBundleView(APIView):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 상세 화면에 필요한 데이터를 요청 한 번으로 반환하는 View 입니다.
+    상세(CampaignDetailView와 같은 캐시), 후기/댓글 첫 페이지와 다음 페이지 주소(cursor),
+    로그인 유저의 좋아요/참가 여부를 묶어서, 상세/후기/댓글/좋아요/참가 GET 다섯 번을 대신합니다.
+    상세가 캐시되어 있으면 후기, 댓글, 좋아요, 참가 조회만 나갑니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    def get(self, request, campaign_id: int):
+        campaign = CampaignDetailView().get_cached_detail(campaign_id)["data"]
+        # 보관된 캠페인의 상세 데이터에만 archived_at이 있습니다.
+        archived = "archived_at" in campaign
+        threads = {}
+        for name, order in (("reviews", None), ("comments", request.query_params.get("order"))):
+            paginator, data = get_thread_page(
+                request, name, campaign_id, archived, order, first_page=True
+            )
+            threads[name] = {"next": paginator.get_next_link(), "results": data}
+
+        viewer_state = get_viewer_states([campaign_id], request.user)[campaign_id]
+        return Response(
+            {
+                "campaign": campaign,
+                **threads,
+                "viewer": {
+                    **viewer_state,
+                    "like_count": get_like_count(campaign_id, campaign["like_count"]),
+                },
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 class CampaignLikeView(APIView):
     """
     작성자 : 최준영
     내용 : 캠페인 좋아요 View 입니다.
     캠페인에 대한 좋아요 POST 요청을 처리합니다.
     최초 작성일 : 2023.06.09
-    업데이트 일자 : 2023.06.15
+    업데이트 일자 : 2023.07.08
     """
 
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     def get(self, request, campaign_id: int):
-        queryset = get_object_or_404(Campaign, id=campaign_id)
-        is_liked = queryset.like.filter(id=request.user.id).exists()
-        return Response({"is_liked": is_liked}, status=status.HTTP_200_OK)
+        queryset = get_object_or_404(Campaign.objects.only("id", "like_count"), id=campaign_id)
+        return Response(
+            {
+                "is_liked": is_liked(queryset.id, request.user.id),
+                "like_count": get_like_count(queryset.id, queryset.like_count),
+            },
+            status=status.HTTP_200_OK,
+        )
 
     def post(self, request, campaign_id: int):
-        queryset = get_object_or_404(Campaign, id=campaign_id)
+        """
+        CAMPAIGN_LIKE_BUFFER가 켜져 있으면 좋아요 의도를 캐시 버퍼에 기록하고 모아서 반영합니다.
+        같은 유저의 이전 토글이 아직 처리 중이면 409를 반환하므로 클라이언트가 다시 요청합니다.
+        """
+        queryset = get_object_or_404(
+            Campaign.objects.only("id", "status", "like_count"), id=campaign_id
+        )
 
         if queryset.status != 1:
             return Response(
@@ -267,17 +502,52 @@ class CampaignLikeView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        if queryset.like.filter(id=request.user.id).exists():
-            queryset.like.remove(request.user)
-            is_liked = False
-            message = "좋아요 취소!"
+        if settings.CAMPAIGN_LIKE_BUFFER:
+            liked = toggle_like(queryset.id, request.user.id)
+            if liked is None:
+                return Response(
+                    {"message": "이전 좋아요 요청을 처리하고 있습니다. 잠시 후 다시 시도해주세요."},
+                    status=status.HTTP_409_CONFLICT,
+                )
+            like_count = get_like_count(queryset.id, queryset.like_count)
         else:
-            queryset.like.add(request.user)
-            is_liked = True
-            message = "좋아요 성공!"
+            liked = toggle_like_direct(queryset.id, request.user.id)
+            like_count = queryset.like_count + (1 if liked else -1)
+        message = "좋아요 성공!" if liked else "좋아요 취소!"
+
+        return Response(
+            {"is_liked": liked, "like_count": like_count, "message": message},
+            status=status.HTTP_200_OK,
+        )
+
+
+class CampaignViewerStateView(APIView):
+    """
+    작성자 : 최준영
+    내용 : 캠페인 목록 카드의 좋아요/참가 표시를 한 번에 조회하는 View 입니다.
+    ?ids=1,2,3 으로 받아 요청 순서대로 캠페인별 is_liked, is_participated를 반환합니다.
+    최초 작성일 : 2023.07.09
+    """
 
+    def get(self, request):
+        try:
+            campaign_ids = [
+                int(campaign_id)
+                for campaign_id in request.query_params.get("ids", "").split(",")
+                if campaign_id.strip()
+            ]
+        except ValueError:
+            campaign_ids = None
+        if not campaign_ids or len(campaign_ids) > MAX_IDS:
+            return Response(
+                {"message": f"ids는 쉼표로 구분한 1~{MAX_IDS}개의 캠페인 id여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        states = get_viewer_states(campaign_ids, request.user)
         return Response(
-            {"is_liked": is_liked, "message": message}, status=status.HTTP_200_OK
+            [{"campaign_id": campaign_id, **state} for campaign_id, state in states.items()],
+            status=status.HTTP_200_OK,
         )
 
 
@@ -293,83 +563,147 @@ class CampaignParticipationView(APIView):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     def get(self, request, campaign_id: int):
-        queryset = get_object_or_404(Campaign, id=campaign_id)
-        is_participated = queryset.participant.filter(id=request.user.id).exists()
+        get_object_or_404(Campaign, id=campaign_id)
+        is_participated = Participant.objects.filter(
+            campaign_id=campaign_id, user_id=request.user.id
+        ).exists()
         return Response({"is_participated": is_participated}, status=status.HTTP_200_OK)
 
     def post(self, request, campaign_id: int):
+        """
+        참가 중이면 참가를 취소하고, 아니면 정원 안에서 참가시킵니다.
+        정원은 participant_count < members 조건의 UPDATE 한 번으로 좌석을 예약하므로
+        동시에 여러 명이 신청해도 정원을 넘지 않고, Participant 저장과 같은 트랜잭션에서 처리됩니다.
+        """
         queryset = get_object_or_404(Campaign, id=campaign_id)
         if queryset.status != 1:
             return Response(
                 {"message": "진행중인 캠페인에만 참가할 수 있습니다."}, status=status.HTTP_403_FORBIDDEN
             )
 
-        participant_count = queryset.participant.count()
-        members = queryset.members
-
-        if queryset.participant.filter(id=request.user.id).exists():
-            queryset.participant.remove(request.user)
+        with transaction.atomic():
+            # 좌석 예약(쓰기)을 먼저 해야 조회 후 쓰기로 잠금을 올리다 교착되는 일이 없습니다.
+            reserved = Campaign.objects.filter(
+                id=campaign_id, status=1, participant_count__lt=F("members")
+            ).update(
+                participant_count=F("participant_count") + 1,
+                hot_pending=F("hot_pending") + Campaign.HOT_WEIGHTS["participant_count"],
+            )
+            cancelled = 0
+            if reserved:
+                try:
+                    with transaction.atomic():
+                        Participant.objects.create(user=request.user, campaign_id=campaign_id)
+                except IntegrityError:
+                    # 이미 참가 중이면 참가를 취소하고 방금 예약한 좌석도 되돌립니다.
+                    cancelled = self.cancel(campaign_id, request.user.id, reserved)
+            else:
+                cancelled = self.cancel(campaign_id, request.user.id, reserved)
+                if not cancelled:
+                    return Response(
+                        {"message": "캠페인 참가 정원을 초과하여 신청할 수 없습니다."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+            bump_list_generation()
+            bump_detail_generation(campaign_id)
+
+        if cancelled:
             is_participated = False
             message = "캠페인 참가 취소!"
-            participant = Participant.objects.get(campaign=queryset, user=request.user)
-            participant.delete()
-
         else:
-            if participant_count + 1 > members:
-                return Response(
-                    {"message": "캠페인 참가 정원을 초과하여 신청할 수 없습니다."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-            else:
-                queryset.participant.add(request.user)
-                is_participated = True
-                message = "캠페인 참가 성공!"
-
-                participant = Participant.objects.create(
-                    user=request.user, campaign=queryset, is_participated=True
-                )
-                participant.save()
+            is_participated = True
+            message = "캠페인 참가 성공!"
 
         return Response(
             {"is_participated": is_participated, "message": message},
             status=status.HTTP_200_OK,
         )
 
+    def cancel(self, campaign_id, user_id, reserved):
+        """
+        참가 기록을 지우고, 지운 수와 예약했던 좌석 수만큼 participant_count를 줄입니다.
+        """
+        _, deleted = Participant.objects.filter(campaign_id=campaign_id, user_id=user_id).delete()
+        cancelled = deleted.get(Participant._meta.label, 0)
+        if cancelled or reserved:
+            Campaign.update_counts(campaign_id, participant_count=-(cancelled + reserved))
+        return cancelled
+
 
 class CampaignStatusChecker:
     """
     작성자 : 최준영
     내용 : scheduler를 통해 관리할 캠페인 함수 클래스입니다.
+    캠페인을 한 건씩 save()하지 않고 (status, campaign_end_date) 인덱스로 대상 id만 조회한 뒤
+    batch_size 단위의 UPDATE로 상태를 바꾸고, 바뀐 캠페인 id를 campaigns_transitioned 시그널로 한 번에 알립니다.
     최초 작성일 : 2023.06.08
-    업데이트 일자 : 2023.07.03
+    업데이트 일자 : 2023.07.07
     """
 
-    def check_campaign_status():
+    batch_size = 1000
+
+    def transition(self, name, queryset, from_status, to_status):
         """
-        status가 1인 캠페인 중 완료 날짜가 되거나 지난 캠페인의
-        status를 2로 바꿉니다.
+        queryset 중 status가 from_status인 캠페인을 to_status로 바꾸고 실행 리포트를 반환합니다.
+        조회와 UPDATE 사이에 상태가 바뀐 캠페인은 UPDATE 조건(status=from_status)에서 걸러집니다.
         """
+        started = time.perf_counter()
         now = timezone.now()
-        campaigns = Campaign.objects.filter(status=1)
+        campaign_ids = list(
+            queryset.filter(status=from_status).order_by().values_list("id", flat=True)
+        )
 
-        for campaign in campaigns:
-            if campaign.campaign_end_date <= now:
-                campaign.status = 2
-                campaign.save()
+        updated = 0
+        for start in range(0, len(campaign_ids), self.batch_size):
+            chunk = campaign_ids[start:start + self.batch_size]
+            with transaction.atomic():
+                updated += Campaign.objects.filter(id__in=chunk, status=from_status).update(
+                    status=to_status, updated_at=now
+                )
+
+        if campaign_ids:
+            campaigns_transitioned.send(
+                sender=Campaign,
+                campaign_ids=campaign_ids,
+                from_status=from_status,
+                to_status=to_status,
+            )
 
-    def check_funding_success():
+        report = {
+            "transition": name,
+            "from_status": from_status,
+            "to_status": to_status,
+            "candidates": len(campaign_ids),
+            "updated": updated,
+            "elapsed": round(time.perf_counter() - started, 3),
+        }
+        logger.info("campaign status transition: %s", report)
+        return report
+
+    def check_campaign_status(self):
+        """
+        status가 1인 캠페인 중 완료 날짜가 되거나 지난 캠페인의
+        status를 2로 바꿉니다.
+        """
+        return self.transition(
+            "check_campaign_status",
+            Campaign.objects.filter(campaign_end_date__lte=timezone.now()),
+            from_status=1,
+            to_status=2,
+        )
+
+    def check_funding_success(self):
         """
         종료된 캠페인의 펀딩 성공여부를 판단해 펀딩에 실패한 캠페인의
         status를 3으로 바꿉니다.
         """
-        campaigns = Campaign.objects.filter(
-            Q(status=2) & Q(fundings__amount__lt=F("fundings__goal"))
+        return self.transition(
+            "check_funding_success",
+            Campaign.objects.filter(fundings__amount__lt=F("fundings__goal")),
+            from_status=2,
+            to_status=3,
         )
 
-        for campaign in campaigns:
-            campaign.status = 3
-            campaign.save()
-
 
 class ReviewCommentPagination(PageNumberPagination):
     """
@@ -378,7 +712,7 @@ class ReviewCommentPagination(PageNumberPagination):
     작성일: 2023.06.25
     """
 
-    page_size = 5
+    page_size = THREAD_PAGE_SIZE
     page_size_query_param = "page_size"
 
 
@@ -388,7 +722,7 @@ class CampaignReviewView(APIView):
     내용 : 캠페인 후기 View 입니다.
     완료가 된 캠페인의 후기에 대한 GET, POST, PUT, DELETE 요청을 처리합니다.
     최초 작성일 : 2023.06.06
-    업데이트 일자 : 2023.07.04
+    업데이트 일자 : 2023.07.09
     """
 
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
@@ -397,13 +731,27 @@ class CampaignReviewView(APIView):
     def get(self, request, campaign_id: int):
         """
         캠페인 후기를 볼 수 있는 GET 요청 함수입니다.
+        보관된 캠페인이면 보관된 후기를 읽습니다.
+        cursor가 있으면 상세 묶음 응답의 next 주소로 보고 cursor 페이지네이션을 사용합니다.
         """
-        queryset = get_object_or_404(Campaign, id=campaign_id)
-        review = queryset.reviews.select_related("user").all().order_by("-created_at")
+        queryset = get_campaign_or_archived(campaign_id)
+        if queryset is None:
+            raise Http404
+        if "cursor" in request.query_params:
+            paginator, data = get_thread_page(
+                request, "reviews", campaign_id, isinstance(queryset, ArchivedCampaign)
+            )
+            return paginator.get_paginated_response(data)
+        serializer_class = CampaignReviewSerializer
+        if isinstance(queryset, ArchivedCampaign):
+            serializer_class = ArchivedCampaignReviewSerializer
+        review = plan_queryset(
+            queryset.reviews.all(), serializer_class
+        ).order_by("-created_at")
 
         pagination_instance = self.pagination_class()
         paginated_data = pagination_instance.paginate_queryset(review, request)
-        serializer = CampaignReviewSerializer(paginated_data, many=True)
+        serializer = serializer_class(paginated_data, many=True)
         return pagination_instance.get_paginated_response(serializer.data)
 
     def post(self, request, campaign_id: int):
@@ -414,7 +762,9 @@ class CampaignReviewView(APIView):
         if queryset.status == 2:
             serializer = CampaignReviewCreateSerializer(data=request.data)
             serializer.is_valid(raise_exception=True)
-            serializer.save(user=request.user, campaign_id=campaign_id)
+            with transaction.atomic():
+                serializer.save(user=request.user, campaign_id=campaign_id)
+                Campaign.update_counts(campaign_id, review_count=1)
             return Response(
                 {"message": "후기가 작성되었습니다.", "data": serializer.data},
                 status=status.HTTP_201_CREATED,
@@ -454,7 +804,9 @@ class CampaignReviewView(APIView):
         """
         queryset = get_object_or_404(CampaignReview, id=review_id)
         if request.user == queryset.user:
-            queryset.delete()
+            with transaction.atomic():
+                queryset.delete()
+                Campaign.update_counts(queryset.campaign_id, review_count=-1)
             return Response(
                 {"message": "후기가 삭제되었습니다."}, status=status.HTTP_204_NO_CONTENT
             )
@@ -470,7 +822,7 @@ class CampaignCommentView(APIView):
     내용 : 캠페인 댓글 View 입니다.
     캠페인의 댓글에 대한 GET, POST, PUT, DELETE 요청을 처리합니다.
     최초 작성일 : 2023.06.06
-    업데이트 일자 : 2023.07.04
+    업데이트 일자 : 2023.07.09
     """
 
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
@@ -479,9 +831,25 @@ class CampaignCommentView(APIView):
     def get(self, request, campaign_id: int):
         """
         캠페인 댓글을 볼 수 있는 GET 요청 함수입니다.
+        보관된 캠페인이면 보관된 댓글을 읽습니다.
+        cursor가 있으면 상세 묶음 응답의 next 주소로 보고 cursor 페이지네이션을 사용합니다.
         """
-        queryset = get_object_or_404(Campaign, id=campaign_id)
-        comment = queryset.comments.select_related("user").all()
+        queryset = get_campaign_or_archived(campaign_id)
+        if queryset is None:
+            raise Http404
+        if "cursor" in request.query_params:
+            paginator, data = get_thread_page(
+                request,
+                "comments",
+                campaign_id,
+                isinstance(queryset, ArchivedCampaign),
+                request.query_params.get("order"),
+            )
+            return paginator.get_paginated_response(data)
+        serializer_class = CampaignCommentSerializer
+        if isinstance(queryset, ArchivedCampaign):
+            serializer_class = ArchivedCampaignCommentSerializer
+        comment = plan_queryset(queryset.comments.all(), serializer_class)
 
         order = self.request.query_params.get("order", None)
         if order == "recent" or None:
@@ -491,7 +859,7 @@ class CampaignCommentView(APIView):
 
         pagination_instance = self.pagination_class()
         paginated_data = pagination_instance.paginate_queryset(comment, request)
-        serializer = CampaignCommentSerializer(paginated_data, many=True)
+        serializer = serializer_class(paginated_data, many=True)
         return pagination_instance.get_paginated_response(serializer.data)
 
     def post(self, request, campaign_id: int):
@@ -507,7 +875,9 @@ class CampaignCommentView(APIView):
 
         serializer = CampaignCommentCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save(user=request.user, campaign_id=campaign_id)
+        with transaction.atomic():
+            serializer.save(user=request.user, campaign_id=campaign_id)
+            Campaign.update_counts(campaign_id, comment_count=1)
         return Response(
             {"message": "댓글이 작성되었습니다.", "data": serializer.data},
             status=status.HTTP_201_CREATED,
@@ -542,7 +912,9 @@ class CampaignCommentView(APIView):
         """
         queryset = get_object_or_404(CampaignComment, id=comment_id)
         if request.user == queryset.user:
-            queryset.delete()
+            with transaction.atomic():
+                queryset.delete()
+                Campaign.update_counts(queryset.campaign_id, comment_count=-1)
             return Response(
                 {"message": "댓글이 삭제되었습니다."}, status=status.HTTP_204_NO_CONTENT
             )
@@ -577,7 +949,9 @@ class CampaignUserReviewView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        review = CampaignReview.objects.filter(user=request.user)
+        review = plan_queryset(
+            CampaignReview.objects.filter(user=request.user), CampaignReviewSerializer
+        )
         serializer = CampaignReviewSerializer(review, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -592,7 +966,7 @@ class CampaignUserLikeView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        review = Campaign.objects.filter(like=request.user)
+        review = plan_queryset(Campaign.objects.filter(like=request.user), CampaignSerializer)
         serializer = CampaignSerializer(review, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -607,8 +981,9 @@ class CampaignUserCommentView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        review = CampaignComment.objects.filter(
-            user=request.user).select_related("campaign")
+        review = plan_queryset(
+            CampaignComment.objects.filter(user=request.user), CampaignCommentSerializer
+        )
         serializer = CampaignCommentSerializer(review, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -629,6 +1004,42 @@ class MyAttendCampaignView(APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+class MyPageDashboardView(APIView):
+    """
+    작성자 : 최준영
+    내용 : 마이페이지 대시보드 View 입니다.
+    작성한/참가한/좋아요한 캠페인, 작성한 후기/댓글의 개수와 첫 페이지를 한 번에 반환합니다.
+    유저별로 캐시하고, 유저 본인의 작성/수정/삭제, 좋아요, 참가 시 시그널에서 캐시를 무효화합니다.
+    최초 작성일 : 2023.07.09
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        data = get_or_build(
+            mypage_cache_key(request),
+            lambda: get_dashboard(request),
+            settings.MYPAGE_CACHE_TIMEOUT,
+        )
+        return Response(data, status=status.HTTP_200_OK)
+
+
+class MyPageSectionView(APIView):
+    """
+    작성자 : 최준영
+    내용 : 마이페이지 대시보드 섹션별 더 보기 View 입니다.
+    대시보드 응답의 next 주소(cursor)로 다음 페이지를 가져옵니다.
+    최초 작성일 : 2023.07.09
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, section):
+        if section not in SECTIONS:
+            return Response(
+                {"message": "존재하지 않는 마이페이지 항목입니다."}, status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(get_section(request, section), status=status.HTTP_200_OK)
+
+
 class CampaignStatusUpdateAPIView(APIView):
     '''
     작성자: 장소은
@@ -644,6 +1055,45 @@ class CampaignStatusUpdateAPIView(APIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class CampaignBulkStatusUpdateAPIView(APIView):
+    """
+    작성자 : 최준영
+    내용 : 백오피스에서 여러 캠페인의 상태를 한 번에 변경(승인/반려)하는 View 입니다.
+    {"campaign_ids": [1, 2, 3], "status": 1} 형식으로 받아 허용된 변경만 적용하고
+    캠페인별 결과(updated, unchanged, invalid_transition, not_found)를 반환합니다.
+    최초 작성일 : 2023.07.09
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def put(self, request):
+        campaign_ids = request.data.get("campaign_ids")
+        to_status = request.data.get("status")
+        if (
+            not isinstance(campaign_ids, list)
+            or not campaign_ids
+            or len(campaign_ids) > MAX_CAMPAIGNS
+            # bool은 int의 하위 클래스라 true가 1번 캠페인이 되지 않도록 타입을 그대로 비교합니다.
+            or not all(type(campaign_id) is int for campaign_id in campaign_ids)
+        ):
+            return Response(
+                {"message": f"campaign_ids는 1~{MAX_CAMPAIGNS}개의 캠페인 id 목록이어야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if type(to_status) is not int or to_status not in ALLOWED_TRANSITIONS:
+            return Response(
+                {"message": "변경할 수 없는 상태입니다."}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        results = moderate_campaigns(campaign_ids, to_status)
+        return Response(
+            {
+                "updated": sum(result["result"] == "updated" for result in results),
+                "results": results,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 class CampaiginApplyListView(APIView):
     '''
     작성자: 장소은
@@ -658,9 +1108,82 @@ class CampaiginApplyListView(APIView):
     pagination_class = MyPagination
 
     def get(self, request):
-        campaigns = Campaign.objects.all()
+        campaigns = plan_queryset(Campaign.objects.all(), CampaignSerializer)
         paginator = self.pagination_class()
         result_page = paginator.paginate_queryset(campaigns, request)
         serializer = CampaignSerializer(result_page, many=True)
 
         return paginator.get_paginated_response(serializer.data)
+
+
+class CampaignExportView(APIView):
+    """
+    작성자 : 최준영
+    내용 : 백오피스 캠페인 신청내역 내보내기 View 입니다.
+    status, category, start, end(신청일), is_funding으로 거른 캠페인을
+    output=csv(기본) 또는 jsonl 파일로 스트리밍합니다.
+    캠페인 수와 상관없이 메모리에는 한 번에 읽는 묶음만 올라갑니다.
+    최초 작성일 : 2023.07.09
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        output = request.query_params.get("output", "csv")
+        if output not in FORMATS:
+            return Response(
+                {"message": "output은 csv, jsonl 중 하나만 입력할 수 있습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            filters = parse_filters(request.query_params)
+        except ValueError:
+            return Response(
+                {
+                    "message": "status, category는 숫자, start, end는 YYYY-MM-DD, "
+                    "is_funding은 true/false만 입력할 수 있습니다."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        stream, content_type = FORMATS[output]
+        response = StreamingHttpResponse(stream(iter_rows(filters)), content_type=content_type)
+        filename = f"campaigns_{timezone.localdate():%Y%m%d}.{output}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+class CampaignImportView(APIView):
+    """
+    작성자 : 최준영
+    내용 : 백오피스 캠페인 일괄 등록 View 입니다.
+    multipart로 받은 file(json, jsonl, csv)을 한 행씩 검증해 묶음 단위로 등록하고 행별 오류 보고서를 반환합니다.
+    user_email이 없는 행은 요청한 관리자를 작성자로 하고, dry_run=true면 검증만 합니다.
+    보고서의 errors는 앞의 max_errors건까지만 담고, failed에는 전체 오류 행 수를 담습니다.
+    최초 작성일 : 2023.07.09
+    """
+    permission_classes = [permissions.IsAdminUser]
+    max_errors = 1000
+
+    def post(self, request):
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response(
+                {"message": "등록할 파일(file)을 첨부해주세요."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        format = request.data.get("format") or upload.name.rsplit(".", 1)[-1].lower()
+        if format not in PARSERS:
+            return Response(
+                {"message": "format은 json, jsonl, csv 중 하나만 입력할 수 있습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+        report = import_campaigns(
+            stream,
+            format,
+            user=request.user,
+            dry_run=request.data.get("dry_run") == "true",
+        )
+        report["errors"] = report["errors"][: self.max_errors]
+        return Response(report, status=status.HTTP_200_OK)
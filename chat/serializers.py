@@ -9,10 +9,7 @@ class RoomSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 class MessageSerializer(serializers.ModelSerializer):
-    user_id = serializers.SerializerMethodField()
-
-    def get_user_id(self, obj):
-        return obj.user_id.email
+    user_id = serializers.CharField(source="user_id.email", read_only=True)
 
     class Meta:
         model = Message
@@ -7,6 +7,7 @@ from rest_framework.permissions import IsAuthenticated
 from collections import Counter
 from chat.serializers import RoomSerializer, MessageSerializer
 from django.db.models import Q
+from config.prefetch import plan_queryset
 
 
 class RoomView(APIView):
@@ -43,7 +44,9 @@ class GetRoomChatView(APIView):
         room_id = request.GET.get('room')
         if room_id:
             room = Room.objects.filter(id=room_id).first()
-            messages = Message.objects.filter(room_id=room).order_by('-created_at')[:30]
+            messages = plan_queryset(
+                Message.objects.filter(room_id=room), MessageSerializer
+            ).order_by('-created_at')[:30]
             serializer = MessageSerializer(messages, many=True)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         else:
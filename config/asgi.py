@@ -10,13 +10,15 @@ from channels.routing import ProtocolTypeRouter, URLRouter
 from chat.channelsmiddleware import TokenAuthMiddleware
 import chat.routing
 import alarms.routing
+import campaigns.routing
 
 application = ProtocolTypeRouter({
     'http': django_asgi_app,
     'websocket': TokenAuthMiddleware(
         URLRouter(
             chat.routing.websocket_urlpatterns +
-            alarms.routing.websocket_urlpatterns
+            alarms.routing.websocket_urlpatterns +
+            campaigns.routing.websocket_urlpatterns
         )
     ),
 })
@@ -0,0 +1,240 @@
+"""
+작성자 : 최준영
+내용 : 업로드 이미지 파생본(썸네일/WebP) 생성 모듈입니다.
+이미지 필드가 있는 모델을 register()로 등록하면 이미지가 바뀐 저장이 커밋된 뒤
+백그라운드 워커 풀에서 Pillow로 small(고정 크기 썸네일), large(긴 변 제한) WebP 파생본을 만들고
+모델의 image_variants에 {"source": 원본 경로, "small": 경로, "large": 경로}를 기록합니다.
+파일은 필드의 storage로 읽고 쓰므로 로컬 MEDIA_ROOT와 S3 MediaStorage에서 똑같이 동작합니다.
+최초 작성일 : 2023.07.09
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from io import BytesIO
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import Signal
+from PIL import Image, ImageOps, UnidentifiedImageError
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+VARIANTS_FIELD = "image_variants"
+# 파생본 이름: (크기, 크기에 맞춰 잘라낼지 여부)
+# small은 목록 카드용 고정 크기 썸네일, large는 상세 화면용으로 비율을 유지한 채 긴 변만 줄입니다.
+VARIANTS = {
+    "small": ((400, 400), True),
+    "large": ((1280, 1280), False),
+}
+VARIANT_PATH = "derivatives/{name}.{variant}.webp"
+WEBP_QUALITY = 80
+
+# 파생본을 기록한 뒤 보내는 시그널입니다. 캐시된 응답을 무효화할 때 사용합니다.
+# kwargs : pk, variants
+variants_generated = Signal()
+
+# 등록된 (모델, 이미지 필드 이름) 목록, 백필 커맨드가 사용합니다.
+registry = []
+executor = None
+
+
+def variant_path(name, variant):
+    """
+    원본 경로에서 파생본 경로를 만듭니다. 확장자까지 포함한 원본 경로가 유일하므로 파생본 경로도 유일합니다.
+    """
+    return VARIANT_PATH.format(name=name, variant=variant)
+
+
+def render_variant(image, size, crop):
+    """
+    열어 둔 이미지로 파생본 하나를 만들어 WebP 바이트로 반환합니다.
+    """
+    if crop:
+        resized = ImageOps.fit(image, size, Image.LANCZOS)
+    else:
+        resized = image.copy()
+        resized.thumbnail(size, Image.LANCZOS)
+    buffer = BytesIO()
+    resized.save(buffer, "WEBP", quality=WEBP_QUALITY, method=4)
+    return buffer.getvalue()
+
+
+def open_image(storage, name):
+    """
+    storage에서 원본 이미지를 열어 회전(EXIF)을 반영하고 WebP로 저장할 수 있는 모드로 바꿉니다.
+    JPEG은 draft로 필요한 크기에 가깝게 줄여서 디코딩합니다.
+    """
+    with storage.open(name, "rb") as file:
+        image = Image.open(file)
+        image.draft("RGB", max(size for size, _ in VARIANTS.values()))
+        image.load()
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ("RGB", "RGBA"):
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+    return image
+
+
+def save_variant(storage, path, content):
+    # storage.save는 같은 이름이 있으면 새 이름을 붙이므로, 다시 만들 때는 지우고 저장합니다.
+    if storage.exists(path):
+        storage.delete(path)
+    return storage.save(path, ContentFile(content))
+
+
+def delete_variants(storage, variants, keep=()):
+    for variant in VARIANTS:
+        path = variants.get(variant)
+        if path and path not in keep:
+            storage.delete(path)
+
+
+def generate_variants(model, pk, field_name, force=False):
+    """
+    pk 인스턴스의 이미지 파생본을 만들어 기록하고 기록한 image_variants를 반환합니다.
+    이미 지금 원본의 파생본이 기록되어 있으면 건너뛰고(force면 다시 만듦), 이미지를 읽을 수 없으면 None을 반환합니다.
+    기록은 원본 경로가 그대로인 경우에만 UPDATE로 하므로, 그 사이 이미지가 바뀌었거나 삭제됐으면 반영하지 않고
+    저장 시그널도 다시 보내지 않습니다.
+    """
+    instance = model._default_manager.filter(pk=pk).only(field_name, VARIANTS_FIELD).first()
+    if instance is None:
+        return None
+    file = getattr(instance, field_name)
+    current = getattr(instance, VARIANTS_FIELD) or {}
+    name = file.name or ""
+    if current.get("source", "") == name and not force:
+        return current
+
+    storage = file.storage
+    variants = {}
+    if name:
+        paths = {variant: variant_path(name, variant) for variant in VARIANTS}
+        # 저장 전 값으로 image_variants를 덮어쓴 경우라면 파일은 이미 있으므로 기록만 다시 합니다.
+        if not force and all(storage.exists(path) for path in paths.values()):
+            variants = {"source": name, **paths}
+        else:
+            try:
+                image = open_image(storage, name)
+            except (OSError, UnidentifiedImageError):
+                logger.warning("이미지 파생본 생성 실패: %s %s %s", model.__name__, pk, name)
+                return None
+            variants = {"source": name}
+            for variant, (size, crop) in VARIANTS.items():
+                variants[variant] = save_variant(
+                    storage, paths[variant], render_variant(image, size, crop)
+                )
+
+    unchanged = Q(**{field_name: name})
+    if not name:
+        unchanged |= Q(**{f"{field_name}__isnull": True})
+    updated = model._default_manager.filter(unchanged, pk=pk).update(**{VARIANTS_FIELD: variants})
+    if not updated:
+        delete_variants(storage, variants, keep=current.values())
+        return None
+    if current.get("source") != name:
+        delete_variants(storage, current, keep=variants.values())
+    variants_generated.send(sender=model, pk=pk, variants=variants)
+    return variants
+
+
+def run_in_worker(model, pk, field_name, force=False):
+    # 워커 스레드는 요청 사이클 밖이므로 DB 연결을 직접 정리합니다.
+    close_old_connections()
+    try:
+        return generate_variants(model, pk, field_name, force)
+    except Exception:
+        logger.exception("이미지 파생본 생성 오류: %s %s", model.__name__, pk)
+    finally:
+        close_old_connections()
+
+
+def get_executor():
+    global executor
+    if executor is None:
+        executor = ThreadPoolExecutor(
+            max_workers=settings.IMAGE_VARIANT_WORKERS, thread_name_prefix="image-variants"
+        )
+    return executor
+
+
+def submit(model, pk, field_name, force=False):
+    """
+    파생본 생성을 워커 풀에 넘깁니다. IMAGE_VARIANT_WORKERS가 0이면 바로 실행합니다(테스트용).
+    """
+    if not settings.IMAGE_VARIANT_WORKERS:
+        return generate_variants(model, pk, field_name, force)
+    return get_executor().submit(run_in_worker, model, pk, field_name, force)
+
+
+def schedule_variants(sender, instance, field_name, **kwargs):
+    file = getattr(instance, field_name)
+    variants = getattr(instance, VARIANTS_FIELD) or {}
+    if variants.get("source", "") == (file.name or ""):
+        return
+    transaction.on_commit(partial(submit, sender, instance.pk, field_name))
+
+
+def cleanup_variants(sender, instance, field_name, **kwargs):
+    variants = getattr(instance, VARIANTS_FIELD) or {}
+    if not variants.get("source"):
+        return
+    storage = getattr(instance, field_name).storage
+    transaction.on_commit(partial(delete_variants, storage, variants))
+
+
+def register(model, field_name="image"):
+    """
+    작성자 : 최준영
+    내용 : 모델의 이미지 필드를 파생본 생성 대상으로 등록합니다.
+    이미지가 바뀐 저장은 커밋 후 파생본을 만들고, 삭제되면 커밋 후 파생본 파일을 지웁니다.
+    모델에는 image_variants JSONField가 있어야 합니다.
+    최초 작성일 : 2023.07.09
+    """
+    uid = f"image_variants_{model._meta.label_lower}_{field_name}"
+    post_save.connect(
+        partial(schedule_variants, field_name=field_name),
+        sender=model, weak=False, dispatch_uid=uid,
+    )
+    post_delete.connect(
+        partial(cleanup_variants, field_name=field_name),
+        sender=model, weak=False, dispatch_uid=uid,
+    )
+    if (model, field_name) not in registry:
+        registry.append((model, field_name))
+
+
+def get_variant_url(file, variant):
+    """
+    이미지 필드 값(FieldFile)의 파생본 URL을 반환합니다.
+    아직 파생본이 없거나 다른 원본의 파생본이면 원본 URL을 반환합니다.
+    """
+    if not file:
+        return None
+    variants = getattr(file.instance, VARIANTS_FIELD, None) or {}
+    path = variants.get(variant) if variants.get("source") == file.name else None
+    return file.storage.url(path) if path else file.url
+
+
+class ImageVariantField(serializers.ImageField):
+    """
+    작성자 : 최준영
+    내용 : 원본 대신 파생본 URL을 내려주는 이미지 필드입니다.
+    목록 시리얼라이저는 "small", 상세 시리얼라이저는 "large"를 사용하고, 업로드는 ImageField와 같습니다.
+    최초 작성일 : 2023.07.09
+    """
+
+    def __init__(self, variant, **kwargs):
+        self.variant = variant
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        url = get_variant_url(value, self.variant)
+        if url is None:
+            return None
+        request = self.context.get("request", None)
+        if request is not None:
+            return request.build_absolute_uri(url)
+        return url
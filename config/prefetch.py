@@ -0,0 +1,112 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch, prefetch_related_objects
+from rest_framework import serializers
+
+
+def get_relation(model, attr):
+    '''
+    작성자 : 최준영
+    내용 : 모델에서 attr 이름의 관계 필드를 찾아 반환하고, 관계가 아니면 None을 반환합니다.
+          user_id 같은 attname은 조인 없이 읽을 수 있으므로 관계로 보지 않습니다.
+    작성일 : 2023.07.08
+    '''
+    try:
+        field = model._meta.get_field(attr)
+    except FieldDoesNotExist:
+        return None
+    if not field.is_relation:
+        return None
+    name = field.get_accessor_name() if field.auto_created and not field.concrete else field.name
+    return field if name == attr else None
+
+
+def needs_relation(field):
+    '''
+    작성자 : 최준영
+    내용 : pk만 읽는 관계 필드(PrimaryKeyRelatedField 등)는 FK 컬럼만으로 직렬화되므로 조인이 필요 없습니다.
+    작성일 : 2023.07.08
+    '''
+    if isinstance(field, serializers.RelatedField):
+        return not field.use_pk_only_optimization()
+    return True
+
+
+def plan_serializer(serializer, model, prefix=""):
+    '''
+    작성자 : 최준영
+    내용 : 시리얼라이저가 읽는 필드의 source를 따라가며
+          select_related 경로와 prefetch_related 대상(Prefetch) 목록을 만듭니다.
+          1:1, N:1 관계는 select_related로, 1:N, M:N 관계는 prefetch_related로 모으고
+          중첩 시리얼라이저는 관계 모델 기준으로 다시 계획합니다.
+    작성일 : 2023.07.08
+    '''
+    select_related, prefetches = [], []
+    for field in serializer.fields.values():
+        if field.write_only or not field.source_attrs:
+            continue
+        child = field.child if isinstance(field, serializers.ListSerializer) else field
+        if isinstance(field, serializers.ManyRelatedField):
+            child = field.child_relation
+
+        current, path = model, prefix
+        last = len(field.source_attrs) - 1
+        for index, attr in enumerate(field.source_attrs):
+            relation = get_relation(current, attr)
+            if relation is None:
+                break
+            path = f"{path}__{attr}" if path else attr
+            related_model = relation.related_model
+
+            if relation.many_to_many or relation.one_to_many:
+                if index == last and isinstance(child, serializers.BaseSerializer):
+                    queryset = plan_queryset(related_model._default_manager.all(), child)
+                    prefetches.append(Prefetch(path, queryset=queryset))
+                else:
+                    prefetches.append(path)
+                break
+
+            if index == last and not needs_relation(child):
+                break
+            select_related.append(path)
+            current = related_model
+
+            if index == last and isinstance(child, serializers.BaseSerializer):
+                nested_select, nested_prefetches = plan_serializer(child, current, path)
+                select_related += nested_select
+                prefetches += nested_prefetches
+
+    return list(dict.fromkeys(select_related)), prefetches
+
+
+def plan_queryset(queryset, serializer):
+    '''
+    작성자 : 최준영
+    내용 : 시리얼라이저(클래스 또는 인스턴스)에 맞춰 queryset에 select_related/prefetch_related를 적용합니다.
+          목록을 직렬화할 때 행마다 관계를 조회하는 N+1 쿼리를 없애 페이지 크기와 상관없이 쿼리 수가 일정해집니다.
+    작성일 : 2023.07.08
+    '''
+    if isinstance(serializer, type):
+        serializer = serializer()
+    select_related, prefetches = plan_serializer(serializer, queryset.model)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetches:
+        queryset = queryset.prefetch_related(*prefetches)
+    return queryset
+
+
+def plan_objects(instances, serializer):
+    '''
+    작성자 : 최준영
+    내용 : 이미 가져온 모델 객체 목록에 시리얼라이저가 읽는 관계를 한 번에 채웁니다.
+          queryset이 아닌 리스트를 직렬화하는 경우에 사용합니다.
+    작성일 : 2023.07.08
+    '''
+    instances = list(instances)
+    if not instances:
+        return instances
+    if isinstance(serializer, type):
+        serializer = serializer()
+    select_related, prefetches = plan_serializer(serializer, type(instances[0]))
+    prefetch_related_objects(instances, *select_related, *prefetches)
+    return instances
@@ -183,6 +183,43 @@ DATABASES = {
 
 DATABASES['default'] = DATABASES['dev' if DEBUG else 'production']
 
+# 캠페인 목록/상세 응답 캐시, 여러 워커가 같은 캐시를 보도록 운영에서는 redis를 사용
+CACHES = {
+    'dev': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        # 좋아요 버퍼 벤치마크처럼 키가 많이 생겨도 지워지지 않도록 기본값(300)보다 늘림
+        'OPTIONS': {'MAX_ENTRIES': 100000},
+    },
+    'production': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': f'redis://{CHANNEL_HOSTS}:{CHANNEL_PORT}/1',
+    },
+}
+
+CACHES = {'default': CACHES['dev' if DEBUG else 'production']}
+
+CAMPAIGN_LIST_CACHE_TIMEOUT = 60
+CAMPAIGN_DETAIL_CACHE_TIMEOUT = 300
+MYPAGE_CACHE_TIMEOUT = 300
+
+# 좋아요 토글을 캐시에 모아 반영, 워커끼리 캐시를 공유하는 운영 환경에서만 사용
+CAMPAIGN_LIKE_BUFFER = not DEBUG
+CAMPAIGN_LIKE_FLUSH_INTERVAL = 5
+CAMPAIGN_LIKE_FLUSH_BATCH = 500
+
+# 펀딩 진행률 웹소켓으로 캠페인별 클라이언트에 보내는 초당 최대 횟수
+FUNDING_PROGRESS_MAX_RATE = 2
+
+# 인기순 점수(hot_rank)에 쌓인 활동을 반영하는 주기(초)
+CAMPAIGN_HOT_REFRESH_INTERVAL = 300
+
+# 마감 후 이 일수가 지난 종료/실패 캠페인을 보관 테이블로 옮기고, 한 트랜잭션에 옮기는 캠페인 수
+CAMPAIGN_ARCHIVE_AFTER_DAYS = 180
+CAMPAIGN_ARCHIVE_CHUNK = 200
+
+# 업로드 이미지 파생본(썸네일/WebP)을 만드는 백그라운드 워커 수, 0이면 저장 커밋 직후 바로 만듭니다.
+IMAGE_VARIANT_WORKERS = 2
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 from campaigns.models import Campaign, Funding
+from campaigns.cache import bump_list_generation, bump_detail_generation
+from campaigns.progress import publish_funding_progress
 from .models import Payment, RegisterPayment
 from iamport import Iamport
 from config import settings
@@ -160,6 +162,10 @@ class PaymentScheduleSerializer(serializers.ModelSerializer):
             # 모든 작업이 성공한 경우에만 Payment 객체 생성 및 저장
             data = Payment.objects.create(user=user_id, amount=amount, campaign=campaign, merchant_uid=merchant_uid, status="0", customer_uid=customer_uid)
             Funding.objects.filter(campaign=campaign).update(amount=F('amount')+amount)
+            Campaign.add_hot_activity(campaign.id, int(amount) / Campaign.HOT_FUNDING_UNIT)
+            bump_list_generation()
+            bump_detail_generation(campaign.id)
+            transaction.on_commit(lambda: publish_funding_progress(campaign.id))
 
         return response
         
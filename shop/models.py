@@ -117,6 +117,7 @@ class ShopImageFile(models.Model):
     업데이트 일자:
     '''
     image_file = models.ImageField(null=True, blank=True)
+    image_variants = models.JSONField(default=dict, blank=True)
     product = models.ForeignKey(
         ShopProduct, on_delete=models.CASCADE, related_name='images')
 
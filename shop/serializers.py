@@ -2,14 +2,31 @@ from rest_framework import serializers
 from .models import ShopProduct, ShopCategory, ShopImageFile, ShopOrder, ShopOrderDetail, RestockNotification
 import re
 from django.db.models import Sum
+from config.images import ImageVariantField
 
 
 class PostImageSerializer(serializers.ModelSerializer):
+    '''
+    작성자 : 최준영
+    내용 : 상품 상세의 이미지 시리얼라이저, 이미지는 large 파생본
+    작성일 : 2023.07.09
+    '''
+    image_file = ImageVariantField('large', read_only=True)
+
     class Meta:
         model = ShopImageFile
         fields = ['id', 'product', 'image_file']
 
 
+class PostThumbnailSerializer(PostImageSerializer):
+    '''
+    작성자 : 최준영
+    내용 : 상품 목록의 이미지 시리얼라이저, 이미지는 small 파생본
+    작성일 : 2023.07.09
+    '''
+    image_file = ImageVariantField('small', read_only=True)
+
+
 class ProductListSerializer(serializers.ModelSerializer):
     '''
     작성자:장소은
@@ -17,7 +34,7 @@ class ProductListSerializer(serializers.ModelSerializer):
     작성일: 2023.06.07
     업데이트일: 2023.06.21
     '''
-    images = PostImageSerializer(many=True, read_only=True)
+    images = PostThumbnailSerializer(many=True, read_only=True)
     uploaded_images = serializers.ListField(child=serializers.ImageField(
         max_length=1000000, allow_empty_file=False, use_url=False), write_only=True
     )
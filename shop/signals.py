@@ -0,0 +1,4 @@
+from config import images
+from .models import ShopImageFile
+
+images.register(ShopImageFile, 'image_file')
@@ -6,7 +6,11 @@ from .models import (
     ShopCategory,
     ShopImageFile,
     RestockNotification,
+    ShopOrder,
+    ShopOrderDetail,
 )
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from datetime import timedelta
 from django.utils import timezone
 import random
@@ -327,3 +331,40 @@ class ProductRestockNotificatinonTest(APITestCase):
             response.data['message'],
             '이미 재입고 알림을 구독 하셨습니다.'
         )
+
+
+class OrderListQueryTest(APITestCase):
+    '''
+    작성자: 최준영
+    내용: 마이페이지 주문내역 조회 쿼리 수가 페이지 크기와 상관없이 일정한지 확인하는 testcode
+    작성일: 2023.07.08
+    '''
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("test@test.com", "John", "Qwerasdf1234!")
+        category = ShopCategory.objects.create(category_name="카테고리")
+        for i in range(10):
+            product = ShopProduct.objects.create(
+                product_name=f"상품{i}", product_price=1000, product_stock=10,
+                product_desc="설명", category=category)
+            order = ShopOrder.objects.create(
+                zip_code="12345", address="주소", address_detail="상세주소",
+                address_message="메세지", receiver_name="이름",
+                receiver_number="010-1234-5678", user=cls.user)
+            ShopOrderDetail.objects.create(order=order, product=product, product_count=1)
+            ShopOrderDetail.objects.create(order=order, product=product, product_count=2)
+
+    def count_queries(self, page_size):
+        self.client.force_authenticate(user=self.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("my_order_view") + f"?page_size={page_size}")
+        self.assertEqual(len(response.data["results"]), page_size)
+        self.assertEqual(response.data["results"][0]["order_info"][0]["product"], "상품9")
+        return len(queries)
+
+    def test_order_list_constant_queries(self):
+        '''
+        주문 상세와 상품을 주문마다 조회하지 않는지 테스트
+        '''
+        self.assertEqual(self.count_queries(2), self.count_queries(10))
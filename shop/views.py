@@ -18,6 +18,7 @@ from .serializers import (
     ProductDetailSerializer
 )
 from config.permissions import IsAdminUserOrReadonly
+from config.prefetch import plan_objects, plan_queryset
 from rest_framework.pagination import PageNumberPagination
 from django.db.models import Q
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly, IsAdminUser
@@ -309,7 +310,8 @@ class AdminOrderViewAPI(APIView):
     permission_classes = [IsAdminUser]
 
     def get(self, request):
-        orders = ShopOrder.objects.all().order_by('-order_date')
+        orders = plan_queryset(
+            ShopOrder.objects.all().order_by('-order_date'), OrderListSerializer)
         paginator = self.pagination_class()
         result_page = paginator.paginate_queryset(orders, request)
         serializer = OrderListSerializer(result_page, many=True)
@@ -327,8 +329,8 @@ class MypageOrderViewAPI(APIView):
     pagination_class = CustomOrderPagination
 
     def get(self, request):
-        orders = ShopOrder.objects.filter(
-            user=request.user.id).order_by('-order_date')
+        orders = plan_queryset(ShopOrder.objects.filter(
+            user=request.user.id).order_by('-order_date'), OrderListSerializer)
         paginator = self.pagination_class()
         result_page = paginator.paginate_queryset(orders, request)
         serializer = OrderListSerializer(result_page, many=True)
@@ -413,9 +415,10 @@ class SendRefundViewAPI(APIView):
     def get(self, request):
 
         order_details = ShopOrderDetail.objects.filter(
-            order_detail_status=6).order_by('-order__order_date')
+            order_detail_status=6).select_related('order').order_by('-order__order_date')
         orders = [order_detail.order for order_detail in order_details]
         paginator = self.pagination_class()
-        result_page = paginator.paginate_queryset(orders, request)
+        result_page = plan_objects(
+            paginator.paginate_queryset(orders, request), OrderListSerializer)
         serializer = OrderListSerializer(result_page, many=True)
         return paginator.get_paginated_response(serializer.data)
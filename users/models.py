@@ -125,6 +125,7 @@ class UserProfile(models.Model):
         blank=True,
         null=True
     )
+    image_variants = models.JSONField(default=dict, blank=True)
     address = models.CharField(max_length=255,  null=True)
     zip_code = models.CharField(max_length=10,  null=True)
     detail_address = models.CharField(max_length=255, null=True)
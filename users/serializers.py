@@ -4,6 +4,7 @@ from django.contrib.auth.hashers import check_password
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from rest_framework import serializers, exceptions
+from rest_framework.fields import get_attribute
 from django.core.mail import EmailMessage
 from django.utils.encoding import force_str
 from django.utils.encoding import smart_bytes
@@ -12,6 +13,7 @@ import threading
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 import hashlib
 import re
+from config.images import ImageVariantField, VARIANTS_FIELD
 
 
 class EmailThread(threading.Thread):
@@ -484,16 +486,18 @@ class UserProfileSerializer(serializers.ModelSerializer):
     '''
     작성자: 장소은
     내용: 유저 프로필 시리얼라이저 
+          +) 이미지는 large 파생본 (최준영)
     작성일: 2023.06.17
+    업데이트일: 2023.07.09
     '''
     user = UserSerializer(read_only=True)
+    image = ImageVariantField('large', required=False, allow_null=True)
 
     class Meta:
         model = UserProfile
         fields = ['user', 'image', 'address', 'zip_code',
                   'detail_address', 'delivery_message', 'receiver_number']
         extra_kwargs = {
-            'image': {'required': False},
             'address': {'required': False},
             'zip_code': {'required': False},
             'detail_address': {'required': False},
@@ -519,3 +523,70 @@ class UserProfileSerializer(serializers.ModelSerializer):
             setattr(instance, 'receiver_number', receiver_number)
         instance.save()
         return instance
+
+
+class ProfileImageResolver:
+    '''
+    작성자 : 최준영
+    내용 : 한 번의 직렬화(요청) 동안 작성자 프로필 이미지 URL을 모아서 조회하는 클래스
+          처음 조회할 때 목록에 있는 작성자 전체의 프로필을 쿼리 한 번으로 가져오고,
+          같은 이미지의 URL은 한 번만 만듭니다.
+          +) 파생본이 있으면 small 파생본 URL
+    작성일 : 2023.07.08
+    업데이트 일자 : 2023.07.09
+    '''
+
+    def __init__(self):
+        self.images = {}
+        self.urls = {}
+        self.storage = UserProfile._meta.get_field('image').storage
+
+    def load(self, user_ids):
+        missing = set(user_ids) - self.images.keys()
+        if not missing:
+            return
+        self.images.update(dict.fromkeys(missing))
+        for user_id, image, variants in UserProfile.objects.filter(
+                user_id__in=missing).values_list('user_id', 'image', VARIANTS_FIELD):
+            if image and variants and variants.get('source') == image:
+                image = variants['small']
+            self.images[user_id] = image
+
+    def get_url(self, user_id):
+        self.load([user_id])
+        image = self.images[user_id]
+        if not image:
+            return None
+        if image not in self.urls:
+            self.urls[image] = self.storage.url(image)
+        return self.urls[image]
+
+
+class ProfileImageField(serializers.Field):
+    '''
+    작성자 : 최준영
+    내용 : 작성자 프로필 이미지 URL 필드, source는 작성자 id(기본값 user_id)
+          serializer context에 ProfileImageResolver를 두고 같은 직렬화 안의 모든 필드가 공유합니다.
+    작성일 : 2023.07.08
+    '''
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('source', 'user_id')
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def get_resolver(self):
+        resolver = self.context.get('profile_image_resolver')
+        if resolver is None:
+            resolver = self.context['profile_image_resolver'] = ProfileImageResolver()
+            # 목록 직렬화라면 목록 전체의 작성자 id를 미리 모아 한 번에 조회합니다.
+            root = self.root
+            if isinstance(root, serializers.ListSerializer) and self.parent is root.child:
+                resolver.load(
+                    get_attribute(instance, self.source_attrs)
+                    for instance in root.instance
+                )
+        return resolver
+
+    def to_representation(self, user_id):
+        return self.get_resolver().get_url(user_id)
@@ -3,10 +3,13 @@ from channels.layers import get_channel_layer
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 import json
+from config import images
 from .models import User, UserProfile
 
 channel_layer = get_channel_layer()
 
+images.register(UserProfile)
+
 
 @receiver(post_save, sender=User)
 def create_profile(sender, instance, created, **kwargs):